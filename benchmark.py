@@ -0,0 +1,448 @@
+"""
+Benchmark script for EcoAgent
+Measures local (non-network) hot paths; no API key required. Comparisons that
+call the models (see NETWORK_BENCHMARKS) need NVIDIA_API_KEY and only run
+when named.
+
+Usage: python benchmark.py [name ...]
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from io import BytesIO
+from PIL import Image
+
+
+def _time_call(func, repeats: int) -> float:
+    """Return the best wall time of func() over repeats runs, in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _decoded_megabytes(image_bytes: bytes, fast_decode: bool) -> float:
+    """Size of the pixel buffer the decoder materializes before the final resize"""
+    from utils.helpers import _decode_downscaled
+
+    img = Image.open(BytesIO(image_bytes))
+    if fast_decode:
+        img = _decode_downscaled(img, 1024)
+    else:
+        img.load()
+    return img.size[0] * img.size[1] * len(img.getbands()) / (1024 * 1024)
+
+
+def bench_image_decode(paths=("live_image.jpg", "plastic.jpeg"), repeats: int = 5):
+    """Compare full decode + LANCZOS against the draft/reduce fast path"""
+    from utils.helpers import encode_image
+
+    print("=" * 60)
+    print("Image decode: full decode vs draft/reduce fast path")
+    print("=" * 60)
+
+    for path in paths:
+        with open(path, "rb") as f:
+            image_bytes = f.read()
+
+        size = Image.open(BytesIO(image_bytes)).size
+        print(f"\n{path} ({size[0]}x{size[1]}, {len(image_bytes) / 1024:.0f} KB)")
+
+        for label, fast in (("full decode", False), ("fast path", True)):
+            ms = _time_call(lambda: encode_image(image_bytes, fast_decode=fast), repeats)
+            mb = _decoded_megabytes(image_bytes, fast)
+            print(f"  {label:<12} {ms:8.1f} ms   decoded buffer {mb:7.1f} MB")
+
+    print()
+
+
+def _legacy_parse_json_from_text(text: str):
+    """parse_json_from_text as it was before the single-pass scanner (for comparison)"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    matches = re.findall(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
+    if matches:
+        try:
+            return json.loads(matches[0])
+        except json.JSONDecodeError:
+            pass
+
+    matches = re.findall(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text, re.DOTALL)
+    for match in matches:
+        try:
+            return json.loads(match)
+        except json.JSONDecodeError:
+            continue
+
+    return None
+
+
+def bench_json_extract(repeats: int = 20):
+    """Compare the regex cascade with the single-pass JSON scanner on typical model outputs"""
+    from utils.helpers import parse_json_from_text
+
+    severity = {
+        "severity": "high",
+        "severity_score": 4,
+        "reasoning": "Dumped plastic near a storm drain {will} wash into the river. " * 4,
+        "urgency_factors": ["drain", "rain forecast", "school nearby"]
+    }
+    nested = {"result": {"assessment": {"severity": "high", "factors": [{"name": "drain"}]}}}
+    prose = "The image shows a roadside with litter; {note} the drain is blocked. " * 60
+
+    # name -> (model output, object a correct parser returns)
+    cases = {
+        "bare JSON": (json.dumps(severity), severity),
+        "fenced + prose": (
+            f"Here is my assessment:\n```json\n{json.dumps(severity, indent=2)}\n```\nLet me know.",
+            severity
+        ),
+        "long prose first": (prose + json.dumps(severity), severity),
+        "3-level nesting": ("Result: " + json.dumps(nested), nested),
+        "trailing comma": (
+            "Answer: {'severity': 'low', 'severity_score': 2,}",
+            {"severity": "low", "severity_score": 2}
+        ),
+        "unclosed braces": ("{ {a} " * 200 + "no closing brace", None),
+        "apostrophe in braces": ("Note {it's fine}\n" + json.dumps({"severity": "low"}), {"severity": "low"}),
+        "possessive in braces": (
+            "The {user's} request. Result: " + json.dumps({"severity": "high"}),
+            {"severity": "high"}
+        ),
+    }
+
+    print("=" * 60)
+    print("JSON extraction: regex cascade vs single-pass scanner")
+    print("=" * 60)
+    print(f"\n  {'case':<22} {'legacy ms':>10} {'scanner ms':>11}   correct (legacy / scanner)")
+
+    for name, (text, expected) in cases.items():
+        legacy_ms = _time_call(lambda: _legacy_parse_json_from_text(text), repeats)
+        scanner_ms = _time_call(lambda: parse_json_from_text(text), repeats)
+        legacy_ok = _legacy_parse_json_from_text(text) == expected
+        scanner_ok = parse_json_from_text(text) == expected
+        print(f"  {name:<22} {legacy_ms:10.3f} {scanner_ms:11.3f}   {str(legacy_ok):>6} / {scanner_ok}")
+
+    print()
+
+
+def _legacy_parse_report_sections(report_text: str):
+    """_parse_report_sections as it was before the single-pass parser (for comparison)"""
+    sections = {
+        "executive_summary": "",
+        "detailed_findings": "",
+        "risk_assessment": "",
+        "recommended_actions": "",
+        "priority_level": ""
+    }
+    patterns = {
+        "executive_summary": r"(?:Executive Summary|Summary)[:\s]+(.*?)(?=\n\n|\*\*|#{1,2}\s|$)",
+        "detailed_findings": r"(?:Detailed Findings|Findings|Observations)[:\s]+(.*?)(?=\n\n\*\*|#{1,2}\s|$)",
+        "risk_assessment": r"(?:Risk Assessment|Risks?)[:\s]+(.*?)(?=\n\n\*\*|#{1,2}\s|$)",
+        "recommended_actions": r"(?:Recommended Actions?|Actions?|Recommendations?)[:\s]+(.*?)(?=\n\n\*\*|#{1,2}\s|$)",
+        "priority_level": r"(?:Priority Level|Priority)[:\s]+(.*?)(?=\n\n|\*\*|#{1,2}\s|$)"
+    }
+    for section_key, pattern in patterns.items():
+        match = re.search(pattern, report_text, re.DOTALL | re.IGNORECASE)
+        if match:
+            sections[section_key] = match.group(1).strip()
+    if not any(sections.values()):
+        sections["executive_summary"] = report_text
+    return sections
+
+
+def _synthetic_report(bullets: int) -> str:
+    """Markdown report in the shape the 49B model produces, with bullets lines per list section"""
+    findings = "\n".join(f"- Item {i}: plastic bottles and bags along the bank" for i in range(bullets))
+    actions = "\n".join(f"{i + 1}. Dispatch crew {i} to clear the drain outlet" for i in range(bullets))
+    return (
+        "# Environmental Incident Report\n\n"
+        "## 1. Executive Summary\n"
+        "A large accumulation of plastic waste is blocking a storm drain near the river.\n\n"
+        f"## 2. Detailed Findings\nObservations: torn bags near the outlet\n{findings}\n\n"
+        "## 3. Risk Assessment\n"
+        "Risk: flooding during rain.\nMicroplastic runoff into the river.\n\n"
+        f"## 4. Recommended Actions\n{actions}\n\n"
+        "## 5. Priority Level\nHIGH\n"
+    )
+
+
+def bench_report_sections(sizes=(10, 200, 2000), repeats: int = 10):
+    """Compare the five-regex section parser with the single-pass parser on long reports"""
+    from tools.report_generator import _parse_report_sections
+
+    print("=" * 60)
+    print("Report sections: five DOTALL regexes vs single-pass parser")
+    print("=" * 60)
+    print(f"\n  {'report size':>12} {'legacy ms':>10} {'parser ms':>10}   sections found (legacy / parser)")
+
+    for bullets in sizes:
+        report = _synthetic_report(bullets)
+        legacy_ms = _time_call(lambda: _legacy_parse_report_sections(report), repeats)
+        parser_ms = _time_call(lambda: _parse_report_sections(report), repeats)
+        legacy_found = sum(1 for value in _legacy_parse_report_sections(report).values() if value)
+        parser_found = sum(1 for value in _parse_report_sections(report).values() if value)
+        print(
+            f"  {len(report) / 1024:9.1f} KB {legacy_ms:10.3f} {parser_ms:10.3f}   "
+            f"{legacy_found:>8} / {parser_found}"
+        )
+
+    print()
+
+
+def _legacy_estimate_severity_rule_based(classification):
+    """estimate_severity_rule_based as it was before the precompiled rule table (for comparison)"""
+    from tools.severity_estimator import SEVERITY_LEVELS
+
+    waste_type = classification.get("waste_type", "").lower()
+    confidence = classification.get("confidence", "low").lower()
+    description = classification.get("description", "").lower()
+    severity_score = 3
+    critical_keywords = ["hazardous", "chemical", "toxic", "oil spill", "sewage", "battery", "medical"]
+    high_keywords = ["e-waste", "electronic", "metal", "large amount", "widespread", "river", "water body"]
+    low_keywords = ["minimal", "small", "single item", "paper", "cardboard"]
+    if any(keyword in waste_type for keyword in critical_keywords):
+        severity_score = 5
+    elif any(keyword in description for keyword in critical_keywords):
+        severity_score = 5
+    elif "hazardous" in waste_type or any(keyword in waste_type for keyword in high_keywords):
+        severity_score = 4
+    elif any(keyword in description for keyword in high_keywords):
+        severity_score = 4
+    elif any(keyword in waste_type for keyword in low_keywords):
+        severity_score = 2
+    elif any(keyword in description for keyword in low_keywords):
+        severity_score = 2
+    if confidence == "low":
+        severity_score = max(2, severity_score - 1)
+    severity_level = "medium"
+    if severity_score >= 5:
+        severity_level = "critical"
+    elif severity_score >= 4:
+        severity_level = "high"
+    elif severity_score == 2:
+        severity_level = "low"
+    elif severity_score == 1:
+        severity_level = "minimal"
+    severity_info = SEVERITY_LEVELS[severity_level]
+    return {
+        "severity": severity_level,
+        "severity_score": severity_score,
+        "description": severity_info["description"],
+        "response_time": severity_info["response_time"],
+        "method": "rule-based"
+    }
+
+
+def _synthetic_classifications(count: int, seed: int = 7) -> list:
+    """Random classifications drawn from realistic waste types, phrases and tags"""
+    import random
+    from tools.waste_classifier import WASTE_CATEGORIES
+
+    rng = random.Random(seed)
+    phrases = [
+        "scattered plastic bottles along the footpath",
+        "a small pile of cardboard boxes near a bin",
+        "dark liquid that looks like an oil spill on the road",
+        "broken electronic devices and cables",
+        "garden clippings and food scraps",
+        "rusted metal sheets leaning on a wall",
+        "a large amount of mixed litter spread widely",
+        "a single item of clothing on the grass",
+        "overflowing sewage from a manhole",
+        "discarded medical masks and gloves",
+        "foam packaging caught in the reeds by the river",
+        "construction rubble and broken tiles"
+    ]
+    tags = ["outdoor", "urban", "litter", "street", "park", "roadside", "residential"]
+    confidences = ["high", "medium", "low"]
+
+    return [
+        {
+            "waste_type": rng.choice(WASTE_CATEGORIES),
+            "confidence": rng.choice(confidences),
+            "description": " ".join(rng.sample(phrases, 2)),
+            "tags": rng.sample(tags, 3)
+        }
+        for _ in range(count)
+    ]
+
+
+def bench_severity_rules(count: int = 1_000_000):
+    """Compare the original keyword scans with the precompiled rule table on synthetic classifications"""
+    from tools.severity_estimator import estimate_severity_rule_based
+
+    print("=" * 60)
+    print(f"Rule-based severity: keyword scans vs rule table ({count:,} records)")
+    print("=" * 60)
+
+    records = _synthetic_classifications(count)
+
+    start = time.perf_counter()
+    legacy = [_legacy_estimate_severity_rule_based(record)["severity"] for record in records]
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = [estimate_severity_rule_based(record)["severity"] for record in records]
+    table_s = time.perf_counter() - start
+
+    agreement = sum(a == b for a, b in zip(legacy, table)) / count
+    print(f"\n  keyword scans   {legacy_s:7.2f} s   {count / legacy_s:10,.0f} records/s")
+    print(f"  rule table      {table_s:7.2f} s   {count / table_s:10,.0f} records/s")
+    print(f"  agreement       {agreement:.2%} (tags are neutral here; the engine also scans tags)")
+    print()
+
+
+def bench_severity_bulk(count: int = 1_000_000):
+    """Compare per-dict rule scoring with the columnar bulk scorer"""
+    from tools.severity_estimator import estimate_severity_bulk, estimate_severity_rule_based
+
+    print("=" * 60)
+    print(f"Bulk severity: per-dict vs columnar ({count:,} records)")
+    print("=" * 60)
+
+    records = _synthetic_classifications(count)
+    columns = {
+        name: [record[name] for record in records]
+        for name in ("waste_type", "description", "confidence", "tags")
+    }
+
+    start = time.perf_counter()
+    per_dict = [estimate_severity_rule_based(record)["severity_score"] for record in records]
+    per_dict_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = estimate_severity_bulk(**columns)["severity_score"]
+    bulk_s = time.perf_counter() - start
+
+    agreement = sum(a == b for a, b in zip(per_dict, bulk.tolist())) / count
+    print(f"\n  per-dict        {per_dict_s:7.2f} s   {count / per_dict_s:10,.0f} records/s")
+    print(f"  columnar        {bulk_s:7.2f} s   {count / bulk_s:10,.0f} records/s")
+    print(f"  agreement       {agreement:.2%}")
+    print()
+
+
+def bench_report_modes(count: int = 100_000):
+    """Share of reports that still need the 49B model, and the cost of the template report"""
+    from collections import Counter
+    from tools.report_generator import LLM_REPORT_LEVELS, render_template_report, report_uses_llm
+    from tools.severity_estimator import estimate_severity_rule_based
+
+    print("=" * 60)
+    print(f"Report modes: LLM levels {', '.join(sorted(LLM_REPORT_LEVELS))} ({count:,} records)")
+    print("=" * 60)
+
+    records = _synthetic_classifications(count)
+    severities = [estimate_severity_rule_based(record) for record in records]
+    levels = Counter(severity["severity"] for severity in severities)
+    llm_share = sum(report_uses_llm(severity) for severity in severities) / count
+
+    start = time.perf_counter()
+    for record, severity in zip(records, severities):
+        render_template_report(record, severity, "Riverside Park")
+    template_us = (time.perf_counter() - start) / count * 1e6
+
+    print()
+    for level, seen in levels.most_common():
+        route = "llm" if level in LLM_REPORT_LEVELS else "template"
+        print(f"  {level:<9} {seen / count:6.1%}   {route}")
+    print(f"\n  reports sent to the 49B model   {llm_share:.1%}")
+    print(f"  template report                 {template_us:.1f} us each")
+    print()
+
+
+def bench_fused_assessment(paths=("live_image.jpg", "plastic.jpeg"), location: str = "Riverside Park"):
+    """Compare the two-call path (VLM classification + LLM severity) with the fused single VLM call"""
+    from dotenv import load_dotenv
+    from utils.helpers import encode_image
+    from tools.waste_classifier import classify_waste
+    from tools.severity_estimator import SEVERITY_LEVELS, estimate_severity
+    from tools.fused_assessment import assess_waste
+
+    print("=" * 60)
+    print("Fused assessment: VLM + LLM severity vs single VLM call")
+    print("=" * 60)
+
+    load_dotenv()
+    if not os.getenv("NVIDIA_API_KEY"):
+        print("\n  skipped: NVIDIA_API_KEY is not set\n")
+        return
+
+    print(f"\n  {'image':<16} {'two-call s':>10} {'fused s':>8}   waste type   severity (two-call / fused)")
+    same_type = same_level = near_level = 0
+    two_call_total = fused_total = 0.0
+
+    for path in paths:
+        encoded = encode_image(path)
+
+        # Caches and the severity gate are bypassed so both paths really call the models
+        start = time.perf_counter()
+        classification = classify_waste(encoded["base64"], use_cache=False, mime_type=encoded["mime_type"])
+        severity = estimate_severity(classification, location, use_cache=False, use_gate=False)
+        two_call_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fused = assess_waste(encoded["base64"], location, use_cache=False, mime_type=encoded["mime_type"])
+        fused_s = time.perf_counter() - start
+
+        type_match = classification.get("waste_type") == fused["classification"].get("waste_type")
+        levels = (severity.get("severity"), fused["severity"].get("severity"))
+        distance = abs(
+            SEVERITY_LEVELS.get(levels[0], SEVERITY_LEVELS["medium"])["level"]
+            - SEVERITY_LEVELS.get(levels[1], SEVERITY_LEVELS["medium"])["level"]
+        )
+        same_type += type_match
+        same_level += levels[0] == levels[1]
+        near_level += distance <= 1
+        two_call_total += two_call_s
+        fused_total += fused_s
+
+        print(
+            f"  {os.path.basename(path):<16} {two_call_s:10.2f} {fused_s:8.2f}   "
+            f"{'same' if type_match else 'differs':<12} {levels[0]} / {levels[1]} ({fused['severity'].get('method')})"
+        )
+
+    count = len(paths)
+    print(f"\n  waste type agreement       {same_type / count:.0%}")
+    print(f"  severity level agreement   {same_level / count:.0%} ({near_level / count:.0%} within one level)")
+    print(f"  mean latency               {two_call_total / count:.2f} s two-call (2 round trips), "
+          f"{fused_total / count:.2f} s fused (1 round trip)")
+    print()
+
+
+BENCHMARKS = {
+    "image_decode": bench_image_decode,
+    "json_extract": bench_json_extract,
+    "report_sections": bench_report_sections,
+    "severity_rules": bench_severity_rules,
+    "severity_bulk": bench_severity_bulk,
+    "report_modes": bench_report_modes,
+}
+
+# Call the models; run only when named
+NETWORK_BENCHMARKS = {
+    "fused_assessment": bench_fused_assessment,
+}
+
+
+def main():
+    """Run the selected benchmarks (all by default)"""
+    available = {**BENCHMARKS, **NETWORK_BENCHMARKS}
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in available:
+            print(f"Unknown benchmark: {name} (available: {', '.join(available)})")
+            sys.exit(1)
+        available[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,16 +4,32 @@ Coordinates waste classification, severity estimation, and report generation
 """
 
 import os
-from typing import Dict, Any, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Callable, Optional, Iterable, Iterator, List, Tuple
 from dotenv import load_dotenv
 
 # Import tools
-from tools.waste_classifier import classify_waste
-from tools.severity_estimator import estimate_severity
-from tools.report_generator import generate_civic_report, format_report_for_display
+from tools.waste_classifier import classify_waste, classify_waste_async, is_reusable_classification
+from tools.fused_assessment import assess_waste, assess_waste_async
+from tools.severity_estimator import (
+    estimate_severity,
+    estimate_severity_async,
+    estimate_severity_rule_based
+)
+from tools.report_generator import (
+    generate_civic_report,
+    generate_civic_report_async,
+    generate_civic_report_stream,
+    report_uses_llm,
+    format_report_for_display
+)
 
 # Import utilities
-from utils.helpers import encode_image_to_base64
+from utils.helpers import encode_image
+from utils.image_hash import NearDuplicateIndex
+from utils.budget import LatencyBudget
+from utils.preprocessing import ImagePreprocessor
 
 
 class EcoAgent:
@@ -21,14 +37,53 @@ class EcoAgent:
     Main EcoAgent class that orchestrates the environmental reporting pipeline
     """
     
-    def __init__(self, verbose: bool = False):
+    def __init__(
+        self,
+        verbose: bool = False,
+        near_duplicate_distance: Optional[int] = 6,
+        near_duplicate_window: float = 600.0,
+        preprocess_workers: Optional[int] = 0,
+        speculative_report: bool = False,
+        latency_budget: Optional[float] = None,
+        fused_assessment: bool = False,
+        llm_report_levels: Optional[Iterable[str]] = None
+    ):
         """
         Initialize EcoAgent
         
         Args:
             verbose: Whether to print detailed status messages
+            near_duplicate_distance: Maximum perceptual-hash Hamming distance at
+                which a recent classification is reused (None disables the check)
+            near_duplicate_window: Seconds a classification stays reusable
+            preprocess_workers: Worker processes for image preprocessing in
+                async and batch analysis (0 encodes in-process, None uses the CPU count)
+            speculative_report: Whether to start report generation from the
+                rule-based severity while the LLM severity call runs, regenerating
+                only if the LLM disagrees on the severity level
+            latency_budget: Default end-to-end seconds per analysis (None for
+                no budget); stages that run short fall back to their cheaper path
+            fused_assessment: Whether to classify and assess severity in one VLM
+                call instead of a VLM call followed by an LLM severity call
+                (applies when LLM severity is requested)
+            llm_report_levels: Severity levels whose reports are written by the
+                LLM; the others get the template report (defaults to
+                LLM_REPORT_LEVELS, see enrich_report for on-demand LLM reports)
         """
         self.verbose = verbose
+        self.speculative_report = speculative_report
+        self.latency_budget = latency_budget
+        self.fused_assessment = fused_assessment
+        self.llm_report_levels = llm_report_levels
+        self.preprocessor = None
+        if preprocess_workers != 0:
+            self.preprocessor = ImagePreprocessor(max_workers=preprocess_workers)
+        self.near_duplicates = None
+        if near_duplicate_distance is not None:
+            self.near_duplicates = NearDuplicateIndex(
+                max_distance=near_duplicate_distance,
+                window=near_duplicate_window
+            )
         
         # Load environment variables
         load_dotenv()
@@ -45,7 +100,8 @@ class EcoAgent:
         image_path_or_bytes,
         location: str = "",
         additional_notes: str = "",
-        use_llm_severity: bool = True
+        use_llm_severity: bool = True,
+        latency_budget: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Analyze an environmental issue from an image
@@ -55,10 +111,45 @@ class EcoAgent:
             location: Location of the incident
             additional_notes: Additional notes from the reporter
             use_llm_severity: Whether to use LLM for severity estimation
+            latency_budget: End-to-end seconds for this analysis (defaults to the
+                agent's latency_budget); the budget is split across the stages and
+                severity/report degrade to rule-based/template output when short
             
         Returns:
             Dict containing full analysis and report
         """
+        compute_hash = self.near_duplicates is not None
+        return self._run_pipeline(
+            lambda: encode_image(image_path_or_bytes, compute_hash=compute_hash),
+            location=location,
+            additional_notes=additional_notes,
+            use_llm_severity=use_llm_severity,
+            latency_budget=latency_budget
+        )
+    
+    def _run_pipeline(
+        self,
+        encode: Callable[[], Dict[str, Any]],
+        location: str,
+        additional_notes: str,
+        use_llm_severity: bool,
+        latency_budget: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the four pipeline stages
+        
+        Args:
+            encode: Callable producing the encode_image result (called inside
+                the pipeline so encoding failures become error results)
+            location: Location of the incident
+            additional_notes: Additional notes from the reporter
+            use_llm_severity: Whether to use LLM for severity estimation
+            latency_budget: End-to-end seconds (defaults to the agent's latency_budget)
+            
+        Returns:
+            Dict containing full analysis and report
+        """
+        budget = self._start_budget(latency_budget)
         
         if self.verbose:
             print("\n" + "="*60)
@@ -75,8 +166,10 @@ class EcoAgent:
             if self.verbose:
                 print("\n[1/4] Encoding image...")
             
-            image_base64 = encode_image_to_base64(image_path_or_bytes)
-            results["steps"]["encoding"] = {"status": "success"}
+            budget.start("encoding")
+            encoded = encode()
+            results["steps"]["encoding"] = self._encoding_step(encoded)
+            budget.finish("encoding")
             
             if self.verbose:
                 print("✓ Image encoded successfully")
@@ -85,43 +178,155 @@ class EcoAgent:
             if self.verbose:
                 print("\n[2/4] Classifying waste using Nemotron VLM...")
             
-            classification = classify_waste(image_base64)
+            classification, assessed = self._classify(encoded, location, use_llm_severity, budget)
             results["steps"]["classification"] = classification
             
             if self.verbose:
                 print(f"✓ Waste classified as: {classification.get('waste_type')}")
                 print(f"  Confidence: {classification.get('confidence')}")
             
-            # Step 3: Estimate severity
+            if self.speculative_report and use_llm_severity and assessed is None:
+                # Steps 3 + 4: draft the report from rule-based severity while the LLM assesses
+                if self.verbose:
+                    print("\n[3-4/4] Estimating severity and drafting report in parallel...")
+                
+                severity, report, speculation = self._speculative_severity_and_report(
+                    classification, location, additional_notes, budget
+                )
+                results["steps"]["severity"] = severity
+                results["steps"]["report"] = report
+                results["steps"]["speculation"] = speculation
+                
+                if self.verbose:
+                    print(f"✓ Severity estimated as: {severity.get('severity').upper()}")
+                    print(f"  Speculative report {'kept' if speculation['hit'] else 'regenerated'}")
+            else:
+                # Step 3: Estimate severity
+                if self.verbose:
+                    print("\n[3/4] Estimating severity...")
+                
+                severity = self._budgeted_severity(
+                    classification, location, use_llm_severity, budget, assessed
+                )
+                results["steps"]["severity"] = severity
+                
+                if self.verbose:
+                    print(f"✓ Severity estimated as: {severity.get('severity').upper()}")
+                    print(f"  Score: {severity.get('severity_score')}/5")
+                    print(f"  Method: {severity.get('method')}")
+                    if severity.get("gate"):
+                        print(f"  Gate: {severity['gate']} (LLM skipped)")
+                
+                # Step 4: Generate report
+                if self.verbose:
+                    print("\n[4/4] Generating civic report using Nemotron LLM...")
+                
+                report = self._budgeted_report(classification, severity, location, additional_notes, budget)
+                results["steps"]["report"] = report
+            
             if self.verbose:
-                print("\n[3/4] Estimating severity...")
+                print(f"✓ Report generated: {report.get('report_id')}")
             
-            severity = estimate_severity(
-                classification=classification,
-                location=location,
-                use_llm=use_llm_severity
-            )
-            results["steps"]["severity"] = severity
+            # Mark as complete
+            results["status"] = "complete"
+            results["summary"] = {
+                "report_id": report.get("report_id"),
+                "waste_type": classification.get("waste_type"),
+                "severity": severity.get("severity"),
+                "location": location
+            }
+            self._attach_budget(results, budget)
             
             if self.verbose:
-                print(f"✓ Severity estimated as: {severity.get('severity').upper()}")
-                print(f"  Score: {severity.get('severity_score')}/5")
-                print(f"  Method: {severity.get('method')}")
+                print("\n" + "="*60)
+                print("Analysis Complete!")
+                print("="*60)
+            
+            return results
+            
+        except Exception as e:
+            results["status"] = "error"
+            results["error"] = str(e)
+            self._attach_budget(results, budget)
             
-            # Step 4: Generate report
             if self.verbose:
-                print("\n[4/4] Generating civic report using Nemotron LLM...")
+                print(f"\n✗ Error during analysis: {str(e)}")
             
-            report = generate_civic_report(
-                classification=classification,
-                severity=severity,
-                location=location,
-                additional_notes=additional_notes
+            return results
+    
+    async def analyze_image_async(
+        self,
+        image_path_or_bytes,
+        location: str = "",
+        additional_notes: str = "",
+        use_llm_severity: bool = True,
+        latency_budget: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of analyze_image
+        Network stages await the async NIM client, so many analyses can be
+        in flight on one event loop; image encoding runs in the preprocessing
+        pool if configured, otherwise in the default executor
+        
+        Args:
+            image_path_or_bytes: Path to image file or image bytes
+            location: Location of the incident
+            additional_notes: Additional notes from the reporter
+            use_llm_severity: Whether to use LLM for severity estimation
+            latency_budget: End-to-end seconds (see analyze_image)
+            
+        Returns:
+            Dict containing full analysis and report
+        """
+        budget = self._start_budget(latency_budget)
+        
+        results = {
+            "status": "in_progress",
+            "steps": {}
+        }
+        
+        try:
+            # Step 1: Encode image (CPU-bound, keep it off the event loop)
+            budget.start("encoding")
+            compute_hash = self.near_duplicates is not None
+            if self.preprocessor is not None:
+                encoded = await asyncio.wrap_future(
+                    self.preprocessor.submit(image_path_or_bytes, compute_hash=compute_hash)
+                )
+            else:
+                loop = asyncio.get_running_loop()
+                encoded = await loop.run_in_executor(
+                    None, encode_image, image_path_or_bytes, compute_hash
+                )
+            results["steps"]["encoding"] = self._encoding_step(encoded)
+            budget.finish("encoding")
+            
+            # Step 2: Classify waste
+            classification, assessed = await self._classify_async(
+                encoded, location, use_llm_severity, budget
             )
-            results["steps"]["report"] = report
+            results["steps"]["classification"] = classification
             
-            if self.verbose:
-                print(f"✓ Report generated: {report.get('report_id')}")
+            if self.speculative_report and use_llm_severity and assessed is None:
+                # Steps 3 + 4: draft the report from rule-based severity while the LLM assesses
+                severity, report, speculation = await self._speculative_severity_and_report_async(
+                    classification, location, additional_notes, budget
+                )
+                results["steps"]["severity"] = severity
+                results["steps"]["report"] = report
+                results["steps"]["speculation"] = speculation
+            else:
+                # Step 3: Estimate severity
+                severity = await self._budgeted_severity_async(
+                    classification, location, use_llm_severity, budget, assessed
+                )
+                results["steps"]["severity"] = severity
+                
+                # Step 4: Generate report
+                report = await self._budgeted_report_async(
+                    classification, severity, location, additional_notes, budget
+                )
+                results["steps"]["report"] = report
             
             # Mark as complete
             results["status"] = "complete"
@@ -131,23 +336,653 @@ class EcoAgent:
                 "severity": severity.get("severity"),
                 "location": location
             }
+            self._attach_budget(results, budget)
             
             if self.verbose:
-                print("\n" + "="*60)
-                print("Analysis Complete!")
-                print("="*60)
+                print(f"✓ Report generated: {report.get('report_id')}")
             
             return results
             
         except Exception as e:
             results["status"] = "error"
             results["error"] = str(e)
+            self._attach_budget(results, budget)
             
             if self.verbose:
                 print(f"\n✗ Error during analysis: {str(e)}")
             
             return results
     
+    def analyze_image_stream(
+        self,
+        image_path_or_bytes,
+        location: str = "",
+        additional_notes: str = "",
+        use_llm_severity: bool = True,
+        latency_budget: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming version of analyze_image
+        Emits each stage result as it finishes and the report as it is generated,
+        so callers can show the executive summary while the rest is still streaming.
+        Severity and report run sequentially here (speculative_report is ignored).
+        
+        Args:
+            image_path_or_bytes: Path to image file or image bytes
+            location: Location of the incident
+            additional_notes: Additional notes from the reporter
+            use_llm_severity: Whether to use LLM for severity estimation
+            latency_budget: End-to-end seconds (see analyze_image)
+            
+        Yields:
+            Event dicts:
+            - {"type": "step", "step": ..., "result": ...} for encoding,
+              classification and severity
+            - {"type": "delta", "text": ...} and {"type": "section", "name": ...,
+              "content": ...} while the report streams
+            - {"type": "complete", "results": ...} last, with the same results
+              dict analyze_image returns
+        """
+        budget = self._start_budget(latency_budget)
+        results = {
+            "status": "in_progress",
+            "steps": {}
+        }
+        
+        try:
+            budget.start("encoding")
+            encoded = encode_image(image_path_or_bytes, compute_hash=self.near_duplicates is not None)
+            results["steps"]["encoding"] = self._encoding_step(encoded)
+            budget.finish("encoding")
+            yield {"type": "step", "step": "encoding", "result": results["steps"]["encoding"]}
+            
+            classification, assessed = self._classify(encoded, location, use_llm_severity, budget)
+            results["steps"]["classification"] = classification
+            yield {"type": "step", "step": "classification", "result": classification}
+            
+            severity = self._budgeted_severity(classification, location, use_llm_severity, budget, assessed)
+            results["steps"]["severity"] = severity
+            yield {"type": "step", "step": "severity", "result": severity}
+            
+            report_deadline = budget.allot("report")
+            use_llm = report_uses_llm(severity, self.llm_report_levels)
+            degraded = use_llm and not budget.affords(report_deadline)
+            events = generate_civic_report_stream(
+                classification=classification,
+                severity=severity,
+                location=location,
+                additional_notes=additional_notes,
+                deadline=report_deadline,
+                use_llm=use_llm and not degraded
+            )
+            for event in events:
+                if event["type"] == "report":
+                    report = event["report"]
+                else:
+                    yield event
+            budget.finish("report", degraded=degraded)
+            results["steps"]["report"] = report
+            
+            results["status"] = "complete"
+            results["summary"] = {
+                "report_id": report.get("report_id"),
+                "waste_type": classification.get("waste_type"),
+                "severity": severity.get("severity"),
+                "location": location
+            }
+            self._attach_budget(results, budget)
+            
+        except Exception as e:
+            results["status"] = "error"
+            results["error"] = str(e)
+            self._attach_budget(results, budget)
+        
+        yield {"type": "complete", "results": results}
+    
+    def _speculative_severity_and_report(
+        self,
+        classification: Dict[str, Any],
+        location: str,
+        additional_notes: str,
+        budget: LatencyBudget
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Run LLM severity estimation while drafting the report from the
+        instant rule-based severity; the draft is kept when both agree
+        
+        Args:
+            classification: Waste classification result
+            location: Location of the incident
+            additional_notes: Additional notes from the reporter
+            budget: Latency budget for the remaining stages
+            
+        Returns:
+            (severity, report, speculation summary)
+        """
+        rule_severity = estimate_severity_rule_based(classification)
+        severity_deadline = budget.allot("severity")
+        if not budget.affords(severity_deadline):
+            # No time for the LLM: the rule-based severity is final, nothing to speculate on
+            budget.finish("severity", degraded=True)
+            report = self._budgeted_report(classification, rule_severity, location, additional_notes, budget)
+            return rule_severity, report, self._speculation_summary(rule_severity, rule_severity)
+        
+        if not report_uses_llm(rule_severity, self.llm_report_levels):
+            # The draft would be a template, which is instant anyway: nothing to overlap
+            severity = estimate_severity(
+                classification=classification,
+                location=location,
+                use_llm=True,
+                deadline=severity_deadline
+            )
+            budget.finish("severity")
+            report = self._budgeted_report(classification, severity, location, additional_notes, budget)
+            return severity, report, self._speculation_summary(rule_severity, severity)
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            # The draft runs alongside severity, so it may use everything that is left
+            budget.start("report")
+            draft_future = executor.submit(
+                generate_civic_report,
+                classification=classification,
+                severity=rule_severity,
+                location=location,
+                additional_notes=additional_notes,
+                deadline=budget.remaining()
+            )
+            severity = estimate_severity(
+                classification=classification,
+                location=location,
+                use_llm=True,
+                deadline=severity_deadline
+            )
+            budget.finish("severity")
+            
+            if severity.get("severity") == rule_severity.get("severity"):
+                report = self._adopt_speculative_report(draft_future.result(), severity)
+                budget.finish("report")
+            else:
+                # The draft is stale; don't wait for it
+                draft_future.cancel()
+                report = self._budgeted_report(classification, severity, location, additional_notes, budget)
+        finally:
+            executor.shutdown(wait=False)
+        
+        return severity, report, self._speculation_summary(rule_severity, severity)
+    
+    async def _speculative_severity_and_report_async(
+        self,
+        classification: Dict[str, Any],
+        location: str,
+        additional_notes: str,
+        budget: LatencyBudget
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Async version of _speculative_severity_and_report"""
+        rule_severity = estimate_severity_rule_based(classification)
+        severity_deadline = budget.allot("severity")
+        if not budget.affords(severity_deadline):
+            budget.finish("severity", degraded=True)
+            report = await self._budgeted_report_async(
+                classification, rule_severity, location, additional_notes, budget
+            )
+            return rule_severity, report, self._speculation_summary(rule_severity, rule_severity)
+        
+        if not report_uses_llm(rule_severity, self.llm_report_levels):
+            severity = await estimate_severity_async(
+                classification=classification,
+                location=location,
+                use_llm=True,
+                deadline=severity_deadline
+            )
+            budget.finish("severity")
+            report = await self._budgeted_report_async(
+                classification, severity, location, additional_notes, budget
+            )
+            return severity, report, self._speculation_summary(rule_severity, severity)
+        
+        budget.start("report")
+        draft_task = asyncio.ensure_future(generate_civic_report_async(
+            classification=classification,
+            severity=rule_severity,
+            location=location,
+            additional_notes=additional_notes,
+            deadline=budget.remaining()
+        ))
+        try:
+            severity = await estimate_severity_async(
+                classification=classification,
+                location=location,
+                use_llm=True,
+                deadline=severity_deadline
+            )
+        except BaseException:
+            draft_task.cancel()
+            raise
+        budget.finish("severity")
+        
+        if severity.get("severity") == rule_severity.get("severity"):
+            report = self._adopt_speculative_report(await draft_task, severity)
+            budget.finish("report")
+        else:
+            draft_task.cancel()
+            report = await self._budgeted_report_async(
+                classification, severity, location, additional_notes, budget
+            )
+        
+        return severity, report, self._speculation_summary(rule_severity, severity)
+    
+    def _start_budget(self, latency_budget: Optional[float]) -> LatencyBudget:
+        """Start the latency budget for one analysis"""
+        if latency_budget is None:
+            latency_budget = self.latency_budget
+        return LatencyBudget(latency_budget)
+    
+    def _attach_budget(self, results: Dict[str, Any], budget: LatencyBudget) -> None:
+        """Record budget usage in the results when a budget was set"""
+        if budget.total is not None:
+            results["latency_budget"] = budget.summary()
+    
+    def _classify(
+        self,
+        encoded: Dict[str, Any],
+        location: str,
+        use_llm_severity: bool,
+        budget: LatencyBudget
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Classify the image, reusing a near-duplicate's classification if possible
+        In fused mode the same VLM call also assesses severity
+        
+        Args:
+            encoded: Result of encode_image
+            location: Location of the incident
+            use_llm_severity: Whether model-based severity is wanted
+            budget: Latency budget for the remaining stages
+            
+        Returns:
+            (classification, severity from the fused call or None)
+        """
+        fused = self.fused_assessment and use_llm_severity
+        deadline = budget.allot("classification", absorb=("severity",) if fused else ())
+        assessed = None
+        
+        classification = self._find_near_duplicate(encoded)
+        if classification is None:
+            if fused:
+                assessment = assess_waste(
+                    encoded["base64"], location, mime_type=encoded["mime_type"], deadline=deadline
+                )
+                classification, assessed = assessment["classification"], assessment["severity"]
+            else:
+                classification = classify_waste(
+                    encoded["base64"], mime_type=encoded["mime_type"], deadline=deadline
+                )
+            self._remember_classification(encoded, classification)
+        
+        budget.finish("classification")
+        return classification, assessed
+    
+    async def _classify_async(
+        self,
+        encoded: Dict[str, Any],
+        location: str,
+        use_llm_severity: bool,
+        budget: LatencyBudget
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Async version of _classify"""
+        fused = self.fused_assessment and use_llm_severity
+        deadline = budget.allot("classification", absorb=("severity",) if fused else ())
+        assessed = None
+        
+        classification = self._find_near_duplicate(encoded)
+        if classification is None:
+            if fused:
+                assessment = await assess_waste_async(
+                    encoded["base64"], location, mime_type=encoded["mime_type"], deadline=deadline
+                )
+                classification, assessed = assessment["classification"], assessment["severity"]
+            else:
+                classification = await classify_waste_async(
+                    encoded["base64"], mime_type=encoded["mime_type"], deadline=deadline
+                )
+            self._remember_classification(encoded, classification)
+        
+        budget.finish("classification")
+        return classification, assessed
+    
+    def _budgeted_severity(
+        self,
+        classification: Dict[str, Any],
+        location: str,
+        use_llm: bool,
+        budget: LatencyBudget,
+        assessed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimate severity within the stage's share of the budget, using rules if it is too small
+        A severity already assessed by a fused classification call is used as is
+        """
+        if assessed is not None:
+            budget.start("severity")
+            budget.finish("severity")
+            return assessed
+        
+        deadline = budget.allot("severity")
+        degraded = use_llm and not budget.affords(deadline)
+        severity = estimate_severity(
+            classification=classification,
+            location=location,
+            use_llm=use_llm and not degraded,
+            deadline=deadline
+        )
+        budget.finish("severity", degraded=degraded)
+        return severity
+    
+    async def _budgeted_severity_async(
+        self,
+        classification: Dict[str, Any],
+        location: str,
+        use_llm: bool,
+        budget: LatencyBudget,
+        assessed: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Async version of _budgeted_severity"""
+        if assessed is not None:
+            budget.start("severity")
+            budget.finish("severity")
+            return assessed
+        
+        deadline = budget.allot("severity")
+        degraded = use_llm and not budget.affords(deadline)
+        severity = await estimate_severity_async(
+            classification=classification,
+            location=location,
+            use_llm=use_llm and not degraded,
+            deadline=deadline
+        )
+        budget.finish("severity", degraded=degraded)
+        return severity
+    
+    def _budgeted_report(
+        self,
+        classification: Dict[str, Any],
+        severity: Dict[str, Any],
+        location: str,
+        additional_notes: str,
+        budget: LatencyBudget
+    ) -> Dict[str, Any]:
+        """
+        Generate the report within the stage's share of the budget
+        Severity levels outside llm_report_levels, and budgets too small for
+        the LLM, get the template report
+        """
+        deadline = budget.allot("report")
+        use_llm = report_uses_llm(severity, self.llm_report_levels)
+        degraded = use_llm and not budget.affords(deadline)
+        report = generate_civic_report(
+            classification=classification,
+            severity=severity,
+            location=location,
+            additional_notes=additional_notes,
+            use_llm=use_llm and not degraded,
+            deadline=deadline
+        )
+        budget.finish("report", degraded=degraded)
+        return report
+    
+    async def _budgeted_report_async(
+        self,
+        classification: Dict[str, Any],
+        severity: Dict[str, Any],
+        location: str,
+        additional_notes: str,
+        budget: LatencyBudget
+    ) -> Dict[str, Any]:
+        """Async version of _budgeted_report"""
+        deadline = budget.allot("report")
+        use_llm = report_uses_llm(severity, self.llm_report_levels)
+        degraded = use_llm and not budget.affords(deadline)
+        report = await generate_civic_report_async(
+            classification=classification,
+            severity=severity,
+            location=location,
+            additional_notes=additional_notes,
+            use_llm=use_llm and not degraded,
+            deadline=deadline
+        )
+        budget.finish("report", degraded=degraded)
+        return report
+    
+    def _adopt_speculative_report(self, report: Dict[str, Any], severity: Dict[str, Any]) -> Dict[str, Any]:
+        """Align a report drafted from rule-based severity with the final severity"""
+        metadata = report.setdefault("metadata", {})
+        metadata["severity_score"] = severity.get("severity_score")
+        metadata["response_time"] = severity.get("response_time")
+        metadata["speculative"] = True
+        return report
+    
+    def _speculation_summary(self, rule_severity: Dict[str, Any], severity: Dict[str, Any]) -> Dict[str, Any]:
+        """Record whether the speculative draft was kept"""
+        return {
+            "rule_severity": rule_severity.get("severity"),
+            "final_severity": severity.get("severity"),
+            "hit": severity.get("severity") == rule_severity.get("severity")
+        }
+    
+    def _encoding_step(self, encoded: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the encoding step summary from an encode_image result"""
+        step = {
+            "status": "success",
+            "mime_type": encoded.get("mime_type"),
+            "source_format": encoded.get("source_format"),
+            "transcoded": encoded.get("transcoded"),
+            "width": encoded.get("width"),
+            "height": encoded.get("height"),
+            "quality": encoded.get("quality"),
+            "bytes": encoded.get("bytes"),
+            "payload_bytes": encoded.get("payload_bytes"),
+            "encode_attempts": encoded.get("encode_attempts"),
+            "metadata_stripped": encoded.get("metadata_stripped")
+        }
+        if encoded.get("dhash") is not None:
+            step["dhash"] = f"{encoded['dhash']:016x}"
+        return step
+    
+    def _find_near_duplicate(self, encoded: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Reuse the classification of a recent near-duplicate image, if any
+        
+        Args:
+            encoded: Result of encode_image (with dhash)
+            
+        Returns:
+            Copy of the prior classification annotated with a
+            "near_duplicate" entry, or None if no match
+        """
+        if self.near_duplicates is None or encoded.get("dhash") is None:
+            return None
+        
+        match = self.near_duplicates.find(encoded["dhash"])
+        if match is None:
+            return None
+        
+        classification = match["value"]
+        classification["near_duplicate"] = {
+            "distance": match["distance"],
+            "age_seconds": round(match["age_seconds"], 1)
+        }
+        
+        if self.verbose:
+            print(f"✓ Reusing classification of near-duplicate image (distance {match['distance']})")
+        
+        return classification
+    
+    def _remember_classification(self, encoded: Dict[str, Any], classification: Dict[str, Any]) -> None:
+        """Index a fresh classification so near-duplicates can reuse it"""
+        if self.near_duplicates is None or encoded.get("dhash") is None:
+            return
+        if not is_reusable_classification(classification):
+            return
+        self.near_duplicates.add(encoded["dhash"], classification)
+    
+    def iter_batch_results(
+        self,
+        items: Iterable[Any],
+        max_concurrency: int = 4,
+        use_llm_severity: bool = True,
+        preprocess_workers: Optional[int] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Analyze many images concurrently, yielding results as they complete
+        
+        Each item is either an image (path or bytes) or a dict with an
+        "image" key and optional "location" / "additional_notes" keys.
+        All images are queued for encoding on the preprocessing pool up front
+        while up to max_concurrency images move through the network stages,
+        so one image's classification overlaps with another's report generation.
+        
+        Args:
+            items: Images or item dicts to analyze
+            max_concurrency: Maximum number of images in the network stages
+            use_llm_severity: Whether to use LLM for severity estimation
+            preprocess_workers: Worker processes for encoding when the agent has
+                no preprocessing pool of its own (None uses the CPU count,
+                0 encodes in the network threads)
+            
+        Yields:
+            (index, results) tuples in completion order; a failed item
+            yields a results dict with status "error" and never aborts the batch
+        """
+        preprocessor = self.preprocessor
+        owned_preprocessor = None
+        if preprocessor is None and preprocess_workers != 0:
+            preprocessor = owned_preprocessor = ImagePreprocessor(max_workers=preprocess_workers)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+                futures = {}
+                for index, item in enumerate(items):
+                    future = executor.submit(
+                        self._run_pipeline,
+                        *self._prepare_batch_item(item, preprocessor),
+                        use_llm_severity,
+                        self.latency_budget
+                    )
+                    futures[future] = index
+                
+                for future in as_completed(futures):
+                    index = futures[future]
+                    results = future.result()
+                    results["batch_index"] = index
+                    yield index, results
+        finally:
+            if owned_preprocessor is not None:
+                owned_preprocessor.shutdown(wait=False)
+    
+    def analyze_batch(
+        self,
+        items: Iterable[Any],
+        max_concurrency: int = 4,
+        use_llm_severity: bool = True,
+        preprocess_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many images concurrently
+        
+        Args:
+            items: Images or item dicts to analyze (see iter_batch_results)
+            max_concurrency: Maximum number of images in the network stages
+            use_llm_severity: Whether to use LLM for severity estimation
+            preprocess_workers: Worker processes for encoding (see iter_batch_results)
+            
+        Returns:
+            List of results dicts in input order
+        """
+        ordered = sorted(
+            self.iter_batch_results(items, max_concurrency, use_llm_severity, preprocess_workers),
+            key=lambda pair: pair[0]
+        )
+        return [results for _, results in ordered]
+    
+    def _prepare_batch_item(
+        self,
+        item: Any,
+        preprocessor: Optional[ImagePreprocessor]
+    ) -> Tuple[Callable[[], Dict[str, Any]], str, str]:
+        """
+        Unpack a batch item and start its encoding
+        
+        Args:
+            item: Image (path or bytes) or item dict
+            preprocessor: Pool to encode on, or None to encode lazily in the pipeline
+            
+        Returns:
+            (encode callable, location, additional notes)
+        """
+        if isinstance(item, dict):
+            image = item.get("image")
+            location = item.get("location", "")
+            additional_notes = item.get("additional_notes", "")
+        else:
+            image, location, additional_notes = item, "", ""
+        
+        if image is None:
+            def encode():
+                raise ValueError("Invalid batch item: missing 'image'")
+            return encode, location, additional_notes
+        
+        compute_hash = self.near_duplicates is not None
+        if preprocessor is None:
+            return (
+                lambda: encode_image(image, compute_hash=compute_hash),
+                location,
+                additional_notes
+            )
+        
+        future = preprocessor.submit(image, compute_hash=compute_hash)
+        return future.result, location, additional_notes
+    
+    def close(self) -> None:
+        """Release the preprocessing pool, if any"""
+        if self.preprocessor is not None:
+            self.preprocessor.shutdown()
+            self.preprocessor = None
+    
+    def enrich_report(
+        self,
+        results: Dict[str, Any],
+        additional_notes: str = "",
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Rewrite a completed analysis' report with the LLM, on demand
+        Meant for template reports (severity levels outside llm_report_levels)
+        
+        Args:
+            results: Results dict from analyze_image (updated in place)
+            additional_notes: Additional notes from the reporter
+            deadline: Seconds the LLM call may take, retries included
+            
+        Returns:
+            The updated results dict
+        """
+        if results.get("status") != "complete":
+            return results
+        
+        steps = results["steps"]
+        report = generate_civic_report(
+            classification=steps["classification"],
+            severity=steps["severity"],
+            location=results["summary"].get("location", ""),
+            additional_notes=additional_notes,
+            use_llm=True,
+            deadline=deadline
+        )
+        steps["report"] = report
+        results["summary"]["report_id"] = report.get("report_id")
+        return results
+    
     def get_formatted_report(self, results: Dict[str, Any]) -> Optional[str]:
         """
         Get formatted report from analysis results
@@ -175,19 +1010,48 @@ def run_ecoagent_cli():
     """
     import sys
     
-    if len(sys.argv) < 2:
-        print("Usage: python eco_agent.py <image_path> [location]")
+    flags = {arg for arg in sys.argv[1:] if arg in ("--stream", "--fused")}
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+    stream = "--stream" in flags
+    fused = "--fused" in flags
+    
+    if len(args) < 1:
+        print("Usage: python eco_agent.py [--stream] [--fused] <image_path> [location]")
         sys.exit(1)
     
-    image_path = sys.argv[1]
-    location = sys.argv[2] if len(sys.argv) > 2 else "Unknown location"
+    image_path = args[0]
+    location = args[1] if len(args) > 1 else "Unknown location"
     
     print("="*60)
     print("EcoAgent - Environmental Reporting System")
     print("="*60)
     
+    if stream:
+        # Print the report text as it is generated
+        agent = EcoAgent(fused_assessment=fused)
+        results = {}
+        streamed = False
+        for event in agent.analyze_image_stream(image_path_or_bytes=image_path, location=location):
+            if event["type"] == "step":
+                print(f"✓ {event['step'].capitalize()} done")
+                if event["step"] == "severity":
+                    print("\nGenerating civic report...\n")
+            elif event["type"] == "delta":
+                streamed = True
+                print(event["text"], end="", flush=True)
+            elif event["type"] == "complete":
+                results = event["results"]
+        print()
+        
+        if results.get("status") != "complete":
+            print(f"\n✗ Analysis failed: {results.get('error', 'Unknown error')}")
+        elif not streamed:
+            # The model was unavailable; show the template report instead
+            print(agent.get_formatted_report(results))
+        return
+    
     # Initialize agent
-    agent = EcoAgent(verbose=True)
+    agent = EcoAgent(verbose=True, fused_assessment=fused)
     
     # Analyze image
     results = agent.analyze_image(
@@ -109,6 +109,254 @@ def test_severity_levels():
     print()
 
 
+def test_bulk_severity_matches_rule_based(trials: int = 200, batch_size: int = 50, seed: int = 0):
+    """Property test: bulk scoring agrees with the per-dict rule engine on random classifications"""
+    import random
+    from tools.severity_estimator import (
+        SEVERITY_RULES,
+        estimate_severity_bulk,
+        estimate_severity_rule_based
+    )
+    from tools.waste_classifier import WASTE_CATEGORIES
+    
+    rng = random.Random(seed)
+    keywords = [keyword for words in SEVERITY_RULES.values() for keyword in words]
+    filler = ["pile", "near", "the", "road", "bottles", "Straße", "ÇÖP", "déchets", "", "  "]
+    
+    def text():
+        words = rng.choices(filler + keywords, k=rng.randint(0, 8))
+        # Random casing and glued words exercise the substring semantics
+        joined = rng.choice([" ", "", "-", "\n"]).join(words)
+        return rng.choice([joined, joined.upper(), joined.title()])
+    
+    def maybe(value):
+        return rng.choice([value, value, value, None])
+    
+    for _ in range(trials):
+        batch = [
+            {
+                "waste_type": maybe(rng.choice(WASTE_CATEGORIES + keywords + ["", "Unknown"])),
+                "description": maybe(text()),
+                "confidence": maybe(rng.choice(["high", "medium", "low", "LOW", "Low", ""])),
+                "tags": maybe([text() for _ in range(rng.randint(0, 3))])
+            }
+            for _ in range(rng.randint(0, batch_size))
+        ]
+        
+        bulk = estimate_severity_bulk(
+            [item["waste_type"] for item in batch],
+            [item["description"] for item in batch],
+            [item["confidence"] for item in batch],
+            [item["tags"] for item in batch]
+        )
+        
+        for index, item in enumerate(batch):
+            expected = estimate_severity_rule_based(item)
+            assert bulk["severity_score"][index] == expected["severity_score"], item
+            assert bulk["severity"][index] == expected["severity"], item
+    
+    print(f"✅ Bulk severity matches rule-based scoring ({trials} random batches)")
+    print()
+
+
+def test_report_sections_keep_body_titles():
+    """Lines that start with a title word ("Risk: ...") stay in the section they belong to"""
+    from tools.report_generator import _parse_report_sections
+    
+    report = (
+        "## Detailed Findings\nObservations: torn bags\n- Near drain\n\n"
+        "## Risk Assessment\nRisk: leaching into soil\nAlso attracts pests.\n\n"
+        "## Priority Level\nPriority: HIGH"
+    )
+    sections = _parse_report_sections(report)
+    
+    assert sections["detailed_findings"] == "Observations: torn bags\n- Near drain", sections
+    assert sections["risk_assessment"] == "Risk: leaching into soil\nAlso attracts pests.", sections
+    assert "HIGH" in sections["priority_level"], sections
+    
+    # Titles must be whole words, and numbering may sit inside the bold
+    report = (
+        "**1. Executive Summary**\nOverflowing bin.\n\n"
+        "**2. Recommended Actions**\n**Actionable steps for crews**\n- Empty the bin\n\n"
+        "**3. Priority Level**\nMEDIUM"
+    )
+    sections = _parse_report_sections(report)
+    
+    assert sections["executive_summary"] == "Overflowing bin.", sections
+    assert sections["recommended_actions"] == "**Actionable steps for crews**\n- Empty the bin", sections
+    assert sections["priority_level"] == "MEDIUM", sections
+    
+    print("✅ Report sections keep body lines that start with a title word")
+    print()
+
+
+def test_json_extract_skips_apostrophes_in_prose():
+    """Apostrophes in braced prose must not hide the JSON that follows, in one pass or streamed"""
+    import json
+    from utils.json_extract import JSONObjectScanner, extract_json_object
+    
+    cases = [
+        ("Note {it's fine}\n" + json.dumps({"severity": "low"}), {"severity": "low"}),
+        ("The {user's} request. Result: " + json.dumps({"severity": "high"}), {"severity": "high"}),
+        ('{"note": "it\'s {not} a brace", "severity": "medium"}', {"note": "it's {not} a brace", "severity": "medium"})
+    ]
+    
+    for text, expected in cases:
+        assert extract_json_object(text) == expected, text
+        for size in (1, 3, 7):
+            scanner = JSONObjectScanner()
+            result = None
+            for i in range(0, len(text), size):
+                result = scanner.feed(text[i:i + size])
+                if result is not None:
+                    break
+            assert result == expected, (text, size)
+    
+    print("✅ JSON extraction skips apostrophes in braced prose")
+    print()
+
+
+def test_encode_image_fits_budget_at_low_quality():
+    """A preferred quality at or below MIN_JPEG_QUALITY still re-encodes until the payload fits"""
+    import base64
+    from io import BytesIO
+    from PIL import Image
+    from utils.helpers import MIN_JPEG_QUALITY, encode_image
+    
+    # Noise barely compresses, so quality 30 at full size is far over budget
+    buffer = BytesIO()
+    Image.effect_noise((800, 800), 64).convert("RGB").save(buffer, format="PNG")
+    budget = 60 * 1024
+    
+    for quality in (30, MIN_JPEG_QUALITY):
+        encoded = encode_image(buffer.getvalue(), jpeg_quality=quality, max_payload_bytes=budget)
+        
+        assert encoded["payload_bytes"] <= budget, encoded["payload_bytes"]
+        assert encoded["payload_bytes"] == len(encoded["base64"])
+        assert encoded["quality"] == quality, encoded["quality"]
+        decoded = Image.open(BytesIO(base64.b64decode(encoded["base64"])))
+        assert decoded.size == (encoded["width"], encoded["height"]) != (800, 800), decoded.size
+    
+    print("✅ Image encoding fits the payload budget at low JPEG quality")
+    print()
+
+
+def _mock_response(status, body=None, headers=None):
+    """Build a requests.Response as the NVIDIA API would return it"""
+    import json
+    import requests
+    
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body or {}).encode("utf-8")
+    response.headers.update(headers or {})
+    response.url = "https://mock.invalid/v1/chat/completions"
+    return response
+
+
+def test_retry_policy_with_mock_session():
+    """429 is retried after its Retry-After delay; 400 is returned at once"""
+    import time
+    from unittest import mock
+    from utils.helpers import RetryPolicy, get_rate_limiter, set_rate_limiter, _send_with_retries
+    
+    policy = RetryPolicy(max_attempts=3, backoff_base=0.01, jitter=False, deadline=5)
+    assert policy.next_delay(1, 429, 0.2, None) == 0.2
+    assert policy.next_delay(1, 400, None, None) is None
+    assert policy.next_delay(3, 503, None, None) is None
+    assert policy.next_delay(1, 503, 10.0, 5.0) is None
+    
+    ok = {"choices": [{"message": {"content": "ok"}}]}
+    limiter = get_rate_limiter()
+    set_rate_limiter(None)
+    try:
+        session = mock.Mock()
+        session.post.side_effect = [_mock_response(429, headers={"Retry-After": "0.2"}), _mock_response(200, ok)]
+        start = time.monotonic()
+        result = _send_with_retries({"model": "test"}, "LLM", session=session, retry_policy=policy)
+        
+        assert result["choices"] == ok["choices"] and result["attempts"] == 2, result
+        assert time.monotonic() - start >= 0.2
+        
+        session.post.side_effect = [_mock_response(400), _mock_response(200, ok)]
+        result = _send_with_retries({"model": "test"}, "LLM", session=session, retry_policy=policy)
+        
+        assert result["error"] and result["status_code"] == 400 and result["attempts"] == 1, result
+        assert session.post.call_count == 3
+    finally:
+        set_rate_limiter(limiter)
+    
+    print("✅ Retry policy honors Retry-After and does not retry client errors")
+    print()
+
+
+def test_rate_limiter_refunds_abandoned_reservation():
+    """A reservation refused for exceeding max_wait takes no quota"""
+    from utils.helpers import RateLimiter
+    
+    limiter = RateLimiter()
+    limiter.configure("test", rpm=1, tpm=1000)
+    assert limiter.reserve("test", 100) == 0.0
+    
+    wait = limiter.reserve("test", 100, max_wait=1.0)
+    assert wait > 1.0, wait
+    # Refunded: the next caller waits no longer than the refused one would have
+    assert abs(limiter.reserve("test", 100, max_wait=1.0) - wait) < 0.5
+    
+    # Kept: the next caller queues a full minute behind it
+    limiter.reserve("test", 100)
+    assert limiter.reserve("test", 100, max_wait=1.0) > wait + 30
+    
+    print("✅ Rate limiter refunds reservations abandoned at max_wait")
+    print()
+
+
+def test_circuit_breaker_with_mock_session():
+    """The breaker opens on server errors, ignores 429, then half-opens and closes on success"""
+    import time
+    from unittest import mock
+    from utils import helpers
+    from utils.helpers import RetryPolicy, configure_circuit_breakers, get_circuit_breaker
+    
+    ok = {"choices": [{"message": {"content": "ok"}}]}
+    policy = RetryPolicy(max_attempts=1, deadline=5)
+    options = dict(helpers._circuit_breaker_options)
+    limiter = helpers.get_rate_limiter()
+    helpers.set_rate_limiter(None)
+    configure_circuit_breakers(min_calls=2, failure_threshold=0.5, reset_timeout=0.1)
+    try:
+        breaker = get_circuit_breaker("test")
+        session = mock.Mock()
+        
+        def send(*responses):
+            session.post.side_effect = list(responses)
+            return helpers._send_through_breaker({"model": "test"}, "LLM", session=session, retry_policy=policy)
+        
+        # Quota refusals are the rate limiter's concern
+        send(_mock_response(429))
+        send(_mock_response(429))
+        assert breaker.state == "closed", breaker.state
+        
+        send(_mock_response(503))
+        send(_mock_response(503))
+        assert breaker.state == "open", breaker.state
+        
+        calls = session.post.call_count
+        result = send(_mock_response(200, ok))
+        assert result.get("circuit_open") and session.post.call_count == calls, result
+        
+        time.sleep(0.15)
+        assert breaker.state == "half_open", breaker.state
+        result = send(_mock_response(200, ok))
+        assert not result.get("error") and breaker.state == "closed", result
+    finally:
+        configure_circuit_breakers(**options)
+        helpers.set_rate_limiter(limiter)
+    
+    print("✅ Circuit breaker opens, half-opens and closes again")
+    print()
+
+
 def main():
     """Run all tests"""
     print("\n🧪 EcoAgent Test Suite\n")
@@ -125,6 +373,13 @@ def main():
     
     test_waste_categories()
     test_severity_levels()
+    test_bulk_severity_matches_rule_based()
+    test_report_sections_keep_body_titles()
+    test_json_extract_skips_apostrophes_in_prose()
+    test_encode_image_fits_budget_at_low_quality()
+    test_retry_policy_with_mock_session()
+    test_rate_limiter_refunds_abandoned_reservation()
+    test_circuit_breaker_with_mock_session()
     
     print("="*60)
     print("Test suite completed!")
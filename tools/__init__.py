@@ -3,14 +3,51 @@ EcoAgent Tools Package
 Contains all analysis tools for waste classification, severity estimation, and report generation
 """
 
-from .waste_classifier import classify_waste, get_waste_categories
-from .severity_estimator import estimate_severity
-from .report_generator import generate_civic_report, format_report_for_display
+from .waste_classifier import (
+    classify_waste,
+    classify_waste_async,
+    get_waste_categories,
+    get_classification_cache,
+    set_classification_cache,
+    is_reusable_classification
+)
+from .severity_estimator import (
+    estimate_severity,
+    estimate_severity_async,
+    estimate_severity_bulk,
+    SeverityGate,
+    get_severity_gate,
+    set_severity_gate
+)
+from .fused_assessment import assess_waste, assess_waste_async
+from .report_generator import (
+    generate_civic_report,
+    generate_civic_report_async,
+    generate_civic_report_stream,
+    render_template_report,
+    report_uses_llm,
+    format_report_for_display
+)
 
 __all__ = [
     'classify_waste',
+    'classify_waste_async',
     'get_waste_categories',
+    'get_classification_cache',
+    'set_classification_cache',
+    'is_reusable_classification',
     'estimate_severity',
+    'estimate_severity_async',
+    'estimate_severity_bulk',
+    'SeverityGate',
+    'get_severity_gate',
+    'set_severity_gate',
+    'assess_waste',
+    'assess_waste_async',
     'generate_civic_report',
+    'generate_civic_report_async',
+    'generate_civic_report_stream',
+    'render_template_report',
+    'report_uses_llm',
     'format_report_for_display'
 ]
@@ -0,0 +1,263 @@
+"""
+Fused Assessment Tool
+Classifies waste and estimates its severity in a single Nemotron VLM call
+"""
+
+import hashlib
+from typing import Dict, Any, Optional
+from utils.helpers import call_nemotron_vlm, call_nemotron_vlm_async
+from tools.waste_classifier import (
+    WASTE_CATEGORIES,
+    CLASSIFIER_MODEL,
+    CLASSIFICATION_SCHEMA,
+    GUIDED_JSON,
+    get_classification_cache,
+    is_reusable_classification,
+    _cache_info,
+    _create_fallback_classification,
+    _parse_classification_response
+)
+from tools.severity_estimator import (
+    SEVERITY_LEVELS,
+    SEVERITY_SCHEMA,
+    estimate_severity_rule_based,
+    _parse_severity_response
+)
+
+
+# Bump whenever the fused prompt changes so cached results are not reused
+FUSED_PROMPT_VERSION = "1"
+
+# Union of the classification and severity schemas
+FUSED_SCHEMA = {
+    "type": "object",
+    "properties": {**CLASSIFICATION_SCHEMA["properties"], **SEVERITY_SCHEMA["properties"]},
+    "required": CLASSIFICATION_SCHEMA["required"] + SEVERITY_SCHEMA["required"]
+}
+
+# One answer carries both the classification and the severity fields
+FUSED_MAX_TOKENS = 1536
+GUIDED_FUSED_MAX_TOKENS = 640
+
+
+def _build_fused_prompt(location: str) -> str:
+    """
+    Build the VLM prompt for classification plus severity
+    
+    Args:
+        location: Location of the waste
+    
+    Returns:
+        Prompt text
+    """
+    return f"""Analyze this image, identify the type of waste or pollution visible, and assess its severity.
+
+Location: {location if location else 'Not specified'}
+
+Possible categories:
+{chr(10).join(f"- {cat}" for cat in WASTE_CATEGORIES)}
+
+Severity Levels:
+{chr(10).join(f"- {level}: {info['description']}" for level, info in SEVERITY_LEVELS.items())}
+
+Provide your analysis in the following JSON format:
+{{
+    "waste_type": "primary category from the list above",
+    "confidence": "high/medium/low",
+    "description": "detailed description of what you see (50-100 words)",
+    "tags": ["relevant", "tags", "here"],
+    "visible_items": ["specific items you can identify"],
+    "severity": "critical/high/medium/low/minimal",
+    "severity_score": 1-5,
+    "reasoning": "explain your severity assessment in 2-3 sentences",
+    "health_risk": "description of potential health risks",
+    "environmental_impact": "description of environmental impact",
+    "urgency_factors": ["list", "of", "factors"]
+}}
+
+Be specific and objective. Focus on observable facts, and consider public health, environmental impact, and urgency."""
+
+
+def fused_cache_key(image_base64: str, location: str, model: str = CLASSIFIER_MODEL) -> str:
+    """
+    Build a content-addressed cache key for a fused assessment
+    
+    Args:
+        image_base64: Base64 encoded (already normalized) image
+        location: Location included in the prompt
+        model: VLM model identifier
+    
+    Returns:
+        Hex digest identifying image + location + model + prompt version
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{model}\nfused-{FUSED_PROMPT_VERSION}\n{location}\n".encode("utf-8"))
+    digest.update("".join(image_base64.split()).encode("ascii"))
+    return digest.hexdigest()
+
+
+def assess_waste(
+    image_base64: str,
+    location: str = "",
+    use_cache: bool = True,
+    mime_type: str = "image/jpeg",
+    deadline: Optional[float] = None,
+    guided_json: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Classify waste and estimate its severity with one VLM call
+    Saves the separate severity LLM round trip; the severity falls back to
+    rule-based if the answer has no usable severity fields
+    
+    Args:
+        image_base64: Base64 encoded image of waste/pollution
+        location: Location of the waste
+        use_cache: Whether to reuse a cached result for the same image and location
+        mime_type: MIME type of the encoded image
+        deadline: Seconds the VLM call may take, retries included
+        guided_json: Whether to constrain the output to FUSED_SCHEMA
+            (defaults to ECOAGENT_GUIDED_JSON)
+    
+    Returns:
+        Dict with "classification" (see classify_waste) and "severity"
+        (see estimate_severity; method "vlm-fused")
+    """
+    cache_key = fused_cache_key(image_base64, location) if use_cache else None
+    cached = _cache_lookup(cache_key)
+    if cached is not None:
+        return cached
+    
+    try:
+        response = call_nemotron_vlm(
+            image_base64=image_base64,
+            prompt=_build_fused_prompt(location),
+            model=CLASSIFIER_MODEL,
+            temperature=0.2,
+            mime_type=mime_type,
+            deadline=deadline,
+            **_output_options(guided_json)
+        )
+        return _cache_store(cache_key, _parse_fused_response(response))
+    
+    except Exception as e:
+        return _create_fallback_assessment(f"Exception during assessment: {str(e)}")
+
+
+async def assess_waste_async(
+    image_base64: str,
+    location: str = "",
+    use_cache: bool = True,
+    mime_type: str = "image/jpeg",
+    deadline: Optional[float] = None,
+    guided_json: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Async version of assess_waste
+    
+    Args:
+        image_base64: Base64 encoded image of waste/pollution
+        location: Location of the waste
+        use_cache: Whether to reuse a cached result for the same image and location
+        mime_type: MIME type of the encoded image
+        deadline: Seconds the VLM call may take, retries included
+        guided_json: Whether to constrain the output to FUSED_SCHEMA
+            (defaults to ECOAGENT_GUIDED_JSON)
+    
+    Returns:
+        Assessment dict (see assess_waste)
+    """
+    cache_key = fused_cache_key(image_base64, location) if use_cache else None
+    cached = _cache_lookup(cache_key)
+    if cached is not None:
+        return cached
+    
+    try:
+        response = await call_nemotron_vlm_async(
+            image_base64=image_base64,
+            prompt=_build_fused_prompt(location),
+            model=CLASSIFIER_MODEL,
+            temperature=0.2,
+            mime_type=mime_type,
+            deadline=deadline,
+            **_output_options(guided_json)
+        )
+        return _cache_store(cache_key, _parse_fused_response(response))
+    
+    except Exception as e:
+        return _create_fallback_assessment(f"Exception during assessment: {str(e)}")
+
+
+def _output_options(guided_json: Optional[bool]) -> Dict[str, Any]:
+    """Pick the token limit and output schema for a fused call"""
+    if guided_json is None:
+        guided_json = GUIDED_JSON
+    if guided_json:
+        return {"max_tokens": GUIDED_FUSED_MAX_TOKENS, "json_schema": FUSED_SCHEMA}
+    return {"max_tokens": FUSED_MAX_TOKENS}
+
+
+def _cache_lookup(key: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Look up a fused assessment in the classification cache"""
+    if key is None:
+        return None
+    
+    cache = get_classification_cache()
+    cached, tier = cache.get(key)
+    if cached is None:
+        return None
+    
+    cached["classification"]["cache"] = _cache_info(cache, hit=True, tier=tier)
+    return cached
+
+
+def _cache_store(key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a fresh fused assessment and annotate its classification with cache info"""
+    if key is None:
+        return result
+    
+    cache = get_classification_cache()
+    if is_reusable_classification(result["classification"]):
+        cache.set(key, result)
+    result["classification"]["cache"] = _cache_info(cache, hit=False, tier=None)
+    return result
+
+
+def _parse_fused_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Split a fused VLM response into classification and severity results
+    
+    Args:
+        response: API response dictionary
+    
+    Returns:
+        Assessment dict (see assess_waste)
+    """
+    classification = _parse_classification_response(response)
+    if classification.get("error"):
+        severity = estimate_severity_rule_based(classification)
+    else:
+        severity = _parse_severity_response(response, classification)
+        if severity["method"] == "llm-based":
+            severity["method"] = "vlm-fused"
+    
+    return {
+        "classification": classification,
+        "severity": severity
+    }
+
+
+def _create_fallback_assessment(error_msg: str) -> Dict[str, Any]:
+    """
+    Create a fallback assessment when the VLM fails
+    
+    Args:
+        error_msg: Error message
+    
+    Returns:
+        Fallback assessment dict with rule-based severity
+    """
+    classification = _create_fallback_classification(error_msg)
+    return {
+        "classification": classification,
+        "severity": estimate_severity_rule_based(classification)
+    }
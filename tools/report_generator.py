@@ -3,19 +3,115 @@ Report Generator Tool
 Generates civic environmental reports using NVIDIA Nemotron LLM
 """
 
-from typing import Dict, Any
+import os
+import re
+from typing import Dict, Any, Iterable, Iterator, Optional
 from datetime import datetime
-from utils.helpers import call_nemotron_llm, extract_text_from_response
+from utils.helpers import (
+    call_nemotron_llm,
+    call_nemotron_llm_async,
+    stream_nemotron_llm,
+    extract_text_from_response
+)
 
 
-def generate_civic_report(
+REPORT_MODEL = "nvidia/llama-3_3-nemotron-super-49b-v1_5"
+
+# System prompt for report generation
+REPORT_SYSTEM_PROMPT = """You are an environmental report specialist. Your job is to create clear, professional, 
+actionable reports for civic authorities. Be concise, factual, and focus on what actions need to be taken."""
+
+# Canonical report sections and the header titles that map to them
+REPORT_SECTIONS = (
+    "executive_summary",
+    "detailed_findings",
+    "risk_assessment",
+    "recommended_actions",
+    "priority_level"
+)
+SECTION_TITLES = {
+    "executive summary": "executive_summary",
+    "summary": "executive_summary",
+    "detailed findings": "detailed_findings",
+    "findings": "detailed_findings",
+    "observations": "detailed_findings",
+    "risk assessment": "risk_assessment",
+    "risks": "risk_assessment",
+    "risk": "risk_assessment",
+    "recommended actions": "recommended_actions",
+    "recommended action": "recommended_actions",
+    "recommendations": "recommended_actions",
+    "recommendation": "recommended_actions",
+    "actions": "recommended_actions",
+    "action": "recommended_actions",
+    "priority level": "priority_level",
+    "priority": "priority_level"
+}
+
+# A header line: optional markdown "#", numbering (outside or inside the bold)
+# and bold around a whole known title, then an optional colon and the start
+# of the section's text
+_HEADER = re.compile(
+    r"[ \t]*(?P<hashes>#{1,6}[ \t]*)?(?:\d+[.)][ \t]*)?(?P<open>\*\*|__)?[ \t]*(?:\d+[.)][ \t]*)?"
+    r"(?P<title>" + "|".join(sorted(SECTION_TITLES, key=len, reverse=True)) + r")\b"
+    r"[ \t]*(?P<close>\*\*|__)?[ \t]*(?P<colon>:)?[ \t]*(?:\*\*|__)?(?P<rest>.*)",
+    re.IGNORECASE
+)
+_HORIZONTAL_RULE = re.compile(r"\n[ \t]*(?:-{3,}|\*{3,}|_{3,})[ \t]*$")
+
+# Severity levels whose reports are written by the LLM unless a call says
+# otherwise; the others get the template report
+LLM_REPORT_LEVELS = frozenset(
+    level.strip()
+    for level in os.getenv("ECOAGENT_LLM_REPORT_LEVELS", "critical,high").split(",")
+    if level.strip()
+)
+
+# Template report: section headings and standard actions per severity level
+TEMPLATE_HEADINGS = {
+    "executive_summary": "Executive Summary",
+    "detailed_findings": "Detailed Findings",
+    "risk_assessment": "Risk Assessment",
+    "recommended_actions": "Recommended Actions",
+    "priority_level": "Priority Level"
+}
+TEMPLATE_ACTIONS = {
+    "critical": (
+        "Dispatch an emergency response team immediately",
+        "Cordon off the area and restrict public access",
+        "Contain the material before it reaches drains or water bodies",
+        "Notify environmental health and hazardous materials authorities"
+    ),
+    "high": (
+        "Dispatch a specialized cleanup crew",
+        "Assess the extent of contamination",
+        "Implement containment measures if necessary",
+        "Notify the responsible municipal department"
+    ),
+    "medium": (
+        "Schedule a cleanup crew",
+        "Assess the extent of the accumulation",
+        "Check the site for repeated dumping"
+    ),
+    "low": (
+        "Add the site to the routine cleanup schedule",
+        "Check the site for repeated dumping"
+    ),
+    "minimal": (
+        "Clear during routine maintenance",
+        "Consider preventive measures such as signage or additional bins"
+    )
+}
+
+
+def _build_report_prompt(
     classification: Dict[str, Any],
     severity: Dict[str, Any],
-    location: str = "",
-    additional_notes: str = ""
-) -> Dict[str, Any]:
+    location: str,
+    additional_notes: str
+) -> str:
     """
-    Generate a comprehensive civic report for environmental authorities
+    Build the user prompt for report generation
     
     Args:
         classification: Waste classification result
@@ -24,9 +120,8 @@ def generate_civic_report(
         additional_notes: Any additional notes from the reporter
         
     Returns:
-        Dict containing formatted report sections
+        Prompt text
     """
-    
     # Prepare context for report generation
     context = f"""
 Environmental Issue Report Details:
@@ -51,12 +146,8 @@ ADDITIONAL NOTES:
 {additional_notes if additional_notes else 'None'}
 """
 
-    # System prompt for report generation
-    system_prompt = """You are an environmental report specialist. Your job is to create clear, professional, 
-actionable reports for civic authorities. Be concise, factual, and focus on what actions need to be taken."""
-
     # User prompt for report generation
-    user_prompt = f"""{context}
+    return f"""{context}
 
 Generate a professional environmental incident report with the following sections:
 
@@ -69,50 +160,335 @@ Generate a professional environmental incident report with the following section
 Make the report clear, actionable, and appropriate for submission to environmental authorities.
 Format the output in a structured way that can be easily parsed."""
 
+
+def _build_report(
+    response: Dict[str, Any],
+    classification: Dict[str, Any],
+    severity: Dict[str, Any],
+    location: str,
+    additional_notes: str = ""
+) -> Dict[str, Any]:
+    """
+    Turn a raw LLM response into a report dict
+    Falls back to the template report if the response is an error
+    
+    Args:
+        response: API response dictionary
+        classification: Waste classification result
+        severity: Severity assessment result
+        location: Location of the incident
+        additional_notes: Any additional notes from the reporter
+        
+    Returns:
+        Report dict
+    """
+    # Extract text from response
+    report_text = extract_text_from_response(response)
+    
+    if report_text.startswith("ERROR:"):
+        report = render_template_report(classification, severity, location, additional_notes, error=report_text)
+        report["metadata"]["api_attempts"] = response.get("attempts")
+        return report
+    
+    # Parse the report into sections
+    report_sections = _parse_report_sections(report_text)
+    
+    # Generate report metadata
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    return {
+        "report_id": f"ECO-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+        "timestamp": timestamp,
+        "location": location,
+        "waste_type": classification.get('waste_type'),
+        "severity": severity.get('severity'),
+        "full_report": report_text,
+        "sections": report_sections,
+        "metadata": {
+            "classification_confidence": classification.get('confidence'),
+            "severity_score": severity.get('severity_score'),
+            "response_time": severity.get('response_time'),
+            "generator": "llm",
+            "api_attempts": response.get("attempts")
+        }
+    }
+
+
+def generate_civic_report(
+    classification: Dict[str, Any],
+    severity: Dict[str, Any],
+    location: str = "",
+    additional_notes: str = "",
+    use_llm: Optional[bool] = None,
+    deadline: Optional[float] = None,
+    llm_levels: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    Generate a comprehensive civic report for environmental authorities
+    
+    Args:
+        classification: Waste classification result
+        severity: Severity assessment result
+        location: Location of the incident
+        additional_notes: Any additional notes from the reporter
+        use_llm: Whether to call the LLM (False renders the template report;
+            None decides by severity level, see report_uses_llm)
+        deadline: Seconds the LLM call may take, retries included
+        llm_levels: Severity levels that get an LLM report when use_llm is None
+            (defaults to LLM_REPORT_LEVELS)
+        
+    Returns:
+        Dict containing formatted report sections
+    """
+    if use_llm is None:
+        use_llm = report_uses_llm(severity, llm_levels)
+    if not use_llm:
+        return render_template_report(classification, severity, location, additional_notes)
+    
     try:
         # Call Nemotron LLM for report generation
         response = call_nemotron_llm(
-            prompt=user_prompt,
-            model="nvidia/llama-3_3-nemotron-super-49b-v1_5",
+            prompt=_build_report_prompt(classification, severity, location, additional_notes),
+            model=REPORT_MODEL,
             temperature=0.7,
             max_tokens=2048,
-            system_prompt=system_prompt
+            system_prompt=REPORT_SYSTEM_PROMPT,
+            deadline=deadline
         )
+        return _build_report(response, classification, severity, location, additional_notes)
         
-        # Extract text from response
-        report_text = extract_text_from_response(response)
-        
-        if report_text.startswith("ERROR:"):
-            return _create_fallback_report(classification, severity, location, report_text)
-        
-        # Parse the report into sections
-        report_sections = _parse_report_sections(report_text)
+    except Exception as e:
+        return render_template_report(
+            classification,
+            severity,
+            location,
+            additional_notes,
+            error=f"Exception during report generation: {str(e)}"
+        )
+
+
+async def generate_civic_report_async(
+    classification: Dict[str, Any],
+    severity: Dict[str, Any],
+    location: str = "",
+    additional_notes: str = "",
+    use_llm: Optional[bool] = None,
+    deadline: Optional[float] = None,
+    llm_levels: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    Async version of generate_civic_report
+    
+    Args:
+        classification: Waste classification result
+        severity: Severity assessment result
+        location: Location of the incident
+        additional_notes: Any additional notes from the reporter
+        use_llm: Whether to call the LLM (False renders the template report;
+            None decides by severity level, see report_uses_llm)
+        deadline: Seconds the LLM call may take, retries included
+        llm_levels: Severity levels that get an LLM report when use_llm is None
+            (defaults to LLM_REPORT_LEVELS)
         
-        # Generate report metadata
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    Returns:
+        Dict containing formatted report sections
+    """
+    if use_llm is None:
+        use_llm = report_uses_llm(severity, llm_levels)
+    if not use_llm:
+        return render_template_report(classification, severity, location, additional_notes)
+    
+    try:
+        response = await call_nemotron_llm_async(
+            prompt=_build_report_prompt(classification, severity, location, additional_notes),
+            model=REPORT_MODEL,
+            temperature=0.7,
+            max_tokens=2048,
+            system_prompt=REPORT_SYSTEM_PROMPT,
+            deadline=deadline
+        )
+        return _build_report(response, classification, severity, location, additional_notes)
         
-        return {
-            "report_id": f"ECO-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-            "timestamp": timestamp,
-            "location": location,
-            "waste_type": classification.get('waste_type'),
-            "severity": severity.get('severity'),
-            "full_report": report_text,
-            "sections": report_sections,
-            "metadata": {
-                "classification_confidence": classification.get('confidence'),
-                "severity_score": severity.get('severity_score'),
-                "response_time": severity.get('response_time')
-            }
-        }
+    except Exception as e:
+        return render_template_report(
+            classification,
+            severity,
+            location,
+            additional_notes,
+            error=f"Exception during report generation: {str(e)}"
+        )
+
+
+def generate_civic_report_stream(
+    classification: Dict[str, Any],
+    severity: Dict[str, Any],
+    location: str = "",
+    additional_notes: str = "",
+    deadline: Optional[float] = None,
+    use_llm: Optional[bool] = None,
+    llm_levels: Optional[Iterable[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming version of generate_civic_report
+    Yields text as the model generates it and each section as soon as the
+    header that follows it arrives, so the summary can be shown early
+    
+    Args:
+        classification: Waste classification result
+        severity: Severity assessment result
+        location: Location of the incident
+        additional_notes: Any additional notes from the reporter
+        deadline: Seconds the whole LLM call may take, streaming included
+        use_llm: Whether to call the LLM (see generate_civic_report); the
+            template report is delivered as sections without deltas
+        llm_levels: Severity levels that get an LLM report when use_llm is None
         
+    Yields:
+        Event dicts:
+        - {"type": "delta", "text": ...} for each piece of generated text
+        - {"type": "section", "name": ..., "content": ...} once per section
+        - {"type": "report", "report": ...} last, with the same report dict
+          generate_civic_report returns (the template report on failure)
+    """
+    if use_llm is None:
+        use_llm = report_uses_llm(severity, llm_levels)
+    if not use_llm:
+        report = render_template_report(classification, severity, location, additional_notes)
+        for section_key, content in report["sections"].items():
+            yield {"type": "section", "name": section_key, "content": content}
+        yield {"type": "report", "report": report}
+        return
+    
+    chunks = []
+    parser = ReportSectionParser()
+    response = {}
+    
+    try:
+        for event in stream_nemotron_llm(
+            prompt=_build_report_prompt(classification, severity, location, additional_notes),
+            model=REPORT_MODEL,
+            temperature=0.7,
+            max_tokens=2048,
+            system_prompt=REPORT_SYSTEM_PROMPT,
+            deadline=deadline
+        ):
+            if event["type"] != "delta":
+                response = event
+                continue
+            
+            chunks.append(event["text"])
+            yield event
+            for section_key, content in parser.feed(event["text"]):
+                yield {"type": "section", "name": section_key, "content": content}
+    
     except Exception as e:
-        return _create_fallback_report(
-            classification, 
-            severity, 
-            location, 
-            f"Exception during report generation: {str(e)}"
+        response = {"error": True, "message": f"Exception during report generation: {str(e)}"}
+    
+    if response.get("error"):
+        report = render_template_report(
+            classification, severity, location, additional_notes, error=f"ERROR: {response.get('message')}"
+        )
+        report["metadata"]["api_attempts"] = response.get("attempts")
+    else:
+        report = _build_report(
+            {"choices": [{"message": {"content": "".join(chunks)}}], "attempts": response.get("attempts")},
+            classification,
+            severity,
+            location,
+            additional_notes
         )
+    
+    # Deliver whatever the final parse found that was not streamed yet
+    for section_key, content in report["sections"].items():
+        if section_key not in parser.emitted and content:
+            yield {"type": "section", "name": section_key, "content": content}
+    
+    yield {"type": "report", "report": report}
+
+
+class ReportSectionParser:
+    """
+    Line-based, single-pass parser that splits a report into its canonical sections
+    Header lines (markdown "#", bold or numbered titles, or "Title:") open a
+    section that runs until the next header. Text can be fed as it streams;
+    a section is returned as soon as the header after it arrives.
+    """
+    
+    def __init__(self):
+        """Initialize an empty parser"""
+        self.sections: Dict[str, str] = {}
+        self.emitted: set = set()
+        self._pending = ""
+        self._current: Optional[str] = None
+        self._lines: list = []
+        self._seen_header = False
+    
+    def feed(self, chunk: str) -> list:
+        """
+        Parse the next piece of report text
+        
+        Args:
+            chunk: Text that follows everything fed so far
+            
+        Returns:
+            List of (section key, content) pairs completed by this chunk
+        """
+        lines = (self._pending + chunk).split("\n")
+        self._pending = lines.pop()
+        completed = []
+        for line in lines:
+            self._consume(line, completed)
+        return completed
+    
+    def close(self) -> Dict[str, str]:
+        """
+        Finish parsing
+        
+        Returns:
+            Dict with all five section keys (empty strings for missing sections)
+        """
+        completed = []
+        if self._pending:
+            self._consume(self._pending, [])
+            self._pending = ""
+        self._finish_section(completed)
+        return {section_key: self.sections.get(section_key, "") for section_key in REPORT_SECTIONS}
+    
+    def _consume(self, line: str, completed: list) -> None:
+        """Handle one complete line"""
+        match = _HEADER.match(line)
+        if match and self._is_header(match):
+            section_key = SECTION_TITLES[match.group("title").lower()]
+            # A title naming the open or an earlier section ("Observations:" inside
+            # the findings) is body text: only the first occurrence opens a section
+            if section_key != self._current and section_key not in self.sections:
+                self._finish_section(completed)
+                self._seen_header = True
+                self._current = section_key
+                self._lines = [match.group("rest")]
+                return
+        if self._current is not None:
+            self._lines.append(line)
+    
+    def _is_header(self, match) -> bool:
+        """Reject prose lines that merely start with a title word ("Actions taken ...")"""
+        rest = match.group("rest").strip()
+        return bool(match.group("hashes") or match.group("open") or match.group("colon") or not rest)
+    
+    def _finish_section(self, completed: list) -> None:
+        """Close the open section and record it"""
+        if self._current is None:
+            return
+        content = _HORIZONTAL_RULE.sub("", "\n".join(self._lines).strip()).strip()
+        if self._current == "priority_level":
+            # The priority is a label; drop any closing remarks after it
+            content = content.split("\n\n", 1)[0].strip()
+        self.sections[self._current] = content
+        if content:
+            self.emitted.add(self._current)
+            completed.append((self._current, content))
+        self._current = None
+        self._lines = []
 
 
 def _parse_report_sections(report_text: str) -> Dict[str, str]:
@@ -125,30 +501,9 @@ def _parse_report_sections(report_text: str) -> Dict[str, str]:
     Returns:
         Dict of report sections
     """
-    sections = {
-        "executive_summary": "",
-        "detailed_findings": "",
-        "risk_assessment": "",
-        "recommended_actions": "",
-        "priority_level": ""
-    }
-    
-    # Try to extract sections using common headers
-    import re
-    
-    # Define section patterns
-    patterns = {
-        "executive_summary": r"(?:Executive Summary|Summary)[:\s]+(.*?)(?=\n\n|\*\*|#{1,2}\s|$)",
-        "detailed_findings": r"(?:Detailed Findings|Findings|Observations)[:\s]+(.*?)(?=\n\n\*\*|#{1,2}\s|$)",
-        "risk_assessment": r"(?:Risk Assessment|Risks?)[:\s]+(.*?)(?=\n\n\*\*|#{1,2}\s|$)",
-        "recommended_actions": r"(?:Recommended Actions?|Actions?|Recommendations?)[:\s]+(.*?)(?=\n\n\*\*|#{1,2}\s|$)",
-        "priority_level": r"(?:Priority Level|Priority)[:\s]+(.*?)(?=\n\n|\*\*|#{1,2}\s|$)"
-    }
-    
-    for section_key, pattern in patterns.items():
-        match = re.search(pattern, report_text, re.DOTALL | re.IGNORECASE)
-        if match:
-            sections[section_key] = match.group(1).strip()
+    parser = ReportSectionParser()
+    parser.feed(report_text)
+    sections = parser.close()
     
     # If parsing fails, store full text in executive summary
     if not any(sections.values()):
@@ -157,77 +512,119 @@ def _parse_report_sections(report_text: str) -> Dict[str, str]:
     return sections
 
 
-def _create_fallback_report(
+def report_uses_llm(severity: Dict[str, Any], llm_levels: Optional[Iterable[str]] = None) -> bool:
+    """
+    Whether a report at this severity is written by the LLM
+    
+    Args:
+        severity: Severity assessment result
+        llm_levels: Severity levels that get an LLM report (defaults to LLM_REPORT_LEVELS)
+        
+    Returns:
+        True for the LLM report, False for the template report
+    """
+    levels = LLM_REPORT_LEVELS if llm_levels is None else llm_levels
+    return severity.get("severity") in levels
+
+
+def _bullets(items: Iterable[str]) -> str:
+    """Render items as a markdown bullet list"""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def render_template_report(
     classification: Dict[str, Any],
     severity: Dict[str, Any],
-    location: str,
-    error_msg: str
+    location: str = "",
+    additional_notes: str = "",
+    error: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Create a fallback report when LLM fails
+    Render a complete report from the template, without calling the LLM
+    Used for severity levels outside LLM_REPORT_LEVELS and as the fallback
+    when the LLM fails
     
     Args:
-        classification: Classification result
-        severity: Severity result
-        location: Location
-        error_msg: Error message
+        classification: Waste classification result
+        severity: Severity assessment result
+        location: Location of the incident
+        additional_notes: Any additional notes from the reporter
+        error: Why the LLM report could not be produced, if this is a fallback
         
     Returns:
-        Fallback report dict
+        Report dict in the same shape generate_civic_report returns
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    now = datetime.now()
     
-    # Generate a basic report using template
     waste_type = classification.get('waste_type', 'Unknown')
     severity_level = severity.get('severity', 'unknown')
     description = classification.get('description', 'No description available')
+    place = location if location else 'an unspecified location'
     
-    fallback_text = f"""ENVIRONMENTAL INCIDENT REPORT (Auto-Generated)
-
-Executive Summary:
-{waste_type} detected at {location if location else 'unspecified location'} with {severity_level} severity level.
-
-Detailed Findings:
-- Waste Type: {waste_type}
-- Description: {description}
-- Confidence Level: {classification.get('confidence', 'unknown')}
-
-Risk Assessment:
-- Severity Level: {severity_level.upper()}
-- Severity Score: {severity.get('severity_score', 'N/A')}/5
-- Response Time Required: {severity.get('response_time', 'Standard')}
+    findings = [
+        f"Waste Type: {waste_type}",
+        f"Description: {description}",
+        f"Confidence Level: {classification.get('confidence', 'unknown')}"
+    ]
+    if classification.get('visible_items'):
+        findings.append(f"Visible Items: {', '.join(classification['visible_items'])}")
+    if additional_notes:
+        findings.append(f"Reporter Notes: {additional_notes}")
+    
+    risks = [
+        f"Severity Level: {severity_level.upper()}",
+        f"Severity Score: {severity.get('severity_score', 'N/A')}/5",
+        f"Response Time Required: {severity.get('response_time', 'Standard')}"
+    ]
+    for label, key in (("Assessment", "reasoning"), ("Health Risk", "health_risk"),
+                       ("Environmental Impact", "environmental_impact")):
+        if severity.get(key):
+            risks.append(f"{label}: {severity[key]}")
+    
+    actions = TEMPLATE_ACTIONS.get(severity_level, TEMPLATE_ACTIONS["medium"])
+    
+    summary = f"{waste_type} detected at {place} with {severity_level} severity level."
+    if severity.get('description'):
+        summary += f" {severity['description']}."
+    
+    sections = {
+        "executive_summary": summary,
+        "detailed_findings": _bullets(findings),
+        "risk_assessment": _bullets(risks),
+        "recommended_actions": _bullets((*actions, f"Follow standard protocols for {waste_type}")),
+        "priority_level": severity_level.upper()
+    }
+    
+    body = "\n\n".join(
+        f"{TEMPLATE_HEADINGS[key]}:\n{sections[key]}" for key in REPORT_SECTIONS if key != "priority_level"
+    )
+    report_text = f"""ENVIRONMENTAL INCIDENT REPORT (Auto-Generated)
 
-Recommended Actions:
-- Dispatch appropriate cleanup crew
-- Assess the extent of contamination
-- Implement containment measures if necessary
-- Follow standard protocols for {waste_type}
+{body}
 
-Priority Level: {severity_level.upper()}
+Priority Level: {sections['priority_level']}
 
 Note: This is an auto-generated report. Manual review recommended."""
-
+    
+    metadata = {
+        "classification_confidence": classification.get('confidence'),
+        "severity_score": severity.get('severity_score'),
+        "response_time": severity.get('response_time'),
+        "generator": "template",
+        "is_fallback": error is not None
+    }
+    if error is not None:
+        metadata["error"] = error
+    
     return {
-        "report_id": f"ECO-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-        "timestamp": timestamp,
+        "report_id": f"ECO-{now.strftime('%Y%m%d%H%M%S')}",
+        "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
         "location": location,
         "waste_type": waste_type,
         "severity": severity_level,
-        "full_report": fallback_text,
-        "sections": {
-            "executive_summary": f"{waste_type} detected with {severity_level} severity",
-            "detailed_findings": description,
-            "risk_assessment": f"{severity_level.upper()} priority",
-            "recommended_actions": "Standard cleanup and assessment required",
-            "priority_level": severity_level.upper()
-        },
-        "metadata": {
-            "classification_confidence": classification.get('confidence'),
-            "severity_score": severity.get('severity_score'),
-            "response_time": severity.get('response_time'),
-            "is_fallback": True,
-            "error": error_msg
-        }
+        "full_report": report_text,
+        "sections": sections,
+        "metadata": metadata
     }
 
 
@@ -4,8 +4,20 @@ Estimates the severity of environmental issues
 Uses rule-based logic with optional LLM enhancement
 """
 
-from typing import Dict, Any
-from utils.helpers import call_nemotron_llm, extract_text_from_response, parse_json_from_text
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.helpers import (
+    call_nemotron_llm,
+    call_nemotron_llm_async,
+    extract_text_from_response,
+    parse_json_from_text
+)
 
 
 # Severity levels and their definitions
@@ -38,6 +50,62 @@ SEVERITY_LEVELS = {
 }
 
 
+# Rule keywords by the level they trigger, highest level first
+SEVERITY_RULES = {
+    "critical": ("hazardous", "chemical", "toxic", "oil spill", "sewage", "battery", "medical"),
+    "high": ("e-waste", "electronic", "metal", "large amount", "widespread", "river", "water body"),
+    "low": ("minimal", "small", "single item", "paper", "cardboard")
+}
+RULE_SCORES = {"critical": 5, "high": 4, "low": 2}
+
+# Flat keyword table built once, highest level first
+_RULE_KEYWORDS = tuple(
+    (keyword, level) for level, keywords in SEVERITY_RULES.items() for keyword in keywords
+)
+
+_RULE_ORDER = {rule: index for index, rule in enumerate(_RULE_KEYWORDS)}
+
+_SCORE_LEVELS = {5: "critical", 4: "high", 3: "medium", 2: "low", 1: "minimal"}
+
+
+def _scan_rules(text: str) -> list:
+    """(keyword, level) pairs found in lowercased text"""
+    return [(keyword, level) for keyword, level in _RULE_KEYWORDS if keyword in text]
+
+
+@lru_cache(maxsize=4096)
+def _scan_field(value: str) -> Tuple[Tuple[str, str], ...]:
+    """Rules found in a short, frequently repeated field (waste type, tag)"""
+    return tuple(_scan_rules(value.lower()))
+
+
+def match_severity_rules(classification: Dict[str, Any]) -> Dict[str, list]:
+    """
+    Find the severity rules a classification triggers
+    Scans the waste type, description and tags; waste types and tags come
+    from small vocabularies, so their results are memoized
+    
+    Args:
+        classification: Waste classification result
+        
+    Returns:
+        Dict mapping each triggered level ("critical", "high", "low") to
+        the keywords that fired, highest level first
+    """
+    hits = _scan_rules((classification.get("description") or "").lower())
+    hits.extend(_scan_field(classification.get("waste_type") or ""))
+    for tag in classification.get("tags") or ():
+        hits.extend(_scan_field(tag))
+    
+    if len(hits) > 1:
+        hits = sorted(set(hits), key=_RULE_ORDER.__getitem__)
+    
+    matched: Dict[str, list] = {}
+    for keyword, level in hits:
+        matched.setdefault(level, []).append(keyword)
+    return matched
+
+
 def estimate_severity_rule_based(classification: Dict[str, Any]) -> Dict[str, Any]:
     """
     Estimate severity using rule-based logic
@@ -46,54 +114,23 @@ def estimate_severity_rule_based(classification: Dict[str, Any]) -> Dict[str, An
         classification: Waste classification result
         
     Returns:
-        Severity assessment dict
+        Severity assessment dict, including the rules that fired
     """
-    waste_type = classification.get("waste_type", "").lower()
-    confidence = classification.get("confidence", "low").lower()
-    description = classification.get("description", "").lower()
-    tags = [tag.lower() for tag in classification.get("tags", [])]
+    confidence = (classification.get("confidence") or "low").lower()
+    matched = match_severity_rules(classification)
     
-    # Default to medium
+    # Highest triggered level wins; default to medium
     severity_score = 3
-    
-    # Critical keywords
-    critical_keywords = ["hazardous", "chemical", "toxic", "oil spill", "sewage", "battery", "medical"]
-    high_keywords = ["e-waste", "electronic", "metal", "large amount", "widespread", "river", "water body"]
-    low_keywords = ["minimal", "small", "single item", "paper", "cardboard"]
-    
-    # Check for critical severity
-    if any(keyword in waste_type for keyword in critical_keywords):
-        severity_score = 5
-    elif any(keyword in description for keyword in critical_keywords):
-        severity_score = 5
-    
-    # Check for high severity
-    elif "hazardous" in waste_type or any(keyword in waste_type for keyword in high_keywords):
-        severity_score = 4
-    elif any(keyword in description for keyword in high_keywords):
-        severity_score = 4
-    
-    # Check for low severity
-    elif any(keyword in waste_type for keyword in low_keywords):
-        severity_score = 2
-    elif any(keyword in description for keyword in low_keywords):
-        severity_score = 2
+    for level, score in RULE_SCORES.items():
+        if level in matched:
+            severity_score = score
+            break
     
     # Adjust based on confidence
     if confidence == "low":
         severity_score = max(2, severity_score - 1)
     
-    # Determine severity level
-    severity_level = "medium"
-    if severity_score >= 5:
-        severity_level = "critical"
-    elif severity_score >= 4:
-        severity_level = "high"
-    elif severity_score == 2:
-        severity_level = "low"
-    elif severity_score == 1:
-        severity_level = "minimal"
-    
+    severity_level = _SCORE_LEVELS[severity_score]
     severity_info = SEVERITY_LEVELS[severity_level]
     
     return {
@@ -101,29 +138,333 @@ def estimate_severity_rule_based(classification: Dict[str, Any]) -> Dict[str, An
         "severity_score": severity_score,
         "description": severity_info["description"],
         "response_time": severity_info["response_time"],
-        "method": "rule-based"
+        "method": "rule-based",
+        "matched_rules": matched
     }
 
 
-def estimate_severity_with_llm(
+# One bit per rule level for the bulk scorer (low=1, high=2, critical=4)
+_LEVEL_BITS = {level: 1 << index for index, level in enumerate(reversed(SEVERITY_RULES))}
+
+# Score for every combination of level bits: highest triggered level wins
+_BITS_SCORE = np.array(
+    [
+        next((RULE_SCORES[level] for level in SEVERITY_RULES if bits & _LEVEL_BITS[level]), 3)
+        for bits in range(1 << len(SEVERITY_RULES))
+    ],
+    dtype=np.int8
+)
+
+_LEVEL_NAMES = np.array([_SCORE_LEVELS[score] for score in range(1, 6)])
+
+_RULE_BYTES = tuple((keyword.encode("utf-8"), _LEVEL_BITS[level]) for keyword, level in _RULE_KEYWORDS)
+
+# numpy>=2 moved the vectorized string functions to np.strings
+_np_strings = getattr(np, "strings", np.char)
+
+# Descriptions are scanned in chunks so the fixed-width byte arrays stay small
+BULK_CHUNK_SIZE = 65536
+
+
+def _factorize(values: Iterable[Optional[str]], default: str = "") -> Tuple[list, np.ndarray]:
+    """
+    Distinct values of a low-cardinality text column
+    
+    Args:
+        values: Text per row
+        default: Value used for None or empty text
+        
+    Returns:
+        Tuple of (distinct values, index of each row's value)
+    """
+    codes: Dict[str, int] = {}
+    index = np.fromiter(
+        (codes.setdefault(value or default, len(codes)) for value in values), dtype=np.intp
+    )
+    return list(codes), index
+
+
+def _field_bits(values: Iterable[Optional[str]]) -> np.ndarray:
+    """Rule bits per row for a low-cardinality text column (waste type, tag)"""
+    distinct, index = _factorize(values)
+    bits = np.array(
+        [sum({_LEVEL_BITS[level] for _, level in _scan_field(value)}) for value in distinct],
+        dtype=np.uint8
+    )
+    return bits[index]
+
+
+def _description_bits(descriptions: Sequence[Optional[str]]) -> np.ndarray:
+    """Rule bits per row for free-text descriptions, one vectorized search per keyword"""
+    bits = np.zeros(len(descriptions), dtype=np.uint8)
+    for start in range(0, len(descriptions), BULK_CHUNK_SIZE):
+        texts = [text or "" for text in descriptions[start:start + BULK_CHUNK_SIZE]]
+        
+        # Lowercase and encode the chunk in one go; UTF-8 substring search matches
+        # str search exactly and packs 4x tighter than a unicode array
+        joined = "\0".join(texts).lower().encode("utf-8")
+        parts = joined.split(b"\0")
+        if len(parts) != len(texts):
+            # A text contains the separator
+            parts = [text.lower().encode("utf-8") for text in texts]
+        chunk = np.array(parts, dtype=bytes)
+        
+        view = bits[start:start + len(texts)]
+        for keyword, bit in _RULE_BYTES:
+            # Rare keywords are usually absent from the whole chunk
+            if keyword in joined:
+                view[_np_strings.find(chunk, keyword) >= 0] |= bit
+    return bits
+
+
+def estimate_severity_bulk(
+    waste_type: Sequence[Optional[str]],
+    description: Sequence[Optional[str]],
+    confidence: Sequence[Optional[str]],
+    tags: Optional[Sequence[Optional[Iterable[str]]]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Rule-based severity for many classifications at once
+    Gives the same scores and levels as estimate_severity_rule_based, but
+    takes the classifications as columns: waste types, confidences and tags
+    are scored once per distinct value and descriptions are searched with
+    vectorized masks
+    
+    Args:
+        waste_type: Waste type per classification
+        description: Description per classification
+        confidence: Confidence per classification (missing counts as low)
+        tags: Tag list per classification (optional)
+        
+    Returns:
+        Dict with "severity_score" (int8 array) and "severity" (level name array)
+    """
+    count = len(waste_type)
+    if len(description) != count or len(confidence) != count or (tags is not None and len(tags) != count):
+        raise ValueError("All columns must have the same length")
+    
+    bits = _description_bits(description)
+    bits |= _field_bits(waste_type)
+    
+    if tags is not None:
+        lengths = np.fromiter((len(row) if row else 0 for row in tags), dtype=np.intp, count=count)
+        if lengths.any():
+            tag_bits = _field_bits(tag for row in tags if row for tag in row)
+            # Tags are flattened in row order, so each tagged row is one contiguous run
+            tagged = lengths > 0
+            offsets = np.concatenate(([0], np.cumsum(lengths[tagged])[:-1]))
+            bits[tagged] |= np.bitwise_or.reduceat(tag_bits, offsets)
+    
+    scores = _BITS_SCORE[bits]
+    
+    # Same confidence adjustment as the per-dict path
+    distinct, index = _factorize(confidence, default="low")
+    is_low = np.array([value.lower() == "low" for value in distinct], dtype=bool)[index]
+    scores = np.where(is_low, np.maximum(scores - 1, 2), scores).astype(np.int8)
+    
+    return {
+        "severity_score": scores,
+        "severity": _LEVEL_NAMES[scores - 1]
+    }
+
+
+class SeverityGate:
+    """
+    Decides when the rule-based severity is decisive enough to skip the LLM
+    A gate fires when the highest rule level that triggered is one of the
+    gated levels and the classifier reported a trusted confidence; anything
+    else is escalated to the LLM. Escalated calls are timed so the stats can
+    estimate the latency and tokens the gated ones saved.
+    """
+    
+    def __init__(
+        self,
+        levels: Iterable[str] = ("critical",),
+        confidences: Iterable[str] = ("high",)
+    ):
+        """
+        Initialize the gate
+        
+        Args:
+            levels: Rule levels ("critical", "high", "low") whose result is final
+            confidences: Classification confidences trusted enough to gate
+        """
+        self.levels = tuple(level for level in SEVERITY_RULES if level in set(levels))
+        self.confidences = frozenset(confidence.lower() for confidence in confidences)
+        self._lock = threading.Lock()
+        self._stats = {"evaluated": 0, "escalated": 0, "llm_calls": 0, "llm_seconds": 0.0, "llm_tokens": 0}
+        self._hits = {f"{level}_rule": 0 for level in self.levels}
+    
+    def check(self, classification: Dict[str, Any], rule_result: Dict[str, Any]) -> Optional[str]:
+        """
+        Decide whether a rule-based result is final
+        
+        Args:
+            classification: Waste classification result
+            rule_result: Result of estimate_severity_rule_based for it
+            
+        Returns:
+            Name of the gate that fired, or None to escalate to the LLM
+        """
+        matched = rule_result.get("matched_rules") or {}
+        top_level = next((level for level in SEVERITY_RULES if level in matched), None)
+        confidence = (classification.get("confidence") or "low").lower()
+        
+        gate = None
+        if top_level in self.levels and confidence in self.confidences:
+            gate = f"{top_level}_rule"
+        
+        with self._lock:
+            self._stats["evaluated"] += 1
+            if gate is None:
+                self._stats["escalated"] += 1
+            else:
+                self._hits[gate] += 1
+        return gate
+    
+    def record_escalation(self, seconds: float, result: Dict[str, Any]) -> None:
+        """
+        Record the cost of an escalated LLM call
+        
+        Args:
+            seconds: Wall time of the call
+            result: Severity result it produced (cache hits are not counted)
+        """
+        if (result.get("cache") or {}).get("hit"):
+            return
+        tokens = (result.get("usage") or {}).get("total_tokens") or 0
+        with self._lock:
+            self._stats["llm_calls"] += 1
+            self._stats["llm_seconds"] += seconds
+            self._stats["llm_tokens"] += tokens
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get gating statistics
+        
+        Returns:
+            Dict with evaluations, escalations, per-gate hits and hit rates, and
+            the latency and tokens saved, estimated from the escalated calls
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            hits = dict(self._hits)
+        
+        evaluated = stats.pop("evaluated")
+        gated = sum(hits.values())
+        calls = stats.pop("llm_calls")
+        avg_seconds = stats.pop("llm_seconds") / calls if calls else 0.0
+        avg_tokens = stats.pop("llm_tokens") / calls if calls else 0.0
+        
+        return {
+            "evaluated": evaluated,
+            "gated": gated,
+            "escalated": stats["escalated"],
+            "hit_rate": gated / evaluated if evaluated else 0.0,
+            "gates": {
+                name: {"hits": count, "hit_rate": count / evaluated if evaluated else 0.0}
+                for name, count in hits.items()
+            },
+            "avg_llm_seconds": round(avg_seconds, 3),
+            "avg_llm_tokens": round(avg_tokens, 1),
+            "estimated_seconds_saved": round(gated * avg_seconds, 3),
+            "estimated_tokens_saved": round(gated * avg_tokens)
+        }
+
+
+def _env_list(name: str, default: str) -> Tuple[str, ...]:
+    """Comma-separated environment setting as a tuple"""
+    return tuple(item.strip() for item in os.getenv(name, default).split(",") if item.strip())
+
+
+# Gate on critical rules with high classifier confidence unless configured otherwise
+_severity_gate: Optional[SeverityGate] = (
+    SeverityGate(
+        levels=_env_list("ECOAGENT_SEVERITY_GATE_LEVELS", "critical"),
+        confidences=_env_list("ECOAGENT_SEVERITY_GATE_CONFIDENCE", "high")
+    )
+    if os.getenv("ECOAGENT_SEVERITY_GATE", "1") != "0" else None
+)
+
+
+def get_severity_gate() -> Optional[SeverityGate]:
+    """Get the process-wide severity gate (None if disabled)"""
+    return _severity_gate
+
+
+def set_severity_gate(gate: Optional[SeverityGate]) -> None:
+    """
+    Replace the process-wide severity gate
+    
+    Args:
+        gate: Gate to use, or None to always escalate to the LLM
+    """
+    global _severity_gate
+    _severity_gate = gate
+
+
+def _gated_severity(
     classification: Dict[str, Any],
-    location: str = ""
-) -> Dict[str, Any]:
+    use_gate: bool
+) -> Tuple[Optional[SeverityGate], Optional[Dict[str, Any]]]:
     """
-    Estimate severity using LLM reasoning
-    Falls back to rule-based if LLM fails
+    Run the severity gate
     
     Args:
         classification: Waste classification result
-        location: Location of the waste
+        use_gate: Whether gating is allowed for this call
         
     Returns:
-        Severity assessment dict
+        Tuple of (gate consulted or None, final rule-based result or None to escalate)
     """
+    gate = get_severity_gate() if use_gate else None
+    if gate is None:
+        return None, None
     
-    try:
-        # Construct prompt for severity estimation
-        prompt = f"""Assess the severity of this environmental issue:
+    rule_result = estimate_severity_rule_based(classification)
+    name = gate.check(classification, rule_result)
+    if name is None:
+        return gate, None
+    rule_result["gate"] = name
+    return gate, rule_result
+
+
+SEVERITY_MODEL = "nvidia/nvidia-nemotron-nano-9b-v2"
+
+# Schema for guided decoding; output that follows it always parses
+SEVERITY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "severity": {"type": "string", "enum": list(SEVERITY_LEVELS)},
+        "severity_score": {"type": "integer", "minimum": 1, "maximum": 5},
+        "reasoning": {"type": "string"},
+        "health_risk": {"type": "string"},
+        "environmental_impact": {"type": "string"},
+        "urgency_factors": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["severity", "severity_score", "reasoning", "health_risk", "environmental_impact"]
+}
+
+# Use guided JSON for severity estimation unless a call says otherwise
+GUIDED_JSON = os.getenv("ECOAGENT_GUIDED_JSON", "0") == "1"
+
+# Guided output carries no prose or code fences, so it needs far fewer tokens
+SEVERITY_MAX_TOKENS = 1024
+GUIDED_SEVERITY_MAX_TOKENS = 384
+
+
+def _build_severity_prompt(classification: Dict[str, Any], location: str) -> str:
+    """
+    Build the LLM prompt for severity estimation
+    
+    Args:
+        classification: Waste classification result
+        location: Location of the waste
+        
+    Returns:
+        Prompt text
+    """
+    return f"""Assess the severity of this environmental issue:
 
 Waste Type: {classification.get('waste_type')}
 Description: {classification.get('description')}
@@ -149,41 +490,99 @@ Provide your assessment in JSON format:
 
 Be objective and consider public health, environmental impact, and urgency."""
 
+
+def _output_options(guided_json: Optional[bool]) -> Dict[str, Any]:
+    """Pick the token limit and output schema for a severity call"""
+    if guided_json is None:
+        guided_json = GUIDED_JSON
+    if guided_json:
+        return {"max_tokens": GUIDED_SEVERITY_MAX_TOKENS, "json_schema": SEVERITY_SCHEMA}
+    return {"max_tokens": SEVERITY_MAX_TOKENS}
+
+
+def _parse_severity_response(
+    response: Dict[str, Any],
+    classification: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Turn a raw LLM response into a severity assessment
+    Falls back to rule-based if the response is unusable
+    
+    Args:
+        response: API response dictionary
+        classification: Waste classification result
+        
+    Returns:
+        Severity assessment dict, including the number of API attempts made
+    """
+    # Extract and parse response
+    text_response = extract_text_from_response(response)
+    parsed_json = None
+    if not text_response.startswith("ERROR:"):
+        parsed_json = parse_json_from_text(text_response)
+    
+    if parsed_json and "severity" in parsed_json:
+        severity_level = parsed_json.get("severity", "medium")
+        severity_info = SEVERITY_LEVELS.get(severity_level, SEVERITY_LEVELS["medium"])
+        
+        result = {
+            "severity": severity_level,
+            "severity_score": parsed_json.get("severity_score", severity_info["level"]),
+            "description": severity_info["description"],
+            "response_time": severity_info["response_time"],
+            "reasoning": parsed_json.get("reasoning", ""),
+            "health_risk": parsed_json.get("health_risk", "Assessment pending"),
+            "environmental_impact": parsed_json.get("environmental_impact", "Assessment pending"),
+            "urgency_factors": parsed_json.get("urgency_factors", []),
+            "method": "llm-based"
+        }
+    else:
+        # Fallback to rule-based
+        result = estimate_severity_rule_based(classification)
+    
+    result["api_attempts"] = response.get("attempts")
+    if "usage" in response:
+        result["usage"] = response["usage"]
+    if "cache" in response:
+        result["cache"] = response["cache"]
+    return result
+
+
+def estimate_severity_with_llm(
+    classification: Dict[str, Any],
+    location: str = "",
+    deadline: Optional[float] = None,
+    use_cache: bool = True,
+    guided_json: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Estimate severity using LLM reasoning
+    Falls back to rule-based if LLM fails
+    
+    Args:
+        classification: Waste classification result
+        location: Location of the waste
+        deadline: Seconds the LLM call may take, retries included
+        use_cache: Whether a cached LLM response may be reused (when the
+            LLM response cache is enabled)
+        guided_json: Whether to constrain the output to SEVERITY_SCHEMA
+            (defaults to ECOAGENT_GUIDED_JSON)
+        
+    Returns:
+        Severity assessment dict
+    """
+    
+    try:
         # Call Nemotron LLM (using the nano model for faster reasoning)
         response = call_nemotron_llm(
-            prompt=prompt,
-            model="nvidia/nvidia-nemotron-nano-9b-v2",
+            prompt=_build_severity_prompt(classification, location),
+            model=SEVERITY_MODEL,
             temperature=0.3,
-            max_tokens=1024
+            deadline=deadline,
+            use_cache=use_cache,
+            **_output_options(guided_json)
         )
-        
-        # Extract and parse response
-        text_response = extract_text_from_response(response)
-        
-        if text_response.startswith("ERROR:"):
-            # Fallback to rule-based
-            return estimate_severity_rule_based(classification)
-        
-        parsed_json = parse_json_from_text(text_response)
-        
-        if parsed_json and "severity" in parsed_json:
-            severity_level = parsed_json.get("severity", "medium")
-            severity_info = SEVERITY_LEVELS.get(severity_level, SEVERITY_LEVELS["medium"])
-            
-            return {
-                "severity": severity_level,
-                "severity_score": parsed_json.get("severity_score", severity_info["level"]),
-                "description": severity_info["description"],
-                "response_time": severity_info["response_time"],
-                "reasoning": parsed_json.get("reasoning", ""),
-                "health_risk": parsed_json.get("health_risk", "Assessment pending"),
-                "environmental_impact": parsed_json.get("environmental_impact", "Assessment pending"),
-                "urgency_factors": parsed_json.get("urgency_factors", []),
-                "method": "llm-based"
-            }
-        else:
-            # Fallback to rule-based
-            return estimate_severity_rule_based(classification)
+        return _parse_severity_response(response, classification)
             
     except Exception as e:
         # Fallback to rule-based on any error
@@ -192,10 +591,54 @@ Be objective and consider public health, environmental impact, and urgency."""
         return result
 
 
+async def estimate_severity_with_llm_async(
+    classification: Dict[str, Any],
+    location: str = "",
+    deadline: Optional[float] = None,
+    use_cache: bool = True,
+    guided_json: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Async version of estimate_severity_with_llm
+    
+    Args:
+        classification: Waste classification result
+        location: Location of the waste
+        deadline: Seconds the LLM call may take, retries included
+        use_cache: Whether a cached LLM response may be reused (when the
+            LLM response cache is enabled)
+        guided_json: Whether to constrain the output to SEVERITY_SCHEMA
+            (defaults to ECOAGENT_GUIDED_JSON)
+        
+    Returns:
+        Severity assessment dict
+    """
+    
+    try:
+        response = await call_nemotron_llm_async(
+            prompt=_build_severity_prompt(classification, location),
+            model=SEVERITY_MODEL,
+            temperature=0.3,
+            deadline=deadline,
+            use_cache=use_cache,
+            **_output_options(guided_json)
+        )
+        return _parse_severity_response(response, classification)
+            
+    except Exception as e:
+        result = estimate_severity_rule_based(classification)
+        result["llm_error"] = str(e)
+        return result
+
+
 def estimate_severity(
     classification: Dict[str, Any],
     location: str = "",
-    use_llm: bool = True
+    use_llm: bool = True,
+    deadline: Optional[float] = None,
+    use_cache: bool = True,
+    guided_json: Optional[bool] = None,
+    use_gate: bool = True
 ) -> Dict[str, Any]:
     """
     Main function to estimate severity
@@ -204,11 +647,67 @@ def estimate_severity(
         classification: Waste classification result
         location: Location of the waste
         use_llm: Whether to use LLM (defaults to True, falls back to rules)
+        deadline: Seconds the LLM call may take, retries included
+        use_cache: Whether a cached LLM response may be reused (when the
+            LLM response cache is enabled)
+        guided_json: Whether to constrain the output to SEVERITY_SCHEMA
+            (defaults to ECOAGENT_GUIDED_JSON)
+        use_gate: Whether the severity gate may return a decisive rule-based
+            result without calling the LLM
         
     Returns:
         Severity assessment dict
     """
-    if use_llm:
-        return estimate_severity_with_llm(classification, location)
-    else:
+    if not use_llm:
         return estimate_severity_rule_based(classification)
+    
+    gate, decided = _gated_severity(classification, use_gate)
+    if decided is not None:
+        return decided
+    
+    started = time.monotonic()
+    result = estimate_severity_with_llm(classification, location, deadline, use_cache, guided_json)
+    if gate is not None:
+        gate.record_escalation(time.monotonic() - started, result)
+    return result
+
+
+async def estimate_severity_async(
+    classification: Dict[str, Any],
+    location: str = "",
+    use_llm: bool = True,
+    deadline: Optional[float] = None,
+    use_cache: bool = True,
+    guided_json: Optional[bool] = None,
+    use_gate: bool = True
+) -> Dict[str, Any]:
+    """
+    Async version of estimate_severity
+    
+    Args:
+        classification: Waste classification result
+        location: Location of the waste
+        use_llm: Whether to use LLM (defaults to True, falls back to rules)
+        deadline: Seconds the LLM call may take, retries included
+        use_cache: Whether a cached LLM response may be reused (when the
+            LLM response cache is enabled)
+        guided_json: Whether to constrain the output to SEVERITY_SCHEMA
+            (defaults to ECOAGENT_GUIDED_JSON)
+        use_gate: Whether the severity gate may return a decisive rule-based
+            result without calling the LLM
+        
+    Returns:
+        Severity assessment dict
+    """
+    if not use_llm:
+        return estimate_severity_rule_based(classification)
+    
+    gate, decided = _gated_severity(classification, use_gate)
+    if decided is not None:
+        return decided
+    
+    started = time.monotonic()
+    result = await estimate_severity_with_llm_async(classification, location, deadline, use_cache, guided_json)
+    if gate is not None:
+        gate.record_escalation(time.monotonic() - started, result)
+    return result
@@ -3,8 +3,16 @@ Waste Classifier Tool
 Uses NVIDIA Nemotron VLM to classify waste types from images
 """
 
-from typing import Dict, Any
-from utils.helpers import call_nemotron_vlm, extract_text_from_response, parse_json_from_text
+import os
+import hashlib
+from typing import Dict, Any, Optional, Tuple
+from utils.cache import TieredCache
+from utils.helpers import (
+    call_nemotron_vlm,
+    call_nemotron_vlm_async,
+    extract_text_from_response,
+    parse_json_from_text
+)
 
 
 # Waste categories
@@ -25,23 +33,8 @@ WASTE_CATEGORIES = [
 ]
 
 
-def classify_waste(image_base64: str) -> Dict[str, Any]:
-    """
-    Classify waste type from an image using Nemotron VLM
-    
-    Args:
-        image_base64: Base64 encoded image of waste/pollution
-        
-    Returns:
-        Dict containing:
-        - waste_type: Primary waste category
-        - confidence: Confidence level (high/medium/low)
-        - description: Detailed description of what's visible
-        - tags: List of relevant tags
-    """
-    
-    # Construct prompt for waste classification
-    prompt = f"""Analyze this image and identify the type of waste or pollution visible.
+# Prompt for waste classification
+CLASSIFICATION_PROMPT = f"""Analyze this image and identify the type of waste or pollution visible.
 
 Possible categories:
 {chr(10).join(f"- {cat}" for cat in WASTE_CATEGORIES)}
@@ -57,22 +50,254 @@ Provide your analysis in the following JSON format:
 
 Be specific and objective. Focus on observable facts."""
 
+CLASSIFIER_MODEL = "nvidia/llama-3.1-nemotron-nano-vl-8b-v1"
+
+# Bump whenever CLASSIFICATION_PROMPT changes so cached results are not reused
+CLASSIFICATION_PROMPT_VERSION = "1"
+
+# Schema for guided decoding; output that follows it always parses
+CLASSIFICATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "waste_type": {"type": "string", "enum": WASTE_CATEGORIES},
+        "confidence": {"type": "string", "enum": ["high", "medium", "low"]},
+        "description": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "visible_items": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["waste_type", "confidence", "description", "tags", "visible_items"]
+}
+
+# Use guided JSON for classification unless a call says otherwise
+GUIDED_JSON = os.getenv("ECOAGENT_GUIDED_JSON", "0") == "1"
+
+# Guided output carries no prose or code fences, so it needs far fewer tokens
+CLASSIFICATION_MAX_TOKENS = 1024
+GUIDED_CLASSIFICATION_MAX_TOKENS = 384
+
+_classification_cache: Optional[TieredCache] = None
+
+
+def get_classification_cache() -> TieredCache:
+    """
+    Get the process-wide classification cache
+    Set ECOAGENT_CACHE_DIR to add an on-disk SQLite tier behind the in-memory LRU
+    
+    Returns:
+        Shared TieredCache
+    """
+    global _classification_cache
+    if _classification_cache is None:
+        cache_dir = os.getenv("ECOAGENT_CACHE_DIR")
+        _classification_cache = TieredCache(
+            max_entries=int(os.getenv("ECOAGENT_CACHE_MAX_ENTRIES", "256")),
+            ttl=float(os.getenv("ECOAGENT_CACHE_TTL", str(24 * 3600))),
+            disk_path=os.path.join(cache_dir, "classifications.sqlite") if cache_dir else None
+        )
+    return _classification_cache
+
+
+def set_classification_cache(cache: Optional[TieredCache]) -> None:
+    """
+    Replace the process-wide classification cache
+    
+    Args:
+        cache: Cache to use, or None to recreate the default on next use
+    """
+    global _classification_cache
+    _classification_cache = cache
+
+
+def classification_cache_key(image_base64: str, model: str = CLASSIFIER_MODEL) -> str:
+    """
+    Build a content-addressed cache key for a classification request
+    
+    Args:
+        image_base64: Base64 encoded (already normalized) image
+        model: VLM model identifier
+        
+    Returns:
+        Hex digest identifying image + model + prompt version
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{model}\n{CLASSIFICATION_PROMPT_VERSION}\n".encode("utf-8"))
+    digest.update("".join(image_base64.split()).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _cache_lookup(
+    image_base64: str,
+    use_cache: bool
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Look up a classification in the cache
+    
+    Args:
+        image_base64: Base64 encoded image
+        use_cache: Whether caching is enabled for this call
+        
+    Returns:
+        (cached result or None, cache key or None)
+    """
+    if not use_cache:
+        return None, None
+    
+    cache = get_classification_cache()
+    key = classification_cache_key(image_base64)
+    cached, tier = cache.get(key)
+    if cached is None:
+        return None, key
+    
+    cached["cache"] = _cache_info(cache, hit=True, tier=tier)
+    return cached, key
+
+
+def _cache_store(key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a fresh classification in the cache and annotate it with cache info"""
+    if key is None:
+        return result
+    
+    cache = get_classification_cache()
+    if is_reusable_classification(result):
+        cache.set(key, result)
+    result["cache"] = _cache_info(cache, hit=False, tier=None)
+    return result
+
+
+def is_reusable_classification(result: Dict[str, Any]) -> bool:
+    """
+    Whether a classification may be cached or reused for similar images
+    Errors and answers without parseable JSON should be retried, not remembered
+    """
+    return not result.get("error") and not result.get("degraded")
+
+
+def _cache_info(cache: TieredCache, hit: bool, tier: Optional[str]) -> Dict[str, Any]:
+    """Build the cache annotation attached to classification results"""
+    stats = cache.stats()
+    return {
+        "hit": hit,
+        "tier": tier,
+        "hits": stats["hits"],
+        "misses": stats["misses"]
+    }
+
+
+def classify_waste(
+    image_base64: str,
+    use_cache: bool = True,
+    mime_type: str = "image/jpeg",
+    deadline: Optional[float] = None,
+    guided_json: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Classify waste type from an image using Nemotron VLM
+    
+    Args:
+        image_base64: Base64 encoded image of waste/pollution
+        use_cache: Whether to reuse a cached result for the same image
+        mime_type: MIME type of the encoded image
+        deadline: Seconds the VLM call may take, retries included
+            (defaults to the retry policy's deadline)
+        guided_json: Whether to constrain the output to CLASSIFICATION_SCHEMA
+            (defaults to ECOAGENT_GUIDED_JSON)
+        
+    Returns:
+        Dict containing:
+        - waste_type: Primary waste category
+        - confidence: Confidence level (high/medium/low)
+        - description: Detailed description of what's visible
+        - tags: List of relevant tags
+        - cache: Cache hit flag, tier and running hit/miss counters
+    """
+    cached, cache_key = _cache_lookup(image_base64, use_cache)
+    if cached is not None:
+        return cached
+    
     try:
         # Call Nemotron VLM
         response = call_nemotron_vlm(
             image_base64=image_base64,
-            prompt=prompt,
-            model="nvidia/llama-3.1-nemotron-nano-vl-8b-v1",
+            prompt=CLASSIFICATION_PROMPT,
+            model=CLASSIFIER_MODEL,
             temperature=0.2,
-            max_tokens=1024
+            mime_type=mime_type,
+            deadline=deadline,
+            **_output_options(guided_json)
         )
+        return _cache_store(cache_key, _parse_classification_response(response))
+            
+    except Exception as e:
+        return _create_fallback_classification(f"Exception during classification: {str(e)}")
+
+
+async def classify_waste_async(
+    image_base64: str,
+    use_cache: bool = True,
+    mime_type: str = "image/jpeg",
+    deadline: Optional[float] = None,
+    guided_json: Optional[bool] = None
+) -> Dict[str, Any]:
+    """
+    Async version of classify_waste
+    
+    Args:
+        image_base64: Base64 encoded image of waste/pollution
+        use_cache: Whether to reuse a cached result for the same image
+        mime_type: MIME type of the encoded image
+        deadline: Seconds the VLM call may take, retries included
+            (defaults to the retry policy's deadline)
+        guided_json: Whether to constrain the output to CLASSIFICATION_SCHEMA
+            (defaults to ECOAGENT_GUIDED_JSON)
         
-        # Extract text from response
-        text_response = extract_text_from_response(response)
-        
-        if text_response.startswith("ERROR:"):
-            return _create_fallback_classification(text_response)
+    Returns:
+        Classification dict (see classify_waste)
+    """
+    cached, cache_key = _cache_lookup(image_base64, use_cache)
+    if cached is not None:
+        return cached
+    
+    try:
+        response = await call_nemotron_vlm_async(
+            image_base64=image_base64,
+            prompt=CLASSIFICATION_PROMPT,
+            model=CLASSIFIER_MODEL,
+            temperature=0.2,
+            mime_type=mime_type,
+            deadline=deadline,
+            **_output_options(guided_json)
+        )
+        return _cache_store(cache_key, _parse_classification_response(response))
+            
+    except Exception as e:
+        return _create_fallback_classification(f"Exception during classification: {str(e)}")
+
+
+def _output_options(guided_json: Optional[bool]) -> Dict[str, Any]:
+    """Pick the token limit and output schema for a classification call"""
+    if guided_json is None:
+        guided_json = GUIDED_JSON
+    if guided_json:
+        return {"max_tokens": GUIDED_CLASSIFICATION_MAX_TOKENS, "json_schema": CLASSIFICATION_SCHEMA}
+    return {"max_tokens": CLASSIFICATION_MAX_TOKENS}
+
+
+def _parse_classification_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn a raw VLM response into a classification result
+    
+    Args:
+        response: API response dictionary
         
+    Returns:
+        Classification dict, including the number of API attempts made
+    """
+    # Extract text from response
+    text_response = extract_text_from_response(response)
+    
+    if text_response.startswith("ERROR:"):
+        result = _create_fallback_classification(text_response)
+    else:
         # Try to parse JSON
         parsed_json = parse_json_from_text(text_response)
         
@@ -86,20 +311,20 @@ Be specific and objective. Focus on observable facts."""
                 "visible_items": parsed_json.get("visible_items", []),
                 "raw_response": text_response
             }
-            return result
         else:
-            # Fallback: use text response directly
-            return {
+            # Fallback: use text response directly (degraded, so never reused)
+            result = {
                 "waste_type": "General litter/mixed waste",
                 "confidence": "low",
                 "description": text_response,
                 "tags": [],
                 "visible_items": [],
-                "raw_response": text_response
+                "raw_response": text_response,
+                "degraded": True
             }
-            
-    except Exception as e:
-        return _create_fallback_classification(f"Exception during classification: {str(e)}")
+    
+    result["api_attempts"] = response.get("attempts")
+    return result
 
 
 def _create_fallback_classification(error_msg: str) -> Dict[str, Any]:
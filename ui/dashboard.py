@@ -13,6 +13,7 @@ from PIL import Image
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from eco_agent import EcoAgent
+from tools.severity_estimator import SEVERITY_LEVELS
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -74,12 +75,49 @@ def display_sidebar():
             help="Uses LLM reasoning for severity. Uncheck for rule-based estimation."
         )
         
+        stream_report = st.checkbox(
+            "Stream report",
+            value=True,
+            help="Shows the report as it is written instead of waiting for the whole text."
+        )
+        
+        # Streaming runs severity and report one after the other, so there is
+        # nothing to draft in parallel
+        speculative_report = st.checkbox(
+            "Draft report in parallel",
+            value=False,
+            disabled=stream_report,
+            help="Starts the report from the rule-based severity while the AI assesses severity. "
+                 "The draft is kept when both agree, saving a full model round trip. "
+                 "Not available while the report is streamed."
+        )
+        
+        fused_assessment = st.checkbox(
+            "Single-call assessment",
+            value=False,
+            help="Classifies the image and assesses severity in one vision model call, "
+                 "skipping the separate severity round trip."
+        )
+        
+        llm_report_all = st.checkbox(
+            "AI report for every severity",
+            value=False,
+            help="By default only high and critical incidents get an AI-written report; "
+                 "the rest get an instant template report that can be enriched on demand."
+        )
+        
         st.divider()
         
         st.markdown("---")
         st.caption("Built for NVIDIA Hackathon 2025")
         
-        return use_llm_severity
+        return {
+            "use_llm_severity": use_llm_severity,
+            "speculative_report": speculative_report and not stream_report,
+            "fused_assessment": fused_assessment,
+            "llm_report_all": llm_report_all,
+            "stream_report": stream_report
+        }
 
 
 def display_upload_section():
@@ -249,6 +287,16 @@ def display_report_tab(report):
     
     st.divider()
     
+    # Template reports can be rewritten by the LLM on demand
+    if metadata.get("generator") == "template" and not metadata.get("is_fallback"):
+        if st.button("✨ Write detailed report with AI"):
+            with st.spinner("Writing detailed report..."):
+                st.session_state.agent.enrich_report(
+                    st.session_state.analysis_results,
+                    additional_notes=st.session_state.get("additional_notes", "")
+                )
+            st.rerun()
+    
     # Download button for full report
     full_report_text = report.get("full_report", "")
     if full_report_text:
@@ -319,6 +367,8 @@ def display_severity_tab(severity):
         
         st.markdown("**Assessment Method:**")
         st.markdown(f"`{severity.get('method', 'unknown')}`")
+        if severity.get("gate"):
+            st.caption(f"Decisive rule ({severity['gate']}); LLM assessment skipped")
     
     with col2:
         if "health_risk" in severity:
@@ -347,6 +397,43 @@ def display_raw_data_tab(results):
     st.json(results)
 
 
+def run_streaming_analysis(image_bytes, location, additional_notes, use_llm_severity):
+    """Run the analysis, rendering stage progress and the report while it streams"""
+    status = st.status("🔄 Analyzing image...", expanded=True)
+    summary_placeholder = st.empty()
+    text_placeholder = st.empty()
+    report_text = ""
+    results = {}
+    
+    events = st.session_state.agent.analyze_image_stream(
+        image_path_or_bytes=image_bytes,
+        location=location,
+        additional_notes=additional_notes,
+        use_llm_severity=use_llm_severity
+    )
+    for event in events:
+        if event["type"] == "step":
+            status.write(f"✓ {event['step'].capitalize()} complete")
+            if event["step"] == "severity":
+                status.update(label="📝 Writing civic report...")
+        elif event["type"] == "section" and event["name"] == "executive_summary":
+            summary_placeholder.info(f"**Executive Summary:** {event['content']}")
+        elif event["type"] == "delta":
+            report_text += event["text"]
+            text_placeholder.markdown(report_text + "▌")
+        elif event["type"] == "complete":
+            results = event["results"]
+    
+    # The full report is rendered in the results tabs below
+    summary_placeholder.empty()
+    text_placeholder.empty()
+    if results.get("status") == "complete":
+        status.update(label="✅ Analysis complete", state="complete", expanded=False)
+    else:
+        status.update(label="❌ Analysis failed", state="error")
+    return results
+
+
 def main():
     """Main application function"""
     # Initialize
@@ -359,7 +446,10 @@ def main():
         st.stop()
     
     # Sidebar
-    use_llm_severity = display_sidebar()
+    settings = display_sidebar()
+    st.session_state.agent.speculative_report = settings["speculative_report"]
+    st.session_state.agent.fused_assessment = settings["fused_assessment"]
+    st.session_state.agent.llm_report_levels = list(SEVERITY_LEVELS) if settings["llm_report_all"] else None
     
     # Main content
     uploaded_file = display_upload_section()
@@ -376,19 +466,26 @@ def main():
             if not location:
                 st.warning("⚠️ Please provide a location before analyzing.")
             else:
-                with st.spinner("🔄 Analyzing image... This may take 30-60 seconds..."):
-                    # Read image bytes
-                    image_bytes = uploaded_file.read()
-                    
-                    # Run analysis
-                    results = st.session_state.agent.analyze_image(
-                        image_path_or_bytes=image_bytes,
-                        location=location,
-                        additional_notes=additional_notes,
-                        use_llm_severity=use_llm_severity
+                # Read image bytes
+                image_bytes = uploaded_file.read()
+                st.session_state.additional_notes = additional_notes
+                
+                if settings["stream_report"]:
+                    results = run_streaming_analysis(
+                        image_bytes, location, additional_notes, settings["use_llm_severity"]
                     )
-                    
                     st.session_state.analysis_results = results
+                else:
+                    with st.spinner("🔄 Analyzing image... This may take 30-60 seconds..."):
+                        # Run analysis
+                        results = st.session_state.agent.analyze_image(
+                            image_path_or_bytes=image_bytes,
+                            location=location,
+                            additional_notes=additional_notes,
+                            use_llm_severity=settings["use_llm_severity"]
+                        )
+                        
+                        st.session_state.analysis_results = results
         
         # Display results if available
         if st.session_state.analysis_results is not None:
@@ -3,20 +3,92 @@ EcoAgent Utilities Package
 Contains helper functions for NVIDIA API interactions
 """
 
+from .cache import LRUCache, SQLiteCache, TieredCache
+from .image_hash import dhash, hamming_distance, NearDuplicateIndex
+from .preprocessing import ImagePreprocessor
+from .budget import LatencyBudget
+from .singleflight import SingleFlight, request_key
+from .json_extract import JSONObjectScanner, extract_json_object
 from .helpers import (
     get_nvidia_api_key,
+    create_http_session,
+    get_http_session,
+    set_http_session,
+    RetryPolicy,
+    get_retry_policy,
+    set_retry_policy,
+    TokenBucket,
+    RateLimiter,
+    get_rate_limiter,
+    set_rate_limiter,
+    estimate_request_tokens,
+    CircuitBreaker,
+    get_circuit_breaker,
+    configure_circuit_breakers,
+    get_single_flight,
+    set_single_flight,
+    get_llm_response_cache,
+    set_llm_response_cache,
+    sniff_image_format,
+    encode_image,
     encode_image_to_base64,
     call_nemotron_vlm,
     call_nemotron_llm,
+    stream_nemotron_llm,
+    create_async_http_client,
+    get_async_http_client,
+    set_async_http_client,
+    close_async_http_client,
+    call_nemotron_vlm_async,
+    call_nemotron_llm_async,
     extract_text_from_response,
     parse_json_from_text
 )
 
 __all__ = [
+    'LRUCache',
+    'SQLiteCache',
+    'TieredCache',
+    'dhash',
+    'hamming_distance',
+    'NearDuplicateIndex',
+    'ImagePreprocessor',
+    'LatencyBudget',
+    'SingleFlight',
+    'request_key',
+    'JSONObjectScanner',
+    'extract_json_object',
     'get_nvidia_api_key',
+    'create_http_session',
+    'get_http_session',
+    'set_http_session',
+    'RetryPolicy',
+    'get_retry_policy',
+    'set_retry_policy',
+    'TokenBucket',
+    'RateLimiter',
+    'get_rate_limiter',
+    'set_rate_limiter',
+    'estimate_request_tokens',
+    'CircuitBreaker',
+    'get_circuit_breaker',
+    'configure_circuit_breakers',
+    'get_single_flight',
+    'set_single_flight',
+    'get_llm_response_cache',
+    'set_llm_response_cache',
+    'sniff_image_format',
+    'encode_image',
     'encode_image_to_base64',
     'call_nemotron_vlm',
     'call_nemotron_llm',
+    'stream_nemotron_llm',
+    'create_async_http_client',
+    'get_async_http_client',
+    'set_async_http_client',
+    'close_async_http_client',
+    'call_nemotron_vlm_async',
+    'call_nemotron_llm_async',
     'extract_text_from_response',
     'parse_json_from_text'
 ]
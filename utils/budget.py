@@ -0,0 +1,128 @@
+"""
+Latency Budgets
+Splits an end-to-end time budget across the pipeline stages
+"""
+
+import time
+from typing import Dict, Any, Iterable, Optional
+
+
+PIPELINE_STAGES = ("encoding", "classification", "severity", "report")
+
+# Relative share of the budget each stage may claim; time a stage leaves
+# unused rolls over to the stages after it
+DEFAULT_STAGE_WEIGHTS = {
+    "encoding": 0.05,
+    "classification": 0.45,
+    "severity": 0.15,
+    "report": 0.35
+}
+
+
+class LatencyBudget:
+    """
+    End-to-end latency budget for one analysis
+    Each stage is allotted its weighted share of whatever time remains, so a
+    fast stage leaves more for the next one and a slow one squeezes the rest
+    """
+
+    def __init__(
+        self,
+        total: Optional[float],
+        weights: Optional[Dict[str, float]] = None,
+        min_stage_seconds: float = 1.0
+    ):
+        """
+        Initialize the budget; the clock starts immediately
+
+        Args:
+            total: Total seconds for the whole pipeline (None for unlimited)
+            weights: Relative stage shares (defaults to DEFAULT_STAGE_WEIGHTS)
+            min_stage_seconds: Smallest allotment worth spending on a model call;
+                below it a stage should take its cheaper path
+        """
+        self.total = total
+        self.weights = dict(weights or DEFAULT_STAGE_WEIGHTS)
+        self.min_stage_seconds = min_stage_seconds
+        self.started = time.monotonic()
+        self._stages: Dict[str, Dict[str, Any]] = {}
+
+    def elapsed(self) -> float:
+        """Seconds since the budget started"""
+        return time.monotonic() - self.started
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget (None if unlimited)"""
+        if self.total is None:
+            return None
+        return max(0.0, self.total - self.elapsed())
+
+    def start(self, stage: str) -> None:
+        """Record the start of a stage without allotting it a share"""
+        self._stages.setdefault(stage, {})["started"] = self.elapsed()
+
+    def allot(self, stage: str, absorb: Iterable[str] = ()) -> Optional[float]:
+        """
+        Start a stage and compute its deadline
+
+        Args:
+            stage: Stage name from PIPELINE_STAGES
+            absorb: Later stages whose work this stage does as well (e.g. a
+                classification call that also assesses severity); their
+                shares are added to this stage's
+
+        Returns:
+            Seconds the stage may use (None if unlimited)
+        """
+        self.start(stage)
+        record = self._stages[stage]
+
+        remaining = self.remaining()
+        if remaining is None:
+            return None
+
+        if stage in PIPELINE_STAGES:
+            later = PIPELINE_STAGES[PIPELINE_STAGES.index(stage):]
+        else:
+            later = (stage,)
+        total_weight = sum(self.weights.get(name, 0.0) for name in later)
+        weight = sum(self.weights.get(name, 0.0) for name in (stage, *absorb))
+        share = min(1.0, weight / total_weight) if total_weight else 1.0
+
+        allotted = remaining * share
+        record["allotted"] = round(allotted, 3)
+        return allotted
+
+    def affords(self, allotted: Optional[float]) -> bool:
+        """Whether an allotment is large enough for a model call"""
+        return allotted is None or allotted >= self.min_stage_seconds
+
+    def finish(self, stage: str, degraded: bool = False) -> None:
+        """
+        Record the end of a stage
+
+        Args:
+            stage: Stage name
+            degraded: Whether the stage took its cheaper path for lack of time
+        """
+        record = self._stages.setdefault(stage, {"started": self.elapsed()})
+        record["elapsed"] = round(self.elapsed() - record["started"], 3)
+        record["degraded"] = degraded
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get the budget usage
+
+        Returns:
+            Dict with total, elapsed and remaining seconds and per-stage records
+        """
+        remaining = self.remaining()
+        stages = {}
+        for name, record in self._stages.items():
+            stages[name] = {key: value for key, value in record.items() if key != "started"}
+        return {
+            "total": self.total,
+            "elapsed": round(self.elapsed(), 3),
+            "remaining": round(remaining, 3) if remaining is not None else None,
+            "stages": stages
+        }
@@ -0,0 +1,236 @@
+"""
+Caching Helpers
+In-memory LRU and on-disk SQLite caches for model results
+"""
+
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory LRU cache with optional TTL
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of entries before evicting the least recently used
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            created, value = entry
+            if self.ttl is not None and time.time() - created > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting old entries if needed"""
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache:
+    """
+    On-disk cache of JSON-serializable values backed by SQLite
+    Entries are evicted by TTL and least-recent access once max_entries is exceeded
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl: Optional[float] = None):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            max_entries: Maximum number of entries kept on disk
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON cache (accessed)")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+
+            self._conn.execute("UPDATE cache SET accessed = ? WHERE key = ?", (now, key))
+
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting expired and least recently used entries"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now)
+            )
+            if self.ttl is not None:
+                self._conn.execute("DELETE FROM cache WHERE created < ?", (now - self.ttl,))
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCache:
+    """
+    Two-tier cache: an in-memory LRU in front of an optional SQLite store
+    Values are copied on the way in and out so callers can mutate them freely
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl: Optional[float] = None,
+        disk_path: Optional[str] = None,
+        disk_max_entries: int = 10000
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: In-memory LRU capacity
+            ttl: Seconds an entry stays valid in either tier (None for no expiry)
+            disk_path: SQLite file for the on-disk tier (None to disable it)
+            disk_max_entries: On-disk tier capacity
+        """
+        self.memory = LRUCache(max_entries=max_entries, ttl=ttl)
+        self.disk = SQLiteCache(disk_path, max_entries=disk_max_entries, ttl=ttl) if disk_path else None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0}
+
+    def get(self, key: str) -> Tuple[Optional[Any], Optional[str]]:
+        """
+        Look up a key in both tiers
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (value, tier) where tier is "memory", "disk" or None on a miss
+        """
+        value = self.memory.get(key)
+        tier = "memory" if value is not None else None
+
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                tier = "disk"
+                self.memory.set(key, value)
+
+        with self._lock:
+            if tier is None:
+                self._stats["misses"] += 1
+            else:
+                self._stats["hits"] += 1
+                self._stats[f"{tier}_hits"] += 1
+
+        return copy.deepcopy(value), tier
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value in both tiers"""
+        value = copy.deepcopy(value)
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers and reset statistics"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hit/miss counters, hit rate and tier sizes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["memory_size"] = len(self.memory)
+        if self.disk is not None:
+            stats["disk_size"] = len(self.disk)
+        return stats
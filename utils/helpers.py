@@ -6,11 +6,45 @@ Handles all API calls to NVIDIA Nemotron models
 import os
 import json
 import base64
+import time
+import random
+import asyncio
+import threading
+import weakref
+import httpx
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Iterator, Optional, Tuple
+from collections import deque
 from io import BytesIO
+from email.utils import parsedate_to_datetime
 from PIL import Image
 
+from .cache import TieredCache
+from .image_hash import dhash
+from .json_extract import extract_json_object
+from .singleflight import SingleFlight, request_key
+
+
+NVIDIA_API_URL = "https://integrate.api.nvidia.com/v1/chat/completions"
+
+# Statuses worth retrying: timeouts, rate limits and transient server errors
+RETRYABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+# Rough token cost of one image in a VLM request, for rate limiting
+IMAGE_TOKEN_ESTIMATE = 1024
+
+# Connection pool defaults (overridable via environment variables)
+DEFAULT_POOL_CONNECTIONS = int(os.getenv("ECOAGENT_HTTP_POOL_CONNECTIONS", "4"))
+DEFAULT_POOL_MAXSIZE = int(os.getenv("ECOAGENT_HTTP_POOL_MAXSIZE", "16"))
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+# One async client per event loop, since httpx pools are loop-bound
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_async_client_override: Optional[httpx.AsyncClient] = None
+
 
 def get_nvidia_api_key() -> str:
     """Get NVIDIA API key from environment variables"""
@@ -20,75 +54,1248 @@ def get_nvidia_api_key() -> str:
     return api_key
 
 
-def encode_image_to_base64(image_path_or_bytes) -> str:
+def create_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False
+) -> requests.Session:
+    """
+    Create a keep-alive HTTP session with a bounded connection pool
+    
+    Args:
+        pool_connections: Number of per-host pools to keep
+        pool_maxsize: Maximum idle connections kept open per host
+        pool_block: Whether to wait for a free connection instead of
+            opening more than pool_maxsize connections to one host; requests
+            has no pool timeout, so a leaked connection would block forever
+        
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session used for all NVIDIA API calls
+    The session is created lazily on first use
+    
+    Returns:
+        Shared requests.Session
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = create_http_session()
+    return _http_session
+
+
+def set_http_session(session: Optional[requests.Session]) -> None:
+    """
+    Replace the process-wide HTTP session (e.g. with a mock in tests)
+    
+    Args:
+        session: Session to use, or None to reset to a fresh default session
+    """
+    global _http_session
+    with _http_session_lock:
+        previous = _http_session
+        _http_session = session
+    if previous is not None and previous is not session:
+        previous.close()
+
+
+def _auth_headers() -> Dict[str, str]:
+    """Build request headers for the NVIDIA API"""
+    return {
+        "Authorization": f"Bearer {get_nvidia_api_key()}",
+        "Content-Type": "application/json"
+    }
+
+
+class RetryPolicy:
+    """
+    Retry policy for NVIDIA API calls
+    Retries rate limits, transient server errors and connection failures
+    with capped exponential backoff and full jitter, honoring Retry-After,
+    within an optional total deadline per call
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+        retry_statuses: Tuple[int, ...] = RETRYABLE_STATUS_CODES
+    ):
+        """
+        Initialize the policy
+        
+        Args:
+            max_attempts: Maximum attempts per call (1 disables retries)
+            backoff_base: Delay before the first retry, doubled for each retry
+            backoff_max: Upper bound for a single backoff delay
+            jitter: Whether to randomize delays (full jitter)
+            deadline: Total seconds allowed per call across all attempts
+            retry_statuses: HTTP status codes that are retried
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+    
+    def backoff(self, attempt: int) -> float:
+        """Delay in seconds after the given (1-based) failed attempt"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+    
+    def next_delay(
+        self,
+        attempt: int,
+        status_code: Optional[int],
+        retry_after: Optional[float],
+        remaining: Optional[float]
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt
+        
+        Args:
+            attempt: Number of attempts made so far
+            status_code: HTTP status of the failure (None for connection errors)
+            retry_after: Server-requested delay in seconds, if any
+            remaining: Seconds left before the deadline (None for no deadline)
+            
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status_code is not None and status_code not in self.retry_statuses:
+            return None
+        
+        delay = self.backoff(attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+
+
+_retry_policy = RetryPolicy(
+    max_attempts=int(os.getenv("ECOAGENT_MAX_ATTEMPTS", "3")),
+    deadline=float(os.getenv("ECOAGENT_STAGE_DEADLINE", "120"))
+)
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Get the process-wide retry policy"""
+    return _retry_policy
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """
+    Replace the process-wide retry policy
+    
+    Args:
+        policy: Policy used by all NVIDIA API calls that don't pass their own
+    """
+    global _retry_policy
+    _retry_policy = policy
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at a per-minute rate
+    Callers reserve capacity up front and wait the returned delay, so the
+    same bucket serves blocking and asyncio code and grants are FIFO
+    """
+    
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket
+        
+        Args:
+            per_minute: Sustained refill rate per minute
+            capacity: Maximum burst size (defaults to one minute of quota)
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Reserve capacity, possibly borrowing against future refills
+        
+        Args:
+            amount: Units to take from the bucket
+            
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def refund(self, amount: float = 1.0) -> None:
+        """
+        Return capacity from a reservation that will not be used
+        
+        Args:
+            amount: Units previously reserved
+        """
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with requests-per-minute and tokens-per-minute
+    buckets for each model id
+    """
+    
+    def __init__(self, default_rpm: Optional[float] = None, default_tpm: Optional[float] = None):
+        """
+        Initialize the limiter
+        
+        Args:
+            default_rpm: Requests per minute for models without explicit limits
+            default_tpm: Tokens per minute for models without explicit limits
+        """
+        self.default_rpm = default_rpm
+        self.default_tpm = default_tpm
+        self._limits: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        self._buckets: Dict[str, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+        self._lock = threading.Lock()
+    
+    def configure(self, model: str, rpm: Optional[float] = None, tpm: Optional[float] = None) -> None:
+        """
+        Set the quota for one model (None leaves that dimension unlimited)
+        
+        Args:
+            model: Model identifier
+            rpm: Requests per minute
+            tpm: Tokens per minute (prompt + completion)
+        """
+        with self._lock:
+            self._limits[model] = (rpm, tpm)
+            self._buckets.pop(model, None)
+    
+    def reserve(self, model: str, tokens: int, max_wait: Optional[float] = None) -> float:
+        """
+        Reserve one request and its tokens for a model
+        
+        Args:
+            model: Model identifier
+            tokens: Estimated tokens for the request
+            max_wait: Longest acceptable wait; a longer one is returned without
+                keeping the reservation, so an abandoned call costs no quota
+            
+        Returns:
+            Seconds to wait before sending the request
+        """
+        request_bucket, token_bucket = self._buckets_for(model)
+        delay = 0.0
+        if request_bucket is not None:
+            delay = max(delay, request_bucket.reserve(1))
+        if token_bucket is not None:
+            delay = max(delay, token_bucket.reserve(tokens))
+        if max_wait is not None and delay >= max_wait:
+            if request_bucket is not None:
+                request_bucket.refund(1)
+            if token_bucket is not None:
+                token_bucket.refund(tokens)
+        return delay
+    
+    def acquire(self, model: str, tokens: int) -> float:
+        """Block until a request may be sent; returns the time waited"""
+        delay = self.reserve(model, tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+    
+    async def acquire_async(self, model: str, tokens: int) -> float:
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self.reserve(model, tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+    
+    def _buckets_for(self, model: str) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+        """Get or lazily create the buckets for a model"""
+        with self._lock:
+            buckets = self._buckets.get(model)
+            if buckets is None:
+                rpm, tpm = self._limits.get(model, (self.default_rpm, self.default_tpm))
+                buckets = (
+                    TokenBucket(rpm) if rpm else None,
+                    TokenBucket(tpm) if tpm else None
+                )
+                self._buckets[model] = buckets
+            return buckets
+
+
+def _optional_float_env(name: str, default: Optional[str] = None) -> Optional[float]:
+    """Read a float from the environment; empty or "0" means unset"""
+    value = os.getenv(name, default)
+    return float(value) if value and float(value) > 0 else None
+
+
+_rate_limiter: Optional[RateLimiter] = RateLimiter(
+    default_rpm=_optional_float_env("ECOAGENT_RPM", "40"),
+    default_tpm=_optional_float_env("ECOAGENT_TPM")
+)
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get the process-wide rate limiter (None when limiting is disabled)"""
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """
+    Replace the process-wide rate limiter
+    
+    Args:
+        limiter: Limiter shared by all NVIDIA API calls, or None to disable limiting
+    """
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def estimate_request_tokens(payload: Dict[str, Any]) -> int:
+    """
+    Roughly estimate the tokens a chat completion will consume
+    Uses ~4 characters per text token, a flat cost per image and the
+    full max_tokens budget for the completion
+    
+    Args:
+        payload: Request body
+        
+    Returns:
+        Estimated prompt + completion tokens
+    """
+    tokens = payload.get("max_tokens", 0)
+    for message in payload.get("messages", []):
+        content = message.get("content", "")
+        if isinstance(content, str):
+            tokens += len(content) // 4
+            continue
+        for part in content:
+            if part.get("type") == "text":
+                tokens += len(part.get("text", "")) // 4
+            elif part.get("type") == "image_url":
+                tokens += IMAGE_TOKEN_ESTIMATE
+    return tokens
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for one model endpoint
+    
+    closed:    calls flow; outcomes are tracked over a sliding window
+    open:      calls fail fast until reset_timeout has passed
+    half_open: a limited number of trial calls decide whether to close again;
+               a trial that reports nothing within trial_timeout reopens it
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        window: int = 20,
+        failure_threshold: float = 0.5,
+        min_calls: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        trial_timeout: float = 120.0
+    ):
+        """
+        Initialize the breaker
+        
+        Args:
+            window: Number of recent calls considered
+            failure_threshold: Failure ratio within the window that opens the circuit
+            min_calls: Calls required in the window before the ratio is trusted
+            reset_timeout: Seconds to stay open before allowing trial calls
+            half_open_max_calls: Concurrent trial calls allowed while half-open
+            trial_timeout: Seconds after which an unreported trial call is
+                presumed lost; must exceed the call deadline, or slow but
+                healthy trials keep the circuit open
+        """
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.trial_timeout = trial_timeout
+        self._outcomes: "deque[bool]" = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout passes"""
+        with self._lock:
+            self._refresh()
+            return self._state
+    
+    def allow_request(self) -> bool:
+        """Whether a call may be attempted now"""
+        with self._lock:
+            self._refresh()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                self._trial_started = time.monotonic()
+                return True
+            return False
+    
+    def record(self, failed: bool) -> None:
+        """
+        Record the outcome of a call
+        
+        Args:
+            failed: Whether the call failed in a way that indicates a degraded model
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trial_calls = max(0, self._trial_calls - 1)
+                if failed:
+                    self._trip()
+                else:
+                    self._state = self.CLOSED
+                    self._outcomes.clear()
+                return
+            
+            self._outcomes.append(failed)
+            failures = sum(self._outcomes)
+            if (
+                self._state == self.CLOSED
+                and len(self._outcomes) >= self.min_calls
+                and failures / len(self._outcomes) >= self.failure_threshold
+            ):
+                self._trip()
+    
+    def release(self) -> None:
+        """Give back a trial slot for a call that ended without a verdict on the model"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trial_calls = max(0, self._trial_calls - 1)
+    
+    def reset(self) -> None:
+        """Close the circuit and forget past outcomes"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._outcomes.clear()
+            self._trial_calls = 0
+    
+    def _trip(self) -> None:
+        """Open the circuit (caller holds the lock)"""
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._trial_calls = 0
+    
+    def _refresh(self) -> None:
+        """
+        Move from open to half-open after the reset timeout, and back to open
+        when the trial calls have not reported within the trial timeout
+        (caller holds the lock)
+        """
+        now = time.monotonic()
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_calls = 0
+        elif (
+            self._state == self.HALF_OPEN
+            and self._trial_calls > 0
+            and now - self._trial_started >= self.trial_timeout
+        ):
+            self._trip()
+
+
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+_circuit_breaker_options: Dict[str, Any] = {
+    "failure_threshold": float(os.getenv("ECOAGENT_BREAKER_FAILURE_RATIO", "0.5")),
+    "reset_timeout": float(os.getenv("ECOAGENT_BREAKER_RESET_TIMEOUT", "30")),
+    # Trials run under the stage deadline, so only one that outlives it is lost
+    "trial_timeout": float(
+        os.getenv("ECOAGENT_BREAKER_TRIAL_TIMEOUT", os.getenv("ECOAGENT_STAGE_DEADLINE", "120"))
+    )
+}
+
+
+def get_circuit_breaker(model: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker for a model id, creating it on first use
+    
+    Args:
+        model: Model identifier
+        
+    Returns:
+        CircuitBreaker shared by all calls to that model
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(model)
+        if breaker is None:
+            breaker = CircuitBreaker(**_circuit_breaker_options)
+            _circuit_breakers[model] = breaker
+        return breaker
+
+
+def configure_circuit_breakers(**options) -> None:
+    """
+    Set CircuitBreaker options for all models and reset existing breakers
+    
+    Args:
+        **options: Keyword arguments for CircuitBreaker
+    """
+    global _circuit_breaker_options
+    with _circuit_breakers_lock:
+        _circuit_breaker_options = dict(options)
+        _circuit_breakers.clear()
+
+
+def _counts_as_failure(result: Dict[str, Any]) -> bool:
+    """
+    Whether a call result indicates a degraded endpoint
+    Client errors such as 400/401 reflect the request, and 429 the quota,
+    not the model's health
+    """
+    if not result.get("error"):
+        return False
+    status_code = result.get("status_code")
+    return status_code is None or (status_code in RETRYABLE_STATUS_CODES and status_code != 429)
+
+
+def _settle_breaker(breaker: CircuitBreaker, result: Optional[Dict[str, Any]]) -> None:
+    """
+    Report a finished call to its breaker
+    Calls that never reached the model (rate-limit wait or deadline spent
+    before the first attempt, or an exception) and calls refused for quota
+    (429, the rate limiter's concern) only give back their trial slot
+    """
+    if result is None or result.get("attempts") == 0 or result.get("status_code") == 429:
+        breaker.release()
+    else:
+        breaker.record(_counts_as_failure(result))
+
+
+def _circuit_open(error_label: str, model: str) -> Dict[str, Any]:
+    """Build the error dict returned when a call is short-circuited"""
+    return {
+        "error": True,
+        "message": f"{error_label} API call skipped: circuit open for {model}",
+        "status_code": None,
+        "attempts": 0,
+        "circuit_open": True
+    }
+
+
+# Concurrent identical requests share one call unless ECOAGENT_SINGLE_FLIGHT=0
+_single_flight: Optional[SingleFlight] = (
+    SingleFlight() if os.getenv("ECOAGENT_SINGLE_FLIGHT", "1") != "0" else None
+)
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """Get the process-wide request coalescer (None if disabled)"""
+    return _single_flight
+
+
+def set_single_flight(flight: Optional[SingleFlight]) -> None:
+    """
+    Replace the process-wide request coalescer
+    
+    Args:
+        flight: SingleFlight to use, or None to disable coalescing
+    """
+    global _single_flight
+    _single_flight = flight
+
+
+# Opt-in LLM response cache; only near-deterministic calls are cached
+LLM_CACHE_MAX_TEMPERATURE = float(os.getenv("ECOAGENT_LLM_CACHE_MAX_TEMPERATURE", "0.3"))
+
+_llm_response_cache: Optional[TieredCache] = None
+_llm_response_cache_loaded = False
+
+
+def get_llm_response_cache() -> Optional[TieredCache]:
+    """
+    Get the process-wide LLM response cache
+    Disabled unless ECOAGENT_LLM_CACHE_DIR is set (or a cache is installed
+    with set_llm_response_cache); ECOAGENT_LLM_CACHE_TTL and
+    ECOAGENT_LLM_CACHE_MAX_ENTRIES bound its age and on-disk size
+    
+    Returns:
+        Shared TieredCache, or None if response caching is off
+    """
+    global _llm_response_cache, _llm_response_cache_loaded
+    if not _llm_response_cache_loaded:
+        _llm_response_cache_loaded = True
+        cache_dir = os.getenv("ECOAGENT_LLM_CACHE_DIR")
+        if cache_dir:
+            _llm_response_cache = TieredCache(
+                max_entries=256,
+                ttl=float(os.getenv("ECOAGENT_LLM_CACHE_TTL", str(7 * 24 * 3600))),
+                disk_path=os.path.join(cache_dir, "llm_responses.sqlite"),
+                disk_max_entries=int(os.getenv("ECOAGENT_LLM_CACHE_MAX_ENTRIES", "10000"))
+            )
+    return _llm_response_cache
+
+
+def set_llm_response_cache(cache: Optional[TieredCache]) -> None:
+    """
+    Replace the process-wide LLM response cache
+    
+    Args:
+        cache: Cache to use, or None to turn response caching off
+    """
+    global _llm_response_cache, _llm_response_cache_loaded
+    _llm_response_cache = cache
+    _llm_response_cache_loaded = True
+
+
+def _llm_cache_lookup(
+    payload: Dict[str, Any],
+    use_cache: bool
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Look up an LLM response in the response cache
+    
+    Args:
+        payload: Request body
+        use_cache: Whether caching is allowed for this call
+        
+    Returns:
+        (cached response or None, cache key or None if the call is not cacheable)
+    """
+    if not use_cache or payload.get("temperature", 1.0) > LLM_CACHE_MAX_TEMPERATURE:
+        return None, None
+    
+    cache = get_llm_response_cache()
+    if cache is None:
+        return None, None
+    
+    key = request_key(payload)
+    cached, tier = cache.get(key)
+    if cached is None:
+        return None, key
+    
+    cached["attempts"] = 0
+    cached["cache"] = {"hit": True, "tier": tier}
+    return cached, key
+
+
+def _llm_cache_store(key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a successful LLM response in the response cache"""
+    cache = get_llm_response_cache()
+    if key is None or cache is None:
+        return result
+    
+    if not result.get("error"):
+        cache.set(key, result)
+    result["cache"] = {"hit": False, "tier": None}
+    return result
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP date)
+    
+    Args:
+        value: Header value
+        
+    Returns:
+        Delay in seconds, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _call_failed(error_label: str, error: Exception, status_code: Optional[int], attempts: int) -> Dict[str, Any]:
+    """Build the error dict returned when a call finally fails"""
+    return {
+        "error": True,
+        "message": f"{error_label} API call failed: {str(error)}",
+        "status_code": status_code,
+        "attempts": attempts
+    }
+
+
+def _deadline_exceeded(error_label: str, attempts: int) -> Dict[str, Any]:
+    """Build the error dict returned when a call runs out of time"""
+    return {
+        "error": True,
+        "message": f"{error_label} API call failed: deadline exceeded after {attempts} attempt(s)",
+        "status_code": None,
+        "attempts": attempts
+    }
+
+
+def _send_with_retries(
+    payload: Dict[str, Any],
+    error_label: str,
+    session: Optional[requests.Session] = None,
+    timeout: float = 60,
+    retry_policy: Optional[RetryPolicy] = None,
+    deadline: Optional[float] = None,
+    stream: bool = False
+) -> Dict[str, Any]:
+    """
+    POST a chat completion payload to the NVIDIA API, retrying transient failures
+    Every attempt first waits for the model's client-side rate limit
+    
+    Args:
+        payload: Request body
+        error_label: Prefix for error messages (e.g. "VLM", "LLM")
+        session: Session to use (defaults to the shared session)
+        timeout: Per-attempt request timeout in seconds
+        retry_policy: Retry policy (defaults to the process-wide policy)
+        deadline: Total seconds for all attempts (defaults to the policy's deadline)
+        stream: Return the open response under "stream" instead of parsing it;
+            only establishing the stream is retried
+        
+    Returns:
+        Parsed JSON response or an error dict, both with an "attempts" count
+    """
+    headers = _auth_headers()
+    http = session or get_http_session()
+    policy = retry_policy or get_retry_policy()
+    deadline = deadline if deadline is not None else policy.deadline
+    limiter = get_rate_limiter()
+    tokens = estimate_request_tokens(payload) if limiter is not None else 0
+    start = time.monotonic()
+    attempt = 0
+    
+    while True:
+        remaining = None if deadline is None else deadline - (time.monotonic() - start)
+        if remaining is not None and remaining <= 0:
+            return _deadline_exceeded(error_label, attempt)
+        
+        if limiter is not None:
+            wait = limiter.reserve(payload.get("model", ""), tokens, max_wait=remaining)
+            if remaining is not None and wait >= remaining:
+                return _deadline_exceeded(error_label, attempt)
+            if wait > 0:
+                time.sleep(wait)
+            remaining = None if deadline is None else deadline - (time.monotonic() - start)
+        
+        attempt += 1
+        attempt_timeout = timeout if remaining is None else min(timeout, remaining)
+        status_code = None
+        retry_after = None
+        
+        try:
+            response = http.post(
+                NVIDIA_API_URL, headers=headers, json=payload, timeout=attempt_timeout, stream=stream
+            )
+            response.raise_for_status()
+            if stream:
+                return {"stream": response, "attempts": attempt}
+            result = response.json()
+            result["attempts"] = attempt
+            return result
+        except requests.exceptions.RequestException as e:
+            error = e
+            if e.response is not None:
+                status_code = e.response.status_code
+                retry_after = _parse_retry_after(e.response.headers.get("Retry-After"))
+                if stream:
+                    # A streamed error body is never read, so release its connection
+                    e.response.close()
+            elif not isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                return _call_failed(error_label, e, None, attempt)
+        
+        remaining = None if deadline is None else deadline - (time.monotonic() - start)
+        delay = policy.next_delay(attempt, status_code, retry_after, remaining)
+        if delay is None:
+            return _call_failed(error_label, error, status_code, attempt)
+        time.sleep(delay)
+
+
+def _send_through_breaker(
+    payload: Dict[str, Any],
+    error_label: str,
+    session: Optional[requests.Session] = None,
+    timeout: float = 60,
+    retry_policy: Optional[RetryPolicy] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    POST a chat completion through the model's circuit breaker
+    While the breaker is open the call fails immediately, so callers drop
+    straight into their fallback paths instead of waiting on a degraded model
+    
+    Args:
+        payload: Request body
+        error_label: Prefix for error messages (e.g. "VLM", "LLM")
+        session: Session to use (defaults to the shared session)
+        timeout: Per-attempt request timeout in seconds
+        retry_policy: Retry policy (defaults to the process-wide policy)
+        deadline: Total seconds for all attempts (defaults to the policy's deadline)
+        
+    Returns:
+        Parsed JSON response or an error dict
+    """
+    model = payload.get("model", "")
+    breaker = get_circuit_breaker(model)
+    if not breaker.allow_request():
+        return _circuit_open(error_label, model)
+    
+    result = None
+    try:
+        result = _send_with_retries(payload, error_label, session, timeout, retry_policy, deadline)
+        return result
+    finally:
+        _settle_breaker(breaker, result)
+
+
+def _post_chat_completion(
+    payload: Dict[str, Any],
+    error_label: str,
+    session: Optional[requests.Session] = None,
+    timeout: float = 60,
+    retry_policy: Optional[RetryPolicy] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    POST a chat completion, sharing one request between concurrent identical payloads
+    A caller that joins another's request still gives up at its own deadline
+    
+    Args:
+        payload: Request body
+        error_label: Prefix for error messages (e.g. "VLM", "LLM")
+        session: Session to use (defaults to the shared session)
+        timeout: Per-attempt request timeout in seconds
+        retry_policy: Retry policy (defaults to the process-wide policy)
+        deadline: Total seconds for all attempts (defaults to the policy's deadline)
+        
+    Returns:
+        Parsed JSON response or an error dict
+    """
+    flight = get_single_flight()
+    if flight is None:
+        return _send_through_breaker(payload, error_label, session, timeout, retry_policy, deadline)
+    if deadline is None:
+        deadline = (retry_policy or get_retry_policy()).deadline
+    try:
+        return flight.do(
+            request_key(payload),
+            lambda: _send_through_breaker(payload, error_label, session, timeout, retry_policy, deadline),
+            timeout=deadline
+        )
+    except TimeoutError:
+        return _deadline_exceeded(error_label, 0)
+
+
+# Image normalization defaults
+MAX_IMAGE_SIZE = 1024
+DEFAULT_JPEG_QUALITY = int(os.getenv("ECOAGENT_JPEG_QUALITY", "85"))
+MIN_JPEG_QUALITY = 40
+MIN_IMAGE_SIZE = 256
+
+# Maximum base64 payload size sent to the VLM (0 disables the budget)
+DEFAULT_MAX_PAYLOAD_BYTES = int(os.getenv("ECOAGENT_MAX_PAYLOAD_BYTES", str(180 * 1024)))
+
+# EXIF orientation tag and the transpose that undoes each orientation
+_EXIF_ORIENTATION = 0x0112
+_ORIENTATION_TRANSPOSE = {
+    2: (Image.Transpose.FLIP_LEFT_RIGHT,),
+    3: (Image.Transpose.ROTATE_180,),
+    4: (Image.Transpose.FLIP_TOP_BOTTOM,),
+    5: (Image.Transpose.TRANSPOSE,),
+    6: (Image.Transpose.ROTATE_270,),
+    7: (Image.Transpose.TRANSVERSE,),
+    8: (Image.Transpose.ROTATE_90,),
+}
+
+# Image modes supported by Image.reduce()
+_REDUCIBLE_MODES = ("L", "LA", "RGB", "RGBA", "CMYK", "I", "F")
+
+# JPEG modes the VLM accepts as-is
+_PASSTHROUGH_JPEG_MODES = ("RGB", "L")
+
+# Leading magic bytes of common image formats
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+    (b"BM", "BMP"),
+    (b"II*\x00", "TIFF"),
+    (b"MM\x00*", "TIFF"),
+)
+
+
+def sniff_image_format(image_bytes: bytes) -> Optional[str]:
+    """
+    Identify an image format from its leading bytes without decoding it
+    
+    Args:
+        image_bytes: Raw image bytes
+        
+    Returns:
+        Format name as used by Pillow (e.g. "JPEG", "PNG") or None if unknown
+    """
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        return "WEBP"
+    for signature, name in _IMAGE_SIGNATURES:
+        if image_bytes.startswith(signature):
+            return name
+    return None
+
+
+def _decode_downscaled(img: Image.Image, max_size: int) -> Image.Image:
+    """
+    Decode an image at a reduced scale that still covers max_size
+    JPEGs use draft mode so libjpeg decodes straight at 1/2, 1/4 or 1/8
+    scale; other formats are shrunk with reduce() before the final resize
+    
+    Args:
+        img: Lazily opened PIL image
+        max_size: Target maximum dimension
+        
+    Returns:
+        Decoded image whose larger side is at least max_size
+    """
+    if img.format == "JPEG":
+        ratio = max_size / max(img.size)
+        img.draft(None, (max(1, int(img.size[0] * ratio)), max(1, int(img.size[1] * ratio))))
+    
+    factor = max(img.size) // max_size
+    if factor >= 2 and img.mode in _REDUCIBLE_MODES:
+        return img.reduce(factor)
+    
+    img.load()
+    return img
+
+
+def _to_jpeg_mode(img: Image.Image) -> Image.Image:
+    """
+    Convert an image to a mode JPEG can store
+    Transparent areas are flattened onto a white background
+    
+    Args:
+        img: Decoded PIL image
+        
+    Returns:
+        RGB or L image
+    """
+    if img.mode in _PASSTHROUGH_JPEG_MODES:
+        return img
+    
+    if img.mode == "P":
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    
+    if img.mode in ("RGBA", "LA"):
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img.convert("RGBA"), mask=img.getchannel("A"))
+        return background
+    
+    return img.convert("RGB")
+
+
+def _base64_length(num_bytes: int) -> int:
+    """Length of the base64 encoding of num_bytes bytes"""
+    return 4 * ((num_bytes + 2) // 3)
+
+
+def _strip_jpeg_metadata(jpeg_bytes: bytes) -> bytes:
+    """
+    Losslessly drop EXIF, XMP, ICC, IPTC and comment segments from a JPEG
+    APP0 (JFIF) and APP14 (Adobe color transform) are kept since decoders
+    rely on them
+    
+    Args:
+        jpeg_bytes: JPEG file bytes
+        
+    Returns:
+        JPEG bytes without metadata segments (unchanged if parsing fails)
+    """
+    out = [jpeg_bytes[:2]]
+    pos = 2
+    while pos + 4 <= len(jpeg_bytes):
+        if jpeg_bytes[pos] != 0xFF:
+            return jpeg_bytes
+        marker = jpeg_bytes[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker == 0xDA:
+            # Start of scan: the rest is entropy-coded data
+            out.append(jpeg_bytes[pos:])
+            return b"".join(out)
+        
+        length = int.from_bytes(jpeg_bytes[pos + 2:pos + 4], "big")
+        end = pos + 2 + length
+        if length < 2 or end > len(jpeg_bytes):
+            return jpeg_bytes
+        
+        is_metadata = (0xE1 <= marker <= 0xEF and marker != 0xEE) or marker == 0xFE
+        if not is_metadata:
+            out.append(jpeg_bytes[pos:end])
+        pos = end
+    
+    return jpeg_bytes
+
+
+def _save_jpeg(img: Image.Image, quality: int) -> bytes:
+    """Save an image as a metadata-free JPEG"""
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def _shape_jpeg(
+    img: Image.Image,
+    quality: int,
+    max_payload_bytes: int
+) -> Tuple[bytes, Image.Image, int, int]:
     """
-    Encode an image to base64 string
+    Encode an image as JPEG within a base64 byte budget
+    Binary-searches JPEG quality down to MIN_JPEG_QUALITY (or the preferred
+    quality if that is lower), then shrinks the image and searches again until
+    the payload fits
+    
+    Args:
+        img: RGB or L image
+        quality: Preferred (maximum) JPEG quality
+        max_payload_bytes: Maximum base64 payload size (0 for no limit)
+        
+    Returns:
+        (jpeg bytes, final image, quality of those bytes, number of encode attempts)
+    """
+    data = _save_jpeg(img, quality)
+    attempts = 1
+    if not max_payload_bytes or _base64_length(len(data)) <= max_payload_bytes:
+        return data, img, quality, attempts
+    
+    floor = min(quality, MIN_JPEG_QUALITY)
+    high = quality - 1  # quality itself is known not to fit at this size
+    while True:
+        # Smallest payload at this size first; if even that is too big, shrink
+        if high >= floor:
+            data = _save_jpeg(img, floor)
+            attempts += 1
+        
+        if _base64_length(len(data)) <= max_payload_bytes:
+            # Largest quality in [floor, high] that fits
+            best = (data, floor)
+            low = floor + 1
+            while low <= high:
+                mid = (low + high) // 2
+                candidate = _save_jpeg(img, mid)
+                attempts += 1
+                if _base64_length(len(candidate)) <= max_payload_bytes:
+                    best = (candidate, mid)
+                    low = mid + 1
+                else:
+                    high = mid - 1
+            return best[0], img, best[1], attempts
+        
+        if max(img.size) <= MIN_IMAGE_SIZE:
+            # Give up on the budget rather than sending an unusable thumbnail
+            return data, img, floor, attempts
+        
+        # Payload scales roughly with pixel count
+        scale = max(0.5, min(0.9, (max_payload_bytes / _base64_length(len(data))) ** 0.5))
+        new_size = tuple(max(1, int(dim * scale)) for dim in img.size)
+        img = img.resize(new_size, Image.Resampling.LANCZOS)
+        high = quality
+
+
+def _read_image_bytes(image_path_or_bytes) -> bytes:
+    """Read image bytes from a file path, or return bytes unchanged"""
+    if isinstance(image_path_or_bytes, str):
+        # It's a file path
+        with open(image_path_or_bytes, "rb") as img_file:
+            return img_file.read()
+    # It's already bytes (e.g., from Streamlit upload)
+    return image_path_or_bytes
+
+
+def encode_image(
+    image_path_or_bytes,
+    compute_hash: bool = False,
+    fast_decode: bool = True,
+    max_size: int = MAX_IMAGE_SIZE,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    max_payload_bytes: int = DEFAULT_MAX_PAYLOAD_BYTES
+) -> Dict[str, Any]:
+    """
+    Normalize an image for the VLM and base64-encode it
+    
+    JPEGs that already fit within max_size and the payload budget are
+    passed through with only their metadata segments removed; everything
+    else is decoded once, downscaled if needed and transcoded to a
+    metadata-free JPEG whose quality/size is searched to fit the budget.
     
     Args:
         image_path_or_bytes: Either a file path (str) or image bytes
+        compute_hash: Whether to also compute a perceptual hash (dHash)
+        fast_decode: Whether to decode large images at a reduced scale
+            (JPEG draft mode / reduce()) before the final LANCZOS resize
+        max_size: Maximum dimension of the encoded image
+        jpeg_quality: Preferred JPEG quality used when transcoding
+        max_payload_bytes: Maximum base64 payload size (0 for no limit)
         
     Returns:
-        Base64 encoded string of the image
+        Dict containing:
+        - base64: Base64 encoded image
+        - mime_type: MIME type of the encoded image
+        - width / height: Dimensions of the encoded image
+        - source_format: Detected format of the input
+        - transcoded: Whether the image was re-encoded
+        - quality: JPEG quality used (None when passed through)
+        - bytes: Size of the encoded image before base64
+        - payload_bytes: Size of the base64 payload
+        - encode_attempts: Number of JPEG encodes spent fitting the budget
+        - metadata_stripped: Bytes of EXIF/ICC/etc. removed from a passed-through
+          JPEG (None when transcoded, since re-encoding writes no metadata)
+        - dhash: Perceptual hash (int) or None if not requested
     """
     try:
-        if isinstance(image_path_or_bytes, str):
-            # It's a file path
-            with open(image_path_or_bytes, "rb") as img_file:
-                image_bytes = img_file.read()
-        else:
-            # It's already bytes (e.g., from Streamlit upload)
-            image_bytes = image_path_or_bytes
+        image_bytes = _read_image_bytes(image_path_or_bytes)
+        source_format = sniff_image_format(image_bytes)
         
-        # Optionally resize large images to reduce token usage
+        # Opening only parses the header; pixels are decoded on demand
         img = Image.open(BytesIO(image_bytes))
+        source_format = source_format or img.format
+        orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+        
+        passthrough_bytes = None
+        if (
+            source_format == "JPEG"
+            and max(img.size) <= max_size
+            and img.mode in _PASSTHROUGH_JPEG_MODES
+            and orientation not in _ORIENTATION_TRANSPOSE
+        ):
+            passthrough_bytes = _strip_jpeg_metadata(image_bytes)
+            if max_payload_bytes and _base64_length(len(passthrough_bytes)) > max_payload_bytes:
+                passthrough_bytes = None
         
-        # Resize if too large (max dimension 1024px)
-        max_size = 1024
-        if max(img.size) > max_size:
-            ratio = max_size / max(img.size)
-            new_size = tuple(int(dim * ratio) for dim in img.size)
-            img = img.resize(new_size, Image.Resampling.LANCZOS)
+        if passthrough_bytes is not None:
+            metadata_stripped = len(image_bytes) - len(passthrough_bytes)
+            image_bytes = passthrough_bytes
+            size = img.size
+            quality = None
+            attempts = 0
+            image_hash = None
+            if compute_hash:
+                # The hash only needs a thumbnail, so decode at the smallest scale
+                img.draft("L", (64, 64))
+                image_hash = dhash(img)
+        else:
+            # Resize if too large (max dimension 1024px by default)
+            if max(img.size) > max_size:
+                if fast_decode:
+                    img = _decode_downscaled(img, max_size)
+                ratio = max_size / max(img.size)
+                new_size = tuple(max(1, int(dim * ratio)) for dim in img.size)
+                img = img.resize(new_size, Image.Resampling.LANCZOS)
+            
+            # Bake in EXIF orientation since the metadata is not carried over
+            for transpose in _ORIENTATION_TRANSPOSE.get(orientation, ()):
+                img = img.transpose(transpose)
             
-            # Convert back to bytes
-            buffer = BytesIO()
-            img.save(buffer, format=img.format or "JPEG")
-            image_bytes = buffer.getvalue()
+            img = _to_jpeg_mode(img)
+            image_bytes, img, quality, attempts = _shape_jpeg(img, jpeg_quality, max_payload_bytes)
+            metadata_stripped = None
+            size = img.size
+            image_hash = dhash(img) if compute_hash else None
         
-        return base64.b64encode(image_bytes).decode('utf-8')
+        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
+        
+        return {
+            "base64": image_base64,
+            "mime_type": "image/jpeg",
+            "width": size[0],
+            "height": size[1],
+            "source_format": source_format,
+            "transcoded": passthrough_bytes is None,
+            "quality": quality,
+            "bytes": len(image_bytes),
+            "payload_bytes": len(image_base64),
+            "encode_attempts": attempts,
+            "metadata_stripped": metadata_stripped,
+            "dhash": image_hash
+        }
     except Exception as e:
         raise ValueError(f"Failed to encode image: {str(e)}")
 
 
-def call_nemotron_vlm(
-    image_base64: str,
-    prompt: str,
-    model: str = "nvidia/nemotron-vlm-1.5",
-    temperature: float = 0.2,
-    max_tokens: int = 1024
-) -> Dict[str, Any]:
+def encode_image_to_base64(image_path_or_bytes) -> str:
     """
-    Call NVIDIA Nemotron Vision-Language Model
+    Encode an image to base64 string
     
     Args:
-        image_base64: Base64 encoded image
-        prompt: Text prompt for the model
-        model: Model identifier
-        temperature: Sampling temperature
-        max_tokens: Maximum tokens to generate
+        image_path_or_bytes: Either a file path (str) or image bytes
         
     Returns:
-        Dict containing the model response
+        Base64 encoded string of the image
     """
-    api_key = get_nvidia_api_key()
-    
-    url = "https://integrate.api.nvidia.com/v1/chat/completions"
-    
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
+    return encode_image(image_path_or_bytes)["base64"]
+
+
+def _apply_json_schema(payload: Dict[str, Any], json_schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Constrain the completion to a JSON schema with NIM guided decoding"""
+    if json_schema is not None:
+        payload["nvext"] = {"guided_json": json_schema}
+    return payload
+
+
+def _build_vlm_payload(
+    image_base64: str,
+    prompt: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    mime_type: str = "image/jpeg"
+) -> Dict[str, Any]:
+    """Build the chat completions payload for a VLM call"""
+    return {
         "model": model,
         "messages": [
             {
@@ -101,7 +1308,7 @@ def call_nemotron_vlm(
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/jpeg;base64,{image_base64}"
+                            "url": f"data:{mime_type};base64,{image_base64}"
                         }
                     }
                 ]
@@ -110,17 +1317,67 @@ def call_nemotron_vlm(
         "temperature": temperature,
         "max_tokens": max_tokens
     }
+
+
+def _build_llm_payload(
+    prompt: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: Optional[str]
+) -> Dict[str, Any]:
+    """Build the chat completions payload for a text-only LLM call"""
+    messages = []
+    if system_prompt:
+        messages.append({
+            "role": "system",
+            "content": system_prompt
+        })
     
-    try:
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        return {
-            "error": True,
-            "message": f"VLM API call failed: {str(e)}",
-            "status_code": getattr(e.response, 'status_code', None)
-        }
+    messages.append({
+        "role": "user",
+        "content": prompt
+    })
+    
+    return {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens
+    }
+
+
+def call_nemotron_vlm(
+    image_base64: str,
+    prompt: str,
+    model: str = "nvidia/nemotron-vlm-1.5",
+    temperature: float = 0.2,
+    max_tokens: int = 1024,
+    session: Optional[requests.Session] = None,
+    mime_type: str = "image/jpeg",
+    deadline: Optional[float] = None,
+    json_schema: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Call NVIDIA Nemotron Vision-Language Model
+    
+    Args:
+        image_base64: Base64 encoded image
+        prompt: Text prompt for the model
+        model: Model identifier
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        session: Optional HTTP session (defaults to the shared session)
+        mime_type: MIME type of the encoded image
+        deadline: Total seconds allowed across retries (defaults to the retry policy's)
+        json_schema: JSON schema the output must follow (guided decoding), or None
+        
+    Returns:
+        Dict containing the model response
+    """
+    payload = _build_vlm_payload(image_base64, prompt, model, temperature, max_tokens, mime_type)
+    _apply_json_schema(payload, json_schema)
+    return _post_chat_completion(payload, "VLM", session=session, deadline=deadline)
 
 
 def call_nemotron_llm(
@@ -128,10 +1385,16 @@ def call_nemotron_llm(
     model: str = "nvidia/llama-3_3-nemotron-super-49b-v1_5",
     temperature: float = 0.7,
     max_tokens: int = 2048,
-    system_prompt: Optional[str] = None
+    system_prompt: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    deadline: Optional[float] = None,
+    use_cache: bool = True,
+    json_schema: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Call NVIDIA Nemotron Language Model
+    Calls at or below LLM_CACHE_MAX_TEMPERATURE are served from the response
+    cache when one is configured (see get_llm_response_cache)
     
     Args:
         prompt: Text prompt for the model
@@ -139,48 +1402,388 @@ def call_nemotron_llm(
         temperature: Sampling temperature
         max_tokens: Maximum tokens to generate
         system_prompt: Optional system prompt
+        session: Optional HTTP session (defaults to the shared session)
+        deadline: Total seconds allowed across retries (defaults to the retry policy's)
+        use_cache: Whether the response cache may be used (False always calls the API)
+        json_schema: JSON schema the output must follow (guided decoding), or None
         
     Returns:
-        Dict containing the model response
+        Dict containing the model response; cached responses have
+        "attempts" 0 and a "cache" entry with the hit flag and tier
+    """
+    payload = _build_llm_payload(prompt, model, temperature, max_tokens, system_prompt)
+    _apply_json_schema(payload, json_schema)
+    cached, cache_key = _llm_cache_lookup(payload, use_cache)
+    if cached is not None:
+        return cached
+    return _llm_cache_store(cache_key, _post_chat_completion(payload, "LLM", session=session, deadline=deadline))
+
+
+def _iter_sse_data(response: requests.Response) -> Iterator[str]:
+    """Yield the data field of each server-sent event until [DONE]"""
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        yield data
+
+
+def stream_nemotron_llm(
+    prompt: str,
+    model: str = "nvidia/llama-3_3-nemotron-super-49b-v1_5",
+    temperature: float = 0.7,
+    max_tokens: int = 2048,
+    system_prompt: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    deadline: Optional[float] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Call NVIDIA Nemotron Language Model with a streamed (SSE) response
+    Opening the stream goes through the same circuit breaker, rate limit and
+    retries as call_nemotron_llm; once tokens flow, failures are not retried
+    
+    Args:
+        prompt: Text prompt for the model
+        model: Model identifier
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        system_prompt: Optional system prompt
+        session: Optional HTTP session (defaults to the shared session)
+        deadline: Total seconds for the whole call, streaming included
+            (defaults to the retry policy's)
+        
+    Yields:
+        Event dicts:
+        - {"type": "delta", "text": ...} for each piece of generated text
+        - {"type": "done", "attempts": ..., "finish_reason": ...} at the end
+        - {"type": "error", "message": ..., "status_code": ..., "attempts": ...}
+          instead of "done" if the call fails ("partial" is True when some
+          text was already delivered)
     """
-    api_key = get_nvidia_api_key()
+    payload = _build_llm_payload(prompt, model, temperature, max_tokens, system_prompt)
+    payload["stream"] = True
     
-    url = "https://integrate.api.nvidia.com/v1/chat/completions"
+    breaker = get_circuit_breaker(model)
+    if not breaker.allow_request():
+        yield dict(_circuit_open("LLM", model), type="error")
+        return
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
+    start = time.monotonic()
+    if deadline is None:
+        deadline = get_retry_policy().deadline
+    opened = None
+    final = None
+    attempts = 0
+    finish_reason = None
+    delivered = False
+    try:
+        opened = _send_with_retries(payload, "LLM", session=session, deadline=deadline, stream=True)
+        if opened.get("error"):
+            final = dict(opened, type="error")
+        else:
+            attempts = opened["attempts"]
+            for data in _iter_sse_data(opened["stream"]):
+                if deadline is not None and time.monotonic() - start > deadline:
+                    raise requests.exceptions.Timeout(f"stream exceeded its {deadline:.1f}s deadline")
+                
+                choices = json.loads(data).get("choices") or [{}]
+                finish_reason = choices[0].get("finish_reason") or finish_reason
+                text = (choices[0].get("delta") or {}).get("content")
+                if text:
+                    delivered = True
+                    yield {"type": "delta", "text": text}
+    except (requests.exceptions.RequestException, ValueError) as e:
+        final = {
+            "type": "error",
+            "error": True,
+            "message": f"LLM stream interrupted: {str(e)}",
+            "status_code": None,
+            "attempts": attempts,
+            "partial": delivered
+        }
+    finally:
+        if opened is not None and "stream" in opened:
+            opened["stream"].close()
+        # A consumer that stops reading early leaves final unset: the stream
+        # was healthy, so that counts as a success
+        _settle_breaker(breaker, final if final is not None else opened)
     
-    messages = []
-    if system_prompt:
-        messages.append({
-            "role": "system",
-            "content": system_prompt
-        })
+    yield final or {"type": "done", "attempts": attempts, "finish_reason": finish_reason}
+
+
+def create_async_http_client(
+    max_connections: int = DEFAULT_POOL_MAXSIZE,
+    max_keepalive_connections: Optional[int] = None
+) -> httpx.AsyncClient:
+    """
+    Create an async HTTP client with a bounded keep-alive connection pool
     
-    messages.append({
-        "role": "user",
-        "content": prompt
-    })
+    Args:
+        max_connections: Maximum concurrent connections
+        max_keepalive_connections: Idle connections to keep open
+            (defaults to max_connections)
+        
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections or max_connections
+    )
+    return httpx.AsyncClient(limits=limits)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the async HTTP client for the running event loop
+    Async clients are bound to the loop they were created on, so one
+    client is kept per loop unless an override was installed
     
-    payload = {
-        "model": model,
-        "messages": messages,
-        "temperature": temperature,
-        "max_tokens": max_tokens
-    }
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    if _async_client_override is not None:
+        return _async_client_override
+    
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = create_async_http_client()
+        _async_clients[loop] = client
+    return client
+
+
+def set_async_http_client(client: Optional[httpx.AsyncClient]) -> None:
+    """
+    Override the async HTTP client used by all loops (e.g. with a mock in tests)
+    
+    Args:
+        client: Client to use, or None to go back to per-loop default clients
+    """
+    global _async_client_override
+    _async_client_override = client
+
+
+async def close_async_http_client() -> None:
+    """Close the default async HTTP client of the running event loop"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _send_with_retries_async(
+    payload: Dict[str, Any],
+    error_label: str,
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: float = 60,
+    retry_policy: Optional[RetryPolicy] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Async counterpart of _send_with_retries
+    
+    Args:
+        payload: Request body
+        error_label: Prefix for error messages (e.g. "VLM", "LLM")
+        client: Async client to use (defaults to the loop's shared client)
+        timeout: Per-attempt request timeout in seconds
+        retry_policy: Retry policy (defaults to the process-wide policy)
+        deadline: Total seconds for all attempts (defaults to the policy's deadline)
+        
+    Returns:
+        Parsed JSON response or an error dict, both with an "attempts" count
+    """
+    headers = _auth_headers()
+    http = client or get_async_http_client()
+    policy = retry_policy or get_retry_policy()
+    deadline = deadline if deadline is not None else policy.deadline
+    limiter = get_rate_limiter()
+    tokens = estimate_request_tokens(payload) if limiter is not None else 0
+    start = time.monotonic()
+    attempt = 0
+    
+    while True:
+        remaining = None if deadline is None else deadline - (time.monotonic() - start)
+        if remaining is not None and remaining <= 0:
+            return _deadline_exceeded(error_label, attempt)
+        
+        if limiter is not None:
+            wait = limiter.reserve(payload.get("model", ""), tokens, max_wait=remaining)
+            if remaining is not None and wait >= remaining:
+                return _deadline_exceeded(error_label, attempt)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            remaining = None if deadline is None else deadline - (time.monotonic() - start)
+        
+        attempt += 1
+        attempt_timeout = timeout if remaining is None else min(timeout, remaining)
+        status_code = None
+        retry_after = None
+        
+        try:
+            response = await http.post(NVIDIA_API_URL, headers=headers, json=payload, timeout=attempt_timeout)
+            response.raise_for_status()
+            result = response.json()
+            result["attempts"] = attempt
+            return result
+        except httpx.HTTPStatusError as e:
+            error = e
+            status_code = e.response.status_code
+            retry_after = _parse_retry_after(e.response.headers.get("Retry-After"))
+        except httpx.TransportError as e:
+            error = e
+        except (httpx.HTTPError, ValueError) as e:
+            return _call_failed(error_label, e, None, attempt)
+        
+        remaining = None if deadline is None else deadline - (time.monotonic() - start)
+        delay = policy.next_delay(attempt, status_code, retry_after, remaining)
+        if delay is None:
+            return _call_failed(error_label, error, status_code, attempt)
+        await asyncio.sleep(delay)
+
+
+async def _send_through_breaker_async(
+    payload: Dict[str, Any],
+    error_label: str,
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: float = 60,
+    retry_policy: Optional[RetryPolicy] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Async counterpart of _send_through_breaker
     
+    Args:
+        payload: Request body
+        error_label: Prefix for error messages (e.g. "VLM", "LLM")
+        client: Async client to use (defaults to the loop's shared client)
+        timeout: Per-attempt request timeout in seconds
+        retry_policy: Retry policy (defaults to the process-wide policy)
+        deadline: Total seconds for all attempts (defaults to the policy's deadline)
+        
+    Returns:
+        Parsed JSON response or an error dict
+    """
+    model = payload.get("model", "")
+    breaker = get_circuit_breaker(model)
+    if not breaker.allow_request():
+        return _circuit_open(error_label, model)
+    
+    result = None
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        return {
-            "error": True,
-            "message": f"LLM API call failed: {str(e)}",
-            "status_code": getattr(e.response, 'status_code', None)
-        }
+        result = await _send_with_retries_async(payload, error_label, client, timeout, retry_policy, deadline)
+        return result
+    finally:
+        _settle_breaker(breaker, result)
+
+
+async def _post_chat_completion_async(
+    payload: Dict[str, Any],
+    error_label: str,
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: float = 60,
+    retry_policy: Optional[RetryPolicy] = None,
+    deadline: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Async counterpart of _post_chat_completion
+    
+    Args:
+        payload: Request body
+        error_label: Prefix for error messages (e.g. "VLM", "LLM")
+        client: Async client to use (defaults to the loop's shared client)
+        timeout: Per-attempt request timeout in seconds
+        retry_policy: Retry policy (defaults to the process-wide policy)
+        deadline: Total seconds for all attempts (defaults to the policy's deadline)
+        
+    Returns:
+        Parsed JSON response or an error dict
+    """
+    flight = get_single_flight()
+    if flight is None:
+        return await _send_through_breaker_async(payload, error_label, client, timeout, retry_policy, deadline)
+    if deadline is None:
+        deadline = (retry_policy or get_retry_policy()).deadline
+    try:
+        return await flight.do_async(
+            request_key(payload),
+            lambda: _send_through_breaker_async(payload, error_label, client, timeout, retry_policy, deadline),
+            timeout=deadline
+        )
+    except TimeoutError:
+        return _deadline_exceeded(error_label, 0)
+
+
+async def call_nemotron_vlm_async(
+    image_base64: str,
+    prompt: str,
+    model: str = "nvidia/nemotron-vlm-1.5",
+    temperature: float = 0.2,
+    max_tokens: int = 1024,
+    client: Optional[httpx.AsyncClient] = None,
+    mime_type: str = "image/jpeg",
+    deadline: Optional[float] = None,
+    json_schema: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Async version of call_nemotron_vlm
+    
+    Args:
+        image_base64: Base64 encoded image
+        prompt: Text prompt for the model
+        model: Model identifier
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        client: Optional async HTTP client (defaults to the loop's shared client)
+        mime_type: MIME type of the encoded image
+        deadline: Total seconds allowed across retries (defaults to the retry policy's)
+        json_schema: JSON schema the output must follow (guided decoding), or None
+        
+    Returns:
+        Dict containing the model response
+    """
+    payload = _build_vlm_payload(image_base64, prompt, model, temperature, max_tokens, mime_type)
+    _apply_json_schema(payload, json_schema)
+    return await _post_chat_completion_async(payload, "VLM", client=client, deadline=deadline)
+
+
+async def call_nemotron_llm_async(
+    prompt: str,
+    model: str = "nvidia/llama-3_3-nemotron-super-49b-v1_5",
+    temperature: float = 0.7,
+    max_tokens: int = 2048,
+    system_prompt: Optional[str] = None,
+    client: Optional[httpx.AsyncClient] = None,
+    deadline: Optional[float] = None,
+    use_cache: bool = True,
+    json_schema: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Async version of call_nemotron_llm
+    
+    Args:
+        prompt: Text prompt for the model
+        model: Model identifier
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate
+        system_prompt: Optional system prompt
+        client: Optional async HTTP client (defaults to the loop's shared client)
+        deadline: Total seconds allowed across retries (defaults to the retry policy's)
+        use_cache: Whether the response cache may be used (False always calls the API)
+        json_schema: JSON schema the output must follow (guided decoding), or None
+        
+    Returns:
+        Dict containing the model response
+    """
+    payload = _build_llm_payload(prompt, model, temperature, max_tokens, system_prompt)
+    _apply_json_schema(payload, json_schema)
+    cached, cache_key = _llm_cache_lookup(payload, use_cache)
+    if cached is not None:
+        return cached
+    response = await _post_chat_completion_async(payload, "LLM", client=client, deadline=deadline)
+    return _llm_cache_store(cache_key, response)
 
 
 def extract_text_from_response(response: Dict[str, Any]) -> str:
@@ -205,7 +1808,8 @@ def extract_text_from_response(response: Dict[str, Any]) -> str:
 def parse_json_from_text(text: str) -> Optional[Dict[str, Any]]:
     """
     Attempt to extract and parse JSON from text response
-    Handles cases where model outputs markdown code blocks
+    Handles markdown code blocks, surrounding prose, nested objects and
+    common model mistakes (trailing commas, single quotes)
     
     Args:
         text: Text that may contain JSON
@@ -215,29 +1819,11 @@ def parse_json_from_text(text: str) -> Optional[Dict[str, Any]]:
     """
     try:
         # Try direct JSON parse first
-        return json.loads(text)
+        parsed = json.loads(text)
+        if isinstance(parsed, dict):
+            return parsed
     except json.JSONDecodeError:
         pass
     
-    # Try to extract JSON from markdown code blocks
-    import re
-    json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-    matches = re.findall(json_pattern, text, re.DOTALL)
-    
-    if matches:
-        try:
-            return json.loads(matches[0])
-        except json.JSONDecodeError:
-            pass
-    
-    # Try to find any JSON-like structure
-    json_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-    matches = re.findall(json_pattern, text, re.DOTALL)
-    
-    for match in matches:
-        try:
-            return json.loads(match)
-        except json.JSONDecodeError:
-            continue
-    
-    return None
+    # Otherwise scan for the first balanced object in one pass
+    return extract_json_object(text)
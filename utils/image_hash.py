@@ -0,0 +1,171 @@
+"""
+Perceptual Image Hashing
+dHash fingerprints and a BK-tree index for spotting near-duplicate photos
+"""
+
+import copy
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+from PIL import Image
+
+
+def dhash(img: Image.Image, hash_size: int = 8) -> int:
+    """
+    Compute the difference hash (dHash) of an image
+    Robust to scaling, recompression and small shifts in framing
+
+    Args:
+        img: Decoded PIL image
+        hash_size: Hash side length (hash has hash_size**2 bits)
+
+    Returns:
+        Hash as an integer
+    """
+    small = img.convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BILINEAR)
+    pixels = list(small.getdata())
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return bin(a ^ b).count("1")
+
+
+class _BKNode:
+    """BK-tree node holding every entry that shares one hash value"""
+
+    __slots__ = ("hash", "entries", "children")
+
+    def __init__(self, hash_value: int):
+        self.hash = hash_value
+        self.entries: List[Tuple[float, Any]] = []
+        self.children: Dict[int, "_BKNode"] = {}
+
+
+class NearDuplicateIndex:
+    """
+    Index of recently seen image hashes with their analysis results
+    Lookups return the closest entry within max_distance bits that was
+    added less than window seconds ago
+    """
+
+    def __init__(self, max_distance: int = 6, window: float = 600.0, max_entries: int = 10000):
+        """
+        Initialize the index
+
+        Args:
+            max_distance: Maximum Hamming distance counted as a near-duplicate
+            window: Seconds an entry stays eligible for reuse
+            max_entries: Entry count that triggers pruning of expired entries
+        """
+        self.max_distance = max_distance
+        self.window = window
+        self.max_entries = max_entries
+        self._root: Optional[_BKNode] = None
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def add(self, hash_value: int, value: Any) -> None:
+        """
+        Remember a result for an image hash
+
+        Args:
+            hash_value: Perceptual hash of the image
+            value: Result to reuse for near-duplicates (copied)
+        """
+        entry = (time.time(), copy.deepcopy(value))
+        with self._lock:
+            if self._size >= self.max_entries:
+                self._prune()
+            self._insert(hash_value, entry)
+
+    def find(self, hash_value: int) -> Optional[Dict[str, Any]]:
+        """
+        Find the closest recent near-duplicate of an image hash
+
+        Args:
+            hash_value: Perceptual hash of the image
+
+        Returns:
+            Dict with "value" (a copy), "distance" and "age_seconds", or None
+        """
+        now = time.time()
+        best = None
+
+        with self._lock:
+            if self._root is None:
+                return None
+
+            stack = [self._root]
+            while stack:
+                node = stack.pop()
+                distance = hamming_distance(hash_value, node.hash)
+
+                if distance <= self.max_distance:
+                    for added, value in node.entries:
+                        age = now - added
+                        if age > self.window:
+                            continue
+                        if best is None or (distance, age) < (best[0], best[1]):
+                            best = (distance, age, value)
+
+                # Triangle inequality: only subtrees within range can match
+                low, high = distance - self.max_distance, distance + self.max_distance
+                stack.extend(child for d, child in node.children.items() if low <= d <= high)
+
+        if best is None:
+            return None
+
+        distance, age, value = best
+        return {"value": copy.deepcopy(value), "distance": distance, "age_seconds": age}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _insert(self, hash_value: int, entry: Tuple[float, Any]) -> None:
+        """Insert an entry into the tree (caller holds the lock)"""
+        self._size += 1
+        if self._root is None:
+            self._root = _BKNode(hash_value)
+            self._root.entries.append(entry)
+            return
+
+        node = self._root
+        while True:
+            distance = hamming_distance(hash_value, node.hash)
+            if distance == 0:
+                node.entries.append(entry)
+                return
+            child = node.children.get(distance)
+            if child is None:
+                child = _BKNode(hash_value)
+                child.entries.append(entry)
+                node.children[distance] = child
+                return
+            node = child
+
+    def _prune(self) -> None:
+        """Rebuild the tree from unexpired entries, keeping the newest (caller holds the lock)"""
+        cutoff = time.time() - self.window
+        live = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            live.extend((entry, node.hash) for entry in node.entries if entry[0] >= cutoff)
+            stack.extend(node.children.values())
+
+        live.sort(key=lambda item: item[0][0])
+        if len(live) >= self.max_entries:
+            live = live[-max(1, self.max_entries // 2):]
+
+        self._root = None
+        self._size = 0
+        for entry, hash_value in live:
+            self._insert(hash_value, entry)
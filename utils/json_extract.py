@@ -0,0 +1,205 @@
+"""
+JSON Extraction
+Single-pass scanner that pulls the first JSON object out of model output
+"""
+
+import json
+import re
+from typing import Dict, Any, Optional
+
+
+# Characters that matter outside strings, and the ones that end each kind of string
+_STRUCTURE = re.compile(r"[{}\"']")
+_TOKEN_START = "{[,:"
+_WHITESPACE = " \t\r\n"
+_STRING_END = {
+    '"': re.compile(r'[\\"]'),
+    "'": re.compile(r"[\\']")
+}
+
+
+def _repair(candidate: str) -> str:
+    """
+    Rewrite common model mistakes into valid JSON
+    Single-quoted strings become double-quoted and trailing commas before
+    a closing brace or bracket are dropped
+
+    Args:
+        candidate: Balanced object text that json.loads rejected
+
+    Returns:
+        Repaired text (may still be invalid)
+    """
+    out = []
+    quote = None
+    i = 0
+    length = len(candidate)
+
+    while i < length:
+        ch = candidate[i]
+
+        if quote is not None:
+            if ch == "\\" and i + 1 < length:
+                escaped = candidate[i + 1]
+                # \' is not a JSON escape; inside a string it is just a quote
+                out.append("'" if escaped == "'" else ch + escaped)
+                i += 2
+                continue
+            if ch == quote:
+                out.append('"')
+                quote = None
+            elif ch == '"':
+                out.append('\\"')
+            else:
+                out.append(ch)
+            i += 1
+            continue
+
+        if ch in "\"'":
+            quote = ch
+            out.append('"')
+        elif ch in "}]":
+            # Drop a trailing comma, keeping any whitespace after it
+            j = len(out) - 1
+            while j >= 0 and out[j].isspace():
+                j -= 1
+            if j >= 0 and out[j] == ",":
+                del out[j]
+            out.append(ch)
+        else:
+            out.append(ch)
+        i += 1
+
+    return "".join(out)
+
+
+def _load_object(candidate: str) -> Optional[Dict[str, Any]]:
+    """Parse a balanced candidate, repairing it if needed"""
+    # Braces in prose ("{note}") cannot be an object; skip them cheaply
+    body = candidate[1:].lstrip()
+    if not body or body[0] not in "\"'}":
+        return None
+
+    for text in (candidate, None):
+        if text is None:
+            text = _repair(candidate)
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(value, dict):
+            return value
+    return None
+
+
+def _opens_string(buffer: str, index: int) -> bool:
+    """Whether the quote at index follows a structural character (ignoring whitespace)"""
+    index -= 1
+    while index >= 0 and buffer[index] in _WHITESPACE:
+        index -= 1
+    return index >= 0 and buffer[index] in _TOKEN_START
+
+
+class JSONObjectScanner:
+    """
+    Incremental scanner for the first balanced JSON object in a text stream
+    Text is scanned once: braces are counted outside strings, string
+    contents (double or single quoted, with escapes) are skipped, and each
+    balanced candidate is parsed when its closing brace arrives. Candidates
+    that do not parse are skipped and scanning resumes after them. A quote
+    only opens a string where a JSON value or key can start, so apostrophes
+    in braced prose ("{it's fine}") do not swallow the rest of the text.
+    """
+
+    def __init__(self):
+        """Initialize an empty scanner"""
+        self.result: Optional[Dict[str, Any]] = None
+        self._buffer = ""
+        self._pos = 0
+        self._start = 0
+        self._depth = 0
+        self._quote: Optional[str] = None
+
+    def feed(self, chunk: str) -> Optional[Dict[str, Any]]:
+        """
+        Scan the next piece of text
+
+        Args:
+            chunk: Text that follows everything fed so far
+
+        Returns:
+            The first JSON object once it is complete, otherwise None
+        """
+        if self.result is not None:
+            return self.result
+
+        self._buffer += chunk
+        buffer = self._buffer
+        pos = self._pos
+
+        while True:
+            if self._depth == 0:
+                start = buffer.find("{", pos)
+                if start < 0:
+                    # Nothing pending: keep no text
+                    self._buffer, self._pos = "", 0
+                    return None
+                self._start, self._depth, pos = start, 1, start + 1
+                continue
+
+            if self._quote is not None:
+                match = _STRING_END[self._quote].search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # Escape split across chunks; rescan it next time
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._quote = None
+                pos = match.end()
+                continue
+
+            match = _STRUCTURE.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            ch = match.group()
+            pos = match.end()
+
+            if ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    value = _load_object(buffer[self._start:pos])
+                    if value is not None:
+                        self.result = value
+                        self._buffer = ""
+                        return value
+                    buffer = buffer[pos:]
+                    pos = 0
+            elif _opens_string(buffer, match.start()):
+                self._quote = ch
+
+        # Keep only the pending candidate
+        buffer, pos = buffer[self._start:], pos - self._start
+        self._start = 0
+        self._buffer, self._pos = buffer, pos
+        return None
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the first JSON object in text (see JSONObjectScanner)
+
+    Args:
+        text: Model output that may contain JSON
+
+    Returns:
+        Parsed object or None if there is none
+    """
+    return JSONObjectScanner().feed(text)
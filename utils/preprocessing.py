@@ -0,0 +1,60 @@
+"""
+Image Preprocessing Pool
+Runs CPU-bound image normalization in worker processes so it scales
+across cores instead of serializing on the GIL
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Any, Optional
+
+from .helpers import encode_image
+
+
+class ImagePreprocessor:
+    """
+    Process pool wrapper around encode_image
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, **encode_options):
+        """
+        Initialize the pool
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            **encode_options: Extra keyword arguments for encode_image
+                (e.g. max_payload_bytes, jpeg_quality)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.encode_options = encode_options
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def submit(self, image_path_or_bytes, compute_hash: bool = False) -> Future:
+        """
+        Schedule an image for encoding
+
+        Args:
+            image_path_or_bytes: Path to image file or image bytes (paths are
+                cheaper, since only the path is sent to the worker)
+            compute_hash: Whether to also compute a perceptual hash
+
+        Returns:
+            Future resolving to the encode_image result dict
+        """
+        return self._executor.submit(
+            encode_image, image_path_or_bytes, compute_hash=compute_hash, **self.encode_options
+        )
+
+    def encode(self, image_path_or_bytes, compute_hash: bool = False) -> Dict[str, Any]:
+        """Encode an image in a worker process and wait for the result"""
+        return self.submit(image_path_or_bytes, compute_hash=compute_hash).result()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes"""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "ImagePreprocessor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
@@ -0,0 +1,157 @@
+"""
+Request Coalescing
+Single-flight execution so concurrent identical model calls share one request
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import threading
+import weakref
+from typing import Dict, Any, Awaitable, Callable, Optional
+
+
+def request_key(payload: Dict[str, Any]) -> str:
+    """
+    Hash a request payload for coalescing
+
+    Args:
+        payload: Chat completions request body (model, messages, temperature, ...)
+
+    Returns:
+        Hex digest identifying the payload
+    """
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class _Call:
+    """One in-flight synchronous call and its outcome"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key
+    The first caller (the leader) runs the call; callers arriving while it is
+    in flight wait for it and receive a copy of its result. Nothing is kept
+    once the call finishes, so this is not a cache.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight"""
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key: str, func: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run func unless an identical call is already in flight
+
+        Args:
+            key: Call identity (see request_key)
+            func: Call to run if this caller is the leader
+            timeout: Longest a follower waits for the leader (None waits as
+                long as the leader takes)
+
+        Returns:
+            The call's result (followers get a copy)
+
+        Raises:
+            TimeoutError: If this caller is a follower and the leader outlasts timeout
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats["calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"coalesced call still running after {timeout:.1f}s")
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # Copy before releasing the followers, in case the leader mutates its result
+            call.result = copy.deepcopy(call.result)
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Async version of do; calls are coalesced per event loop
+        The shared call runs as a task, so a cancelled or timed-out caller
+        does not cancel it for the others
+
+        Args:
+            key: Call identity (see request_key)
+            func: Coroutine function to run if this caller is the leader
+            timeout: Longest a follower waits for the leader (None waits as
+                long as the leader takes)
+
+        Returns:
+            The call's result (every caller gets its own copy)
+
+        Raises:
+            TimeoutError: If this caller is a follower and the leader outlasts timeout
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._async_calls.setdefault(loop, {})
+            task = calls.get(key)
+            leader = task is None
+            if leader:
+                task = calls[key] = asyncio.ensure_future(func())
+                task.add_done_callback(lambda _: calls.pop(key, None))
+                self._stats["calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if leader or timeout is None:
+            result = await asyncio.shield(task)
+        else:
+            try:
+                result = await asyncio.wait_for(asyncio.shield(task), timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutError(f"coalesced call still running after {timeout:.1f}s") from None
+        return copy.deepcopy(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Dict with calls made, calls coalesced into another, and the share coalesced
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        requested = stats["calls"] + stats["coalesced"]
+        stats["coalesced_rate"] = stats["coalesced"] / requested if requested else 0.0
+        return stats